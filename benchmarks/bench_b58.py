@@ -0,0 +1,53 @@
+"""Compares the base58 implementation of `pyost.b58` with the ``base58`` package.
+Only `pyost.b58` is timed if ``base58`` is not installed.
+
+Usage:
+    python benchmarks/bench_b58.py
+"""
+import os
+import timeit
+
+try:
+    import base58
+except ImportError:
+    base58 = None
+
+from pyost import b58
+
+
+def bench(name: str, stmt, number: int) -> float:
+    best = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+    print(f'{name:<40} {best * 1e6:10.2f} us')
+    return best
+
+
+def main():
+    if base58 is None:
+        print('base58 is not installed, skipping the comparison.')
+    for size in (32, 33, 64):
+        data = os.urandom(size)
+        encoded = b58._encode(data)
+        assert b58._decode(encoded) == data
+        if base58 is not None:
+            assert base58.b58encode(data) == encoded
+            old = bench(f'base58 encode {size} bytes', lambda: base58.b58encode(data), 20000)
+        new = bench(f'b58 encode {size} bytes (uncached)', lambda: b58._encode(data), 20000)
+        cached = bench(f'b58 encode {size} bytes (cached)', lambda: b58.b58encode(data), 20000)
+        if base58 is not None:
+            print(f'{"speedup uncached / cached":<40} {old / new:10.1f} x {old / cached:6.1f} x')
+            old = bench(f'base58 decode {size} bytes', lambda: base58.b58decode(encoded), 20000)
+        new = bench(f'b58 decode {size} bytes (uncached)', lambda: b58._decode(encoded), 20000)
+        if base58 is not None:
+            print(f'{"speedup":<40} {old / new:10.1f} x')
+
+    hashes = [os.urandom(32) for _ in range(10000)]
+    if base58 is not None:
+        old = bench('base58 encode 10000 hashes', lambda: [base58.b58encode(h) for h in hashes], 3)
+    b58.cache_clear()
+    new = bench('b58 encode_many 10000 hashes', lambda: b58.b58encode_many(hashes), 3)
+    if base58 is not None:
+        print(f'{"speedup":<40} {old / new:10.1f} x')
+
+
+if __name__ == '__main__':
+    main()
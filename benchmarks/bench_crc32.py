@@ -0,0 +1,42 @@
+"""Compares the CRC32 implementation of `pyost.crc32` with the previous one.
+
+Usage:
+    python benchmarks/bench_crc32.py
+"""
+import os
+import timeit
+
+from pyost.crc32 import KOOPMAN, make_table, checksum, parity, parity_many
+
+
+def legacy_parity(data: bytes, little_endian=True) -> bytes:
+    """The previous `parity`, that created the table on every call and used `checksum`."""
+    crc32q = make_table(KOOPMAN)
+    crc = checksum(data, crc32q)
+    return crc.to_bytes(4, 'little' if little_endian else 'big')
+
+
+def bench(name: str, stmt, number: int) -> float:
+    best = min(timeit.repeat(stmt, number=number, repeat=5)) / number
+    print(f'{name:<40} {best * 1e6:10.2f} us')
+    return best
+
+
+def main():
+    for size in (33, 1024, 65536):
+        data = os.urandom(size)
+        assert legacy_parity(data) == parity(data)
+        number = max(1, 200000 // (size + 2048))
+        old = bench(f'legacy parity {size} bytes', lambda: legacy_parity(data), number)
+        new = bench(f'parity {size} bytes', lambda: parity(data), number)
+        print(f'{"speedup":<40} {old / new:10.1f} x')
+
+    keys = [os.urandom(33) for _ in range(10000)]
+    assert parity_many(keys[:100]) == [legacy_parity(k) for k in keys[:100]]
+    loop = bench('parity x 10000 keys of 33 bytes', lambda: [parity(k) for k in keys], 3)
+    batch = bench('parity_many 10000 keys of 33 bytes', lambda: parity_many(keys), 3)
+    print(f'{"speedup":<40} {loop / batch:10.1f} x')
+
+
+if __name__ == '__main__':
+    main()
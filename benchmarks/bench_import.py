@@ -0,0 +1,69 @@
+"""Measures the import time of the pyost modules with ``python -X importtime``.
+
+Each module is imported in a new interpreter and the best cumulative time of several runs is kept.
+The modules that sign transactions offline should not import gRPC, the generated protobuf modules
+nor the crypto backends.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --max-ms 60 pyost.transaction
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Tuple, List
+
+MODULES = ('pyost', 'pyost.b58', 'pyost.signature', 'pyost.transaction', 'pyost.account',
+           'pyost.factory', 'pyost.iost', 'pyost.rpc.pb.rpc_pb2', 'grpc')
+HEAVY_MODULES = ('grpc', 'pyost.rpc.pb.rpc_pb2', 'ecdsa', 'ed25519')
+
+
+def import_time(module: str) -> Tuple[float, List[str]]:
+    """Imports a module in a new interpreter.
+
+    Returns:
+        The cumulative import time in milliseconds, and the heavy modules that were imported.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            stderr=subprocess.PIPE, env=env, check=True)
+    total = 0.0
+    heavy = []
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name == module:
+            total = int(cumulative) / 1000
+        if name in HEAVY_MODULES:
+            heavy.append(name)
+    return total, heavy
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=MODULES, help='the modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repetitions, the best one is kept')
+    parser.add_argument('--max-ms', type=float, help='fail if a module takes longer to import')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        runs = [import_time(module) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        heavy = runs[0][1]
+        line = f'{module:<24} {best:8.1f} ms'
+        if heavy:
+            line += f'  imports {", ".join(heavy)}'
+        if args.max_ms is not None and best > args.max_ms:
+            line += '  TOO SLOW'
+            failed = True
+        print(line, flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
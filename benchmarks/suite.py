@@ -0,0 +1,280 @@
+"""Benchmarks of the client hot paths, with a baseline file to detect regressions.
+
+Baselines are only comparable on the same machine and Python version:
+save one before a change, then compare the results of the change with it.
+
+Usage:
+    python benchmarks/suite.py
+    python benchmarks/suite.py -k sign
+    python benchmarks/suite.py --save benchmarks/baseline.json
+    python benchmarks/suite.py --compare benchmarks/baseline.json --threshold 1.25
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable, Dict
+
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.signature import KeyPair, Signature
+from pyost.algorithm import Ed25519, Secp256k1
+from pyost.account import Account, AccountInfo
+from pyost.blockchain import Block
+from pyost.transaction import Transaction, Action
+from pyost.crc32 import parity
+from pyost.b58 import b58encode, b58decode, _encode, _decode
+from pyost.testing import FakeNode
+from pyost.offline import encode_tx_request
+from pyost.export import BlockColumns
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {}
+_cleanups = []
+_fake = {}
+
+
+def benchmark(name: str):
+    """Registers a function that prepares a benchmark and returns the callable to time."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def make_tx(actions: int = 1) -> Transaction:
+    tx = Transaction(time=1, actions=[Action('token.iost', 'transfer', 'iost', 'admin', f'user{i}', '1.5', 'memo')
+                                      for i in range(actions)])
+    tx.add_amount_limit('iost', '1000')
+    return tx
+
+
+def make_block(tx_count: int) -> pb.Block:
+    tx = pb.Transaction(hash='3VkWkdWf9ixSVNqqh9Cod22GXkaPQjhCzKD69Xx3nzDX', time=1, expiration=2, gas_ratio=1.0,
+                        gas_limit=10000.0, chain_id=1024, publisher='admin',
+                        actions=[pb.Action(contract='token.iost', action_name='transfer',
+                                           data='["iost", "admin", "bob", "1.5", ""]')],
+                        amount_limit=[pb.AmountLimit(token='*', value='unlimited')],
+                        tx_receipt=pb.TxReceipt(tx_hash='3VkWkdWf9ixSVNqqh9Cod22GXkaPQjhCzKD69Xx3nzDX',
+                                                gas_usage=1000.0, ram_usage={'admin': 10},
+                                                receipts=[pb.TxReceipt.Receipt(
+                                                    func_name='token.iost/transfer',
+                                                    content='["iost", "admin", "bob", "1.5", ""]')]))
+    return pb.Block(hash='3VkWkdWf9ixSVNqqh9Cod22GXkaPQjhCzKD69Xx3nzDX', number=1, time=1, tx_count=tx_count,
+                    transactions=[tx] * tx_count)
+
+
+@benchmark('transaction.to_bytes 1 action')
+def bench_to_bytes():
+    tx = make_tx()
+    return lambda: tx.to_bytes('full')
+
+
+@benchmark('transaction.to_bytes 100 actions')
+def bench_to_bytes_100():
+    tx = make_tx(100)
+    return lambda: tx.to_bytes('full')
+
+
+@benchmark('transaction._hash')
+def bench_hash():
+    tx = make_tx()
+    return tx._hash
+
+
+@benchmark('transaction request protobuf')
+def bench_request_protobuf():
+    tx = make_tx(10)
+    return lambda: tx.to_request_raw().SerializeToString()
+
+
+@benchmark('transaction request offline')
+def bench_request_offline():
+    tx = make_tx(10)
+    return lambda: encode_tx_request(tx)
+
+
+@benchmark('action json encoding')
+def bench_action():
+    return lambda: Action('token.iost', 'transfer', 'iost', 'admin', 'bob', '1.5', 'memo')
+
+
+@benchmark('keypair.sign ed25519')
+def bench_sign_ed25519():
+    kp = KeyPair(Ed25519)
+    message = os.urandom(32)
+    return lambda: kp.sign(message)
+
+
+@benchmark('keypair.sign secp256k1')
+def bench_sign_secp256k1():
+    kp = KeyPair(Secp256k1)
+    message = os.urandom(32)
+    return lambda: kp.sign(message)
+
+
+@benchmark('signature.verify ed25519')
+def bench_verify_ed25519():
+    message = os.urandom(32)
+    signature = KeyPair(Ed25519).sign(message)
+    return lambda: signature.verify(message)
+
+
+@benchmark('signature.verify secp256k1')
+def bench_verify_secp256k1():
+    message = os.urandom(32)
+    signature: Signature = KeyPair(Secp256k1).sign(message)
+    return lambda: signature.verify(message)
+
+
+@benchmark('block.from_raw 1k txs')
+def bench_block_1k():
+    raw = make_block(1000)
+    return lambda: Block().from_raw(raw, pb.BlockResponse.PENDING)
+
+
+@benchmark('block.from_raw 10k txs')
+def bench_block_10k():
+    raw = make_block(10000)
+    return lambda: Block().from_raw(raw, pb.BlockResponse.PENDING)
+
+
+@benchmark('block columns 10 x 1k txs')
+def bench_block_columns():
+    raws = [make_block(1000) for _ in range(10)]
+    return lambda: BlockColumns().extend(raws).to_numpy()
+
+
+@benchmark('accountinfo.from_raw')
+def bench_account_info():
+    item = pb.Account.Item(id='IOSTfQFocqDn7VrKV7vvPqhAQGyeFU9XMYo5SNn5yQbdbzC75wM7C', is_key_pair=True, weight=1)
+    raw = pb.Account(
+        name='admin', balance=100.0,
+        gas_info=pb.Account.GasInfo(current_total=1000.0, pledged_info=[pb.Account.PledgeInfo(
+            pledger='admin', amount=10.0)]),
+        ram_info=pb.Account.RAMInfo(available=1000, used=10, total=1010),
+        permissions={p: pb.Account.Permission(name=p, items=[item], threshold=1) for p in ('active', 'owner')},
+        groups={'g': pb.Account.Group(name='g', items=[item])},
+        frozen_balances=[pb.FrozenBalance(amount=1.0, time=i) for i in range(10)])
+    return lambda: AccountInfo().from_raw(raw)
+
+
+@benchmark('crc32.parity 33 bytes')
+def bench_parity():
+    data = os.urandom(33)
+    return lambda: parity(data)
+
+
+@benchmark('b58encode 32 bytes uncached')
+def bench_b58encode():
+    data = os.urandom(32)
+    return lambda: _encode(data)
+
+
+@benchmark('b58decode 32 bytes uncached')
+def bench_b58decode():
+    data = b58encode(os.urandom(32))
+    return lambda: _decode(data)
+
+
+@benchmark('b58encode 32 bytes cached')
+def bench_b58encode_cached():
+    data = os.urandom(32)
+    return lambda: b58encode(data)
+
+
+@benchmark('b58decode 32 bytes cached')
+def bench_b58decode_cached():
+    data = b58encode(os.urandom(32))
+    return lambda: b58decode(data)
+
+
+def _fake_iost():
+    """Starts a `FakeNode` shared by the RPC benchmarks and connects to it."""
+    if _fake:
+        return _fake['node'], _fake['iost']
+    from pyost.iost import IOST
+    node = FakeNode(block_time=0).start()
+    node.add_account('admin', 1e12).add_account('bob')
+    publisher = Account('admin')
+    publisher.add_key_pair(KeyPair(Ed25519), 'active')
+    iost = IOST(node.url, publisher=publisher)
+    _cleanups.append(node.stop)
+    _cleanups.append(iost._channel.close)
+    _fake.update(node=node, iost=iost)
+    return node, iost
+
+
+@benchmark('rpc get_chain_info')
+def bench_rpc_chain_info():
+    _, iost = _fake_iost()
+    return iost.get_chain_info
+
+
+@benchmark('rpc get_block_by_num 100 txs')
+def bench_rpc_block():
+    node, iost = _fake_iost()
+    for _ in range(100):
+        iost.send_tx(iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+    number = node.produce_block().number
+    return lambda: iost.get_block_by_num(number, complete=True)
+
+
+@benchmark('rpc send_tx')
+def bench_rpc_send_tx():
+    _, iost = _fake_iost()
+    return lambda: iost.send_tx(iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+
+
+def run(name: str, repeat: int) -> float:
+    """Runs a benchmark and returns its best time per call in microseconds."""
+    fn = BENCHMARKS[name]()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='keyword', default='', help='only run the benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repetitions, the best one is kept')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results with this JSON file')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio above which a benchmark is reported as a regression')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    regressions = []
+    try:
+        for name in BENCHMARKS:
+            if args.keyword not in name:
+                continue
+            results[name] = run(name, args.repeat)
+            line = f'{name:<36} {results[name]:12.2f} us'
+            if name in baseline:
+                ratio = results[name] / baseline[name]
+                line += f' {ratio:8.2f} x baseline'
+                if ratio > args.threshold:
+                    line += '  REGRESSION'
+                    regressions.append(name)
+            print(line, flush=True)
+    finally:
+        for cleanup in reversed(_cleanups):
+            cleanup()
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'platform': platform.platform(),
+                       'results': results}, f, indent=2, sort_keys=True)
+            f.write('\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
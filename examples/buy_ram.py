@@ -1,4 +1,4 @@
-from base58 import b58decode
+from pyost.b58 import b58decode
 from pyost.iost import IOST
 from pyost.account import Account
 from pyost.algorithm import Ed25519
@@ -2,7 +2,7 @@ import sys
 import collections
 import json
 import random
-from base58 import b58decode
+from pyost.b58 import b58decode
 from multiprocessing.pool import ThreadPool
 from pyost.iost import IOST
 from pyost.account import Account, KeyPair
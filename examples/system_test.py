@@ -4,7 +4,7 @@ from pyost.iost import IOST
 from pyost.account import Account
 from pyost.algorithm import Ed25519
 from pyost.signature import KeyPair
-from base58 import b58decode
+from pyost.b58 import b58decode
 
 if __name__ == '__main__':
     iost = IOST('localhost:30002')
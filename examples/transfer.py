@@ -3,7 +3,7 @@ from pyost.account import Account
 from pyost.algorithm import Ed25519
 from pyost.signature import KeyPair
 from pyost.transaction import TransactionError
-from base58 import b58decode
+from pyost.b58 import b58decode
 
 
 def print_balance(account_name: str):
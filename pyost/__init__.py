@@ -0,0 +1,41 @@
+"""Python SDK for the IOST blockchain.
+
+The main classes can be imported from ``pyost`` directly, such as ``from pyost import IOST, Account``.
+Their modules are only imported on first use, so that scripts that sign transactions offline
+do not pay for the import of gRPC and of the generated protobuf modules.
+"""
+import importlib
+
+_EXPORTS = {
+    'IOST': 'pyost.iost',
+    'Account': 'pyost.account',
+    'AccountInfo': 'pyost.account',
+    'TokenInfo': 'pyost.account',
+    'KeyPair': 'pyost.signature',
+    'Signature': 'pyost.signature',
+    'Ed25519': 'pyost.algorithm',
+    'Secp256k1': 'pyost.algorithm',
+    'Transaction': 'pyost.transaction',
+    'Action': 'pyost.transaction',
+    'TxReceipt': 'pyost.transaction',
+    'TransactionError': 'pyost.transaction',
+    'Block': 'pyost.blockchain',
+    'Contract': 'pyost.contract',
+    'Event': 'pyost.event',
+    'CallPolicy': 'pyost.policy',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,11 +1,13 @@
 from __future__ import annotations
-from typing import List, Dict
-from protobuf_to_dict import protobuf_to_dict
-from pprint import pformat
+from decimal import Decimal, Context, ROUND_DOWN
+from typing import List, Dict, Union
 
-from pyost.rpc.pb import rpc_pb2 as pb
 from pyost.signature import KeyPair
 from pyost.transaction import Transaction
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+pprint = lazy_import('pprint')
 
 
 class Account:
@@ -26,7 +28,7 @@ class Account:
         self._kps: Dict[str, KeyPair] = {}
 
     def __str__(self) -> str:
-        return pformat(vars(self))
+        return pprint.pformat(vars(self))
 
     def add_key_pair(self, kp: KeyPair, permission: str = 'active') -> None:
         """Assigns a KeyPair object to a given permission.
@@ -89,7 +91,10 @@ class FrozenBalance:
         self.time: int = 0
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'FrozenBalance(amount={self.amount}, time={self.time})'
 
     def from_raw(self, fb: pb.FrozenBalance) -> FrozenBalance:
         """Deserializes a protobuf object to update this object's members.
@@ -115,6 +120,17 @@ class FrozenBalance:
             time=self.time
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'amount': self.amount,
+            'time': self.time
+        }
+
 
 class TokenBalance:
     """Contains the balance of a token.
@@ -128,7 +144,10 @@ class TokenBalance:
         self.frozen_balances: List[FrozenBalance] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'TokenBalance(balance={self.balance}, frozen_balances={len(self.frozen_balances)})'
 
     def from_raw(self, tb: pb.GetTokenBalanceResponse) -> TokenBalance:
         """Deserializes a protobuf object to update this object's members.
@@ -156,6 +175,158 @@ class TokenBalance:
             frozen_balances=[fb.to_raw() for fb in self.frozen_balances]
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'balance': self.balance,
+            'frozen_balances': [fb.to_dict() for fb in self.frozen_balances]
+        }
+
+
+class TokenInfo:
+    """Contains the description of a token.
+
+    Attributes:
+        symbol: The symbol of the token, such as ``iost``.
+        full_name: The full name of the token.
+        issuer: The account that issued the token.
+        total_supply: The maximum supply of the token.
+        current_supply: The amount of tokens issued so far.
+        decimal: The number of digits after the decimal point of the amounts of the token.
+        can_transfer: Whether the token can be transferred.
+    """
+    def __init__(self):
+        self.symbol: str = ''
+        self.full_name: str = ''
+        self.issuer: str = ''
+        self.total_supply: int = 0
+        self.current_supply: int = 0
+        self.decimal: int = 0
+        self.can_transfer: bool = False
+
+    def __str__(self) -> str:
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'TokenInfo(symbol={self.symbol!r}, decimal={self.decimal}, can_transfer={self.can_transfer})'
+
+    def from_raw(self, ti: pb.TokenInfo) -> TokenInfo:
+        """Deserializes a protobuf object to update this object's members.
+
+        Args:
+            ti: The protobuf object.
+
+        Returns:
+            Itself.
+        """
+        self.symbol = ti.symbol
+        self.full_name = ti.full_name
+        self.issuer = ti.issuer
+        self.total_supply = ti.total_supply
+        self.current_supply = ti.current_supply
+        self.decimal = ti.decimal
+        self.can_transfer = ti.can_transfer
+        return self
+
+    def to_raw(self) -> pb.TokenInfo:
+        """Serializes this object's members to a protobuf object.
+
+        Returns:
+            A protobuf object.
+        """
+        return pb.TokenInfo(
+            symbol=self.symbol,
+            full_name=self.full_name,
+            issuer=self.issuer,
+            total_supply=self.total_supply,
+            current_supply=self.current_supply,
+            decimal=self.decimal,
+            can_transfer=self.can_transfer
+        )
+
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'symbol': self.symbol,
+            'full_name': self.full_name,
+            'issuer': self.issuer,
+            'total_supply': self.total_supply,
+            'current_supply': self.current_supply,
+            'decimal': self.decimal,
+            'can_transfer': self.can_transfer
+        }
+
+    def format_amount(self, amount: Union[int, float, str, Decimal]) -> str:
+        """Formats an amount of this token with `format_amount`.
+
+        Args:
+            amount: The amount of tokens.
+
+        Returns:
+            The amount as a string.
+        """
+        return format_amount(amount, self.decimal)
+
+
+_QUANTUMS: Dict[int, Decimal] = {}
+
+
+def format_amount(amount: Union[int, float, str, Decimal], decimal: int) -> str:
+    """Formats an amount of tokens as a string with at most `decimal` digits after the point,
+    the extra digits are dropped so that a payout never exceeds the requested amount.
+
+    A float is read as its shortest representation, so that ``0.1`` gives ``0.1`` and not
+    the digits of its binary value. Unlike ``str``, the result never uses an exponent.
+
+    Args:
+        amount: The amount of tokens.
+        decimal: The number of digits after the decimal point of the token, see `TokenInfo.decimal`.
+
+    Returns:
+        The amount as a string, without trailing zeros, such as ``10`` or ``0.12345678``.
+
+    Raises:
+        ValueError: If the amount is not a finite number.
+
+    Example:
+        >>> format_amount(55.000000001, 8)
+        '55'
+        >>> format_amount(1e-05, 8)
+        '0.00001'
+    """
+    if isinstance(amount, bool):
+        raise ValueError(f'Invalid amount {amount!r}.')
+    if isinstance(amount, int):
+        return str(amount)
+    if isinstance(amount, float):
+        text = repr(amount)
+        if 'e' not in text and 'n' not in text:
+            whole, _, fraction = text.partition('.')
+            fraction = fraction[:decimal].rstrip('0')
+            return f'{whole}.{fraction}' if fraction else whole
+        amount = text
+    try:
+        value = Decimal(amount)
+    except ArithmeticError as e:
+        raise ValueError(f'Invalid amount {amount!r}.') from e
+    if not value.is_finite():
+        raise ValueError(f'Invalid amount {amount!r}.')
+    if value.as_tuple().exponent < -decimal:
+        quantum = _QUANTUMS.get(decimal)
+        if quantum is None:
+            quantum = _QUANTUMS[decimal] = Decimal(1).scaleb(-decimal)
+        # The default precision of 28 digits is too small for large amounts with many decimals.
+        value = value.quantize(quantum, ROUND_DOWN, Context(prec=max(28, value.adjusted() + decimal + 1)))
+    return format(value.normalize(Context(prec=max(28, len(value.as_tuple().digits)))), 'f')
+
 
 class Token721Balance:
     """Contains the balance of an ERC721 token.
@@ -169,7 +340,10 @@ class Token721Balance:
         self.token_ids: List[str] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Token721Balance(balance={self.balance}, token_ids={len(self.token_ids)})'
 
     def from_raw(self, tb: pb.GetToken721BalanceResponse) -> Token721Balance:
         """Deserializes a protobuf object to update this object's members.
@@ -195,6 +369,17 @@ class Token721Balance:
             tokenIDs=self.token_ids
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'balance': self.balance,
+            'tokenIDs': list(self.token_ids)
+        }
+
 
 class AccountInfo:
     """Contains information about an account.
@@ -222,7 +407,10 @@ class AccountInfo:
             self.amount: float = 0.0
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'PledgeInfo(pledger={self.pledger!r}, amount={self.amount})'
 
         def from_raw(self, pi: pb.Account.PledgeInfo) -> AccountInfo.PledgeInfo:
             """Deserializes a protobuf object to update this object's members.
@@ -248,6 +436,17 @@ class AccountInfo:
                 amount=self.amount
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'pledger': self.pledger,
+                'amount': self.amount
+            }
+
     # The message defines account gas information.
     class GasInfo:
         """Contains information about the gas own by an account.
@@ -269,7 +468,10 @@ class AccountInfo:
             self.pledged_info: List[AccountInfo.PledgeInfo] = []
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'GasInfo(current_total={self.current_total}, limit={self.limit})'
 
         def from_raw(self, gi: pb.Account.GasInfo) -> AccountInfo.GasInfo:
             """Deserializes a protobuf object to update this object's members.
@@ -304,6 +506,21 @@ class AccountInfo:
                 pledged_info=[pi.to_raw() for pi in self.pledged_info]
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'current_total': self.current_total,
+                'transferable_gas': self.transferable_gas,
+                'pledge_gas': self.pledge_gas,
+                'increase_speed': self.increase_speed,
+                'limit': self.limit,
+                'pledged_info': [pi.to_dict() for pi in self.pledged_info]
+            }
+
     class RAMInfo:
         """Contains information about the RAM own by an account.
 
@@ -318,7 +535,10 @@ class AccountInfo:
             self.total: int = 0
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'RAMInfo(available={self.available}, used={self.used}, total={self.total})'
 
         def from_raw(self, ri: pb.Account.RAMInfo) -> AccountInfo.RAMInfo:
             """Deserializes a protobuf object to update this object's members.
@@ -346,6 +566,18 @@ class AccountInfo:
                 total=self.total
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'available': self.available,
+                'used': self.used,
+                'total': self.total
+            }
+
     class Item:
         """Contains information about permission item.
 
@@ -362,7 +594,10 @@ class AccountInfo:
             self.permission: str = ''
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'Item(id={self.id!r}, permission={self.permission!r}, weight={self.weight})'
 
         def from_raw(self, i: pb.Account.Item) -> AccountInfo.Item:
             """Deserializes a protobuf object to update this object's members.
@@ -392,6 +627,19 @@ class AccountInfo:
                 permission=self.permission
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'id': self.id,
+                'is_key_pair': self.is_key_pair,
+                'weight': self.weight,
+                'permission': self.permission
+            }
+
     class Group:
         """Contains information about permission group.
 
@@ -404,7 +652,10 @@ class AccountInfo:
             self.items: List[AccountInfo.Item] = []
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'Group(name={self.name!r}, items={len(self.items)})'
 
         def from_raw(self, g: pb.Account.Group) -> AccountInfo.Group:
             """Deserializes a protobuf object to update this object's members.
@@ -431,6 +682,17 @@ class AccountInfo:
                 items=[item.to_raw() for item in self.items]
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'name': self.name,
+                'items': [item.to_dict() for item in self.items]
+            }
+
     class Permission:
         """Contains information about a permission.
 
@@ -447,7 +709,10 @@ class AccountInfo:
             self.threshold: int = 0
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'Permission(name={self.name!r}, items={len(self.items)}, threshold={self.threshold})'
 
         def from_raw(self, p: pb.Account.Permission) -> AccountInfo.Permission:
             """Deserializes a protobuf object to update this object's members.
@@ -478,6 +743,19 @@ class AccountInfo:
                 threshold=self.threshold
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'name': self.name,
+                'group_names': list(self.group_names),
+                'items': [item.to_dict() for item in self.items],
+                'threshold': self.threshold
+            }
+
     class VoteInfo:
         """Contains information about vote info.
 
@@ -492,7 +770,10 @@ class AccountInfo:
             self.cleared_votes: float = 0
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'VoteInfo(option={self.option!r}, votes={self.votes})'
 
         def from_raw(self, i: pb.VoteInfo) -> AccountInfo.VoteInfo:
             """Deserializes a protobuf object to update this object's members.
@@ -520,6 +801,18 @@ class AccountInfo:
                 cleared_votes=self.cleared_votes
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'option': self.option,
+                'votes': self.votes,
+                'cleared_votes': self.cleared_votes
+            }
+
     def __init__(self):
         self.name: str = ''
         self.balance: float = 0.0
@@ -530,7 +823,10 @@ class AccountInfo:
         self.frozen_balances: List[FrozenBalance] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'AccountInfo(name={self.name!r}, balance={self.balance}, permissions={len(self.permissions)})'
 
     def from_raw(self, a: pb.Account) -> AccountInfo:
         """Deserializes a protobuf object to update this object's members.
@@ -570,3 +866,20 @@ class AccountInfo:
             frozen_balances=[fb.to_raw() for fb in self.frozen_balances],
             vote_infos=[vi.to_raw() for vi in self.vote_infos]
         )
+
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'name': self.name,
+            'balance': self.balance,
+            'gas_info': self.gas_info.to_dict(),
+            'ram_info': self.ram_info.to_dict(),
+            'permissions': {key: val.to_dict() for key, val in self.permissions.items()},
+            'groups': {key: val.to_dict() for key, val in self.groups.items()},
+            'frozen_balances': [fb.to_dict() for fb in self.frozen_balances],
+            'vote_infos': [vi.to_dict() for vi in self.vote_infos]
+        }
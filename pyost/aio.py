@@ -0,0 +1,136 @@
+from __future__ import annotations
+import asyncio
+from typing import List, AsyncIterator, Union
+
+import grpc
+from grpc import aio
+
+from pyost.rpc.pb import rpc_pb2 as pb, rpc_pb2_grpc
+from pyost.event import Event, SubscribeRequest
+from pyost.channel import ChannelConfig
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error: BaseException = error
+
+
+_END = object()
+
+
+class AsyncIOST:
+    """Connects to an IOST node with ``grpc.aio`` to consume server streams from an ``asyncio`` event loop.
+
+    A single event loop thread can keep many subscriptions open, where `IOST.subscribe`
+    blocks one thread per subscription.
+
+    Args:
+        url: The URL of the node including port number, such as ``localhost:30002``.
+        timeout: How many seconds to wait before raising a ConnectionError in `connect`.
+        channel_config: The `ChannelConfig` of the channel, such as ``ChannelConfig.profile('streaming')``.
+
+    Example:
+        >>> async with AsyncIOST('localhost:30002') as iost:
+        >>>     async for event in iost.subscribe(topics, contract_id):
+        >>>         print(event)
+    """
+
+    def __init__(self, url: str, timeout: int = 10, channel_config: ChannelConfig = None):
+        self.timeout: int = timeout
+        self._channel: aio.Channel = (channel_config or ChannelConfig()).create_aio_channel(url)
+        self._stub = rpc_pb2_grpc.ApiServiceStub(self._channel)
+
+    async def __aenter__(self) -> AsyncIOST:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Waits for the channel to be ready.
+
+        Raises:
+            ConnectionError: If the connection cannot be established before `timeout` seconds.
+        """
+        try:
+            await asyncio.wait_for(self._channel.channel_ready(), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise ConnectionError('Error connecting to server') from e
+
+    async def close(self) -> None:
+        """Closes the channel and cancels all the active calls."""
+        await self._channel.close()
+
+    async def subscribe(self, topics: List[Event.Topic], contract_id: str = '',
+                        batch_size: int = None, buffer_size: int = 256
+                        ) -> AsyncIterator[Union[Event, List[Event]]]:
+        """Subscribes to a list of topics.
+
+        The stream is read ahead into a buffer of `buffer_size` responses. When the buffer is full,
+        the stream is not read anymore so that gRPC flow control slows the node down
+        instead of accumulating events in memory.
+        Cancelling the consumer task or closing the iterator cancels the upstream call.
+
+        Args:
+            topics: A list of `Event.Topic` to listen to.
+            contract_id: A filter to only listen to the events of a particular contract.
+            batch_size: If set, yields lists of at most `batch_size` `Event` made of the events
+                already received, instead of yielding the events one by one.
+            buffer_size: The maximum number of events read ahead.
+
+        Yields:
+            Returns the `Events` one by one, or lists of `Events` if `batch_size` is set.
+
+        Raises:
+            grpc.RpcError: If the stream fails.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        call = self._stub.Subscribe(SubscribeRequest(topics, contract_id).to_raw())
+        queue = asyncio.Queue(buffer_size)
+        reader = asyncio.ensure_future(self._read(call, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                if batch_size is None:
+                    yield Event().from_raw(item.event)
+                    continue
+
+                batch = [Event().from_raw(item.event)]
+                end = None
+                while len(batch) < batch_size and not queue.empty():
+                    item = queue.get_nowait()
+                    if item is _END or isinstance(item, _Failure):
+                        end = item
+                        break
+                    batch.append(Event().from_raw(item.event))
+                yield batch
+
+                if end is _END:
+                    return
+                if end is not None:
+                    raise end.error
+        finally:
+            reader.cancel()
+            call.cancel()
+
+    @staticmethod
+    async def _read(call: aio.UnaryStreamCall, queue: asyncio.Queue) -> None:
+        try:
+            while True:
+                res: pb.SubscribeResponse = await call.read()
+                if res is aio.EOF:
+                    break
+                await queue.put(res)
+        except asyncio.CancelledError:
+            raise
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                await queue.put(_Failure(e))
+            return
+        await queue.put(_END)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Type
-import ed25519
-import ecdsa
 
-from pyost.rpc.pb import rpc_pb2 as pb
-from pyost import signature
+from pyost.lazy import lazy_import
+
+ed25519 = lazy_import('ed25519')
+ecdsa = lazy_import('ecdsa')
+signature = lazy_import('pyost.signature')
 
 
 def get_algorithm_by_id(id: int) -> Type[Algorithm]:
@@ -52,7 +53,7 @@ def get_algorithm_by_name(name: str) -> Type[Algorithm]:
 
 class Algorithm(ABC):
     """Super class of Algorithm."""
-    ID = pb.Signature.UNKNOWN  #: The id of the Algorithm as used internally by the blockchain's nodes.
+    ID = 0  #: The id of the Algorithm as used internally by the blockchain's nodes.
     NAME = 'UNKNOWN'  #: The name of the Algorithm, for display purpose.
 
     @classmethod
@@ -130,7 +131,7 @@ class Algorithm(ABC):
 
 class Secp256k1(Algorithm):
     """Contains methods for the Secp256k1 algorithm."""
-    ID = pb.Signature.SECP256K1  #: The id of the Algorithm as used internally by the blockchain's nodes.
+    ID = 1  #: The id of the Algorithm as used internally by the blockchain's nodes.
     NAME = 'secp256k1'  #: The name of the Algorithm, for display purpose.
 
     @classmethod
@@ -225,7 +226,7 @@ class Secp256k1(Algorithm):
 
 class Ed25519(Algorithm):
     """Contains methods for the Ed25519 algorithm."""
-    ID = pb.Signature.ED25519  #: The id of the Algorithm as used internally by the blockchain's nodes.
+    ID = 2  #: The id of the Algorithm as used internally by the blockchain's nodes.
     NAME = 'ed25519'  #: The name of the Algorithm, for display purpose.
 
     @classmethod
@@ -0,0 +1,257 @@
+from __future__ import annotations
+import threading
+from collections import Counter
+from typing import List, Dict, Set, Tuple, Any, TYPE_CHECKING
+
+from pyost.lazy import lazy_import
+
+metrics = lazy_import('pyost.metrics')
+
+if TYPE_CHECKING:
+    from pyost.blockchain import Block
+    from pyost.follower import BlockFollower
+    from pyost.transaction import Transaction
+
+GAS_BUCKETS = (100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 25000.0, 50000.0,
+               100000.0, 250000.0, 500000.0, 1000000.0, 2500000.0, 5000000.0)  #: In gas units.
+
+OTHER = '(other)'  #: The key of the calls beyond `ReceiptAnalytics.max_keys`.
+
+
+class ReceiptStats:
+    """The aggregated receipts of the transactions that call a contract or an abi.
+
+    Args:
+        buckets: The upper bounds of the gas histogram buckets.
+
+    Attributes:
+        count: The number of calls, including the calls made by other contracts.
+        transactions: The number of transactions that call it in one of their actions.
+        gas: The `pyost.metrics.Histogram` of the gas usage of these transactions.
+        ram_delta: The sum of the RAM usage of these transactions, in bytes, negative if RAM was freed.
+        codes: The number of these transactions by `TxReceipt.StatusCode` name.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = GAS_BUCKETS):
+        self.count: int = 0
+        self.transactions: int = 0
+        self.gas: metrics.Histogram = metrics.Histogram(buckets)
+        self.ram_delta: int = 0
+        self.codes: Counter = Counter()
+
+    def __repr__(self) -> str:
+        return f'ReceiptStats(count={self.count}, gas_sum={self.gas.sum}, failure_rate={self.failure_rate:.3f})'
+
+    @property
+    def failure_rate(self) -> float:
+        """The fraction of the transactions that failed."""
+        if self.transactions == 0:
+            return 0.0
+        return 1.0 - self.codes['SUCCESS'] / self.transactions
+
+    def add(self, calls: int, gas: float = None, ram_delta: int = 0, code: str = None) -> None:
+        """Adds the calls of a transaction.
+
+        Args:
+            calls: The number of calls in the transaction.
+            gas: The gas used by the transaction, None if it only calls it from another contract.
+            ram_delta: The RAM used by the transaction, in bytes.
+            code: The name of the `TxReceipt.StatusCode` of the transaction.
+        """
+        self.count += calls
+        if gas is None:
+            return
+        self.transactions += 1
+        self.gas.observe(gas)
+        self.ram_delta += ram_delta
+        self.codes[code] += 1
+
+    def to_dict(self) -> dict:
+        """Converts the statistics to a dictionary.
+
+        Returns:
+            A dictionary with the counts of calls and transactions, the gas sum and percentiles, the RAM delta,
+                the failure rate and the counts by status code.
+        """
+        return {
+            'count': self.count,
+            'transactions': self.transactions,
+            'gas_sum': self.gas.sum,
+            'gas_p50': self.gas.quantile(0.5),
+            'gas_p90': self.gas.quantile(0.9),
+            'gas_p99': self.gas.quantile(0.99),
+            'ram_delta': self.ram_delta,
+            'failure_rate': self.failure_rate,
+            'codes': dict(self.codes),
+        }
+
+
+class ReceiptAnalytics:
+    """Aggregates the receipts of the transactions of a stream of blocks, by contract and by abi.
+
+    The memory is bounded: each key holds a fixed `pyost.metrics.Histogram`, and the calls of
+    the contracts or abis beyond `max_keys` are aggregated under `OTHER`.
+
+    A receipt only tells the gas and RAM used by a whole `Transaction`, so they are not split between
+    its actions: the gas histogram of an abi is the one of the transactions that call it in an action,
+    and a transaction that calls several abis is added to each of them. The calls are counted from
+    the ``func_name`` of the receipts, which include the calls made by other contracts, and from
+    the actions for the contracts that emit no receipt.
+
+    Args:
+        buckets: The upper bounds of the gas histogram buckets.
+        max_keys: The maximum number of contracts, and of abis, aggregated separately.
+
+    Attributes:
+        blocks: The number of blocks added.
+        transactions: The number of transactions added.
+
+    Example:
+        >>> analytics = ReceiptAnalytics().follow(BlockFollower(iost).start())
+        >>> analytics.top(10)
+        [('exchange.iost/buy', ReceiptStats(count=1204, gas_sum=48160000.0, failure_rate=0.012)), ...]
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = GAS_BUCKETS, max_keys: int = 10000):
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self.max_keys: int = max_keys
+        self.blocks: int = 0
+        self.transactions: int = 0
+        self._contracts: Dict[str, ReceiptStats] = {}
+        self._abis: Dict[str, ReceiptStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_tx(self, tx: Transaction) -> None:
+        """Adds the receipt of a transaction, ignored if the `Transaction` has no receipt.
+
+        Args:
+            tx: The `Transaction`.
+        """
+        receipt = tx.tx_receipt
+        if receipt is None or not tx.actions:
+            return
+        abis = Counter(f'{action.contract}/{action.action_name}' for action in tx.actions)
+        direct = set(abis)
+        for name, calls in Counter(r.func_name for r in receipt.receipts if r.func_name).items():
+            abis[name] = max(abis[name], calls)
+        contracts = Counter()
+        for name, calls in abis.items():
+            contracts[name.split('/', 1)[0]] += calls
+        direct_contracts = {action.contract for action in tx.actions}
+        gas = receipt.gas_usage
+        ram_delta = sum(receipt.ram_usage.values())
+        code = receipt.status_code.name
+        with self._lock:
+            self.transactions += 1
+            self._add(self._contracts, contracts, direct_contracts, gas, ram_delta, code)
+            self._add(self._abis, abis, direct, gas, ram_delta, code)
+
+    def on_block(self, block: Block) -> None:
+        """Adds the receipts of the transactions of a block.
+
+        Args:
+            block: The complete `Block`.
+        """
+        for tx in block.transactions:
+            self.add_tx(tx)
+        with self._lock:
+            self.blocks += 1
+
+    def follow(self, follower: BlockFollower) -> ReceiptAnalytics:
+        """Adds the blocks handed out by a `BlockFollower`.
+
+        Args:
+            follower: A `BlockFollower` that fetches complete blocks.
+
+        Returns:
+            Itself.
+
+        Raises:
+            ValueError: If the follower does not fetch complete blocks.
+        """
+        if not follower.complete:
+            raise ValueError('The follower must fetch complete blocks.')
+        follower.add_listener(self.on_block)
+        return self
+
+    def contract(self, name: str) -> ReceiptStats:
+        """Gets the statistics of a contract.
+
+        Args:
+            name: The contract id.
+
+        Returns:
+            A `ReceiptStats`, empty if the contract has not been called.
+        """
+        with self._lock:
+            return self._contracts.get(name) or ReceiptStats(self.buckets)
+
+    def abi(self, name: str) -> ReceiptStats:
+        """Gets the statistics of an abi.
+
+        Args:
+            name: The name of the abi prefixed by its contract id, such as ``token.iost/transfer``.
+
+        Returns:
+            A `ReceiptStats`, empty if the abi has not been called.
+        """
+        with self._lock:
+            return self._abis.get(name) or ReceiptStats(self.buckets)
+
+    def top(self, n: int = 10, key: str = 'gas_sum', by_contract: bool = False) -> List[Tuple[str, ReceiptStats]]:
+        """Gets the most expensive abis or contracts.
+
+        Args:
+            n: The number of entries to return.
+            key: The key of `ReceiptStats.to_dict` to sort by, such as ``gas_sum``, ``gas_p99`` or ``failure_rate``.
+            by_contract: If True, ranks the contracts instead of the abis.
+
+        Returns:
+            A list of ``(name, stats)``, in decreasing order of `key`.
+        """
+        with self._lock:
+            items = [(name, stats, stats.to_dict()[key])
+                     for name, stats in (self._contracts if by_contract else self._abis).items()]
+        items.sort(key=lambda item: item[2] if item[2] is not None else 0, reverse=True)
+        return [(name, stats) for name, stats, _ in items[:n]]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Exports the current aggregates, ready to be serialized to JSON.
+
+        Returns:
+            A dictionary with the number of blocks and transactions, and the `ReceiptStats.to_dict`
+                of each contract and of each abi.
+        """
+        with self._lock:
+            return {
+                'blocks': self.blocks,
+                'transactions': self.transactions,
+                'contracts': {name: stats.to_dict() for name, stats in sorted(self._contracts.items())},
+                'abis': {name: stats.to_dict() for name, stats in sorted(self._abis.items())},
+            }
+
+    def reset(self) -> None:
+        """Removes all the aggregates."""
+        with self._lock:
+            self.blocks = 0
+            self.transactions = 0
+            self._contracts.clear()
+            self._abis.clear()
+
+    def _add(self, table: Dict[str, ReceiptStats], calls: Counter, direct: Set[str],
+             gas: float, ram_delta: int, code: str) -> None:
+        for name, count in calls.items():
+            if name in direct:
+                self._get(table, name).add(count, gas, ram_delta, code)
+            else:
+                self._get(table, name).add(count)
+
+    def _get(self, table: Dict[str, ReceiptStats], name: str) -> ReceiptStats:
+        stats = table.get(name)
+        if stats is None:
+            if len(table) >= self.max_keys:
+                name = OTHER
+                stats = table.get(name)
+            if stats is None:
+                stats = table[name] = ReceiptStats(self.buckets)
+        return stats
@@ -0,0 +1,115 @@
+from functools import lru_cache
+from typing import List, Iterable, Union
+
+ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'  #: The Bitcoin base58 alphabet used by IOST.
+
+_CHUNK_DIGITS = 10
+_CHUNK = 58 ** _CHUNK_DIGITS
+_PAIRS = [bytes([ALPHABET[i // 58], ALPHABET[i % 58]]) for i in range(58 * 58)]
+_DECODE_TABLE = bytes(ALPHABET.index(c) if c in ALPHABET else 0xff for c in range(256))
+_CACHED_SIZES = (32, 33)
+
+
+def _encode(data: bytes) -> bytes:
+    stripped = data.lstrip(b'\0')
+    zeros = len(data) - len(stripped)
+    acc = int.from_bytes(stripped, 'big')
+    # Big integer divisions by 58 ** 10 instead of 58, then 2 digits at a time on small integers.
+    pairs = []
+    while acc:
+        acc, chunk = divmod(acc, _CHUNK)
+        for _ in range(_CHUNK_DIGITS // 2):
+            chunk, pair = divmod(chunk, 3364)
+            pairs.append(_PAIRS[pair])
+    pairs.reverse()
+    return b'1' * zeros + b''.join(pairs).lstrip(b'1')
+
+
+def _decode(data: bytes) -> bytes:
+    stripped = data.lstrip(b'1')
+    zeros = len(data) - len(stripped)
+    digits = stripped.translate(_DECODE_TABLE)
+    if b'\xff' in digits:
+        raise ValueError(f'Invalid base58 string: {data!r}')
+    acc = 0
+    head = len(digits) % _CHUNK_DIGITS or _CHUNK_DIGITS
+    start = 0
+    for end in range(head, len(digits) + 1, _CHUNK_DIGITS):
+        chunk = 0
+        for d in digits[start:end]:
+            chunk = chunk * 58 + d
+        acc = acc * 58 ** (end - start) + chunk
+        start = end
+    return b'\0' * zeros + acc.to_bytes((acc.bit_length() + 7) // 8, 'big')
+
+
+_encode_cached = lru_cache(maxsize=4096)(_encode)
+_decode_cached = lru_cache(maxsize=4096)(_decode)
+
+
+def b58encode(data: bytes) -> bytes:
+    """Encodes bytes to base58.
+    Inputs of 32 and 33 bytes, such as hashes and public keys, are kept in an LRU cache.
+
+    Args:
+        data: The bytes to encode.
+
+    Returns:
+        The base58 string as bytes, like ``base58.b58encode``.
+    """
+    data = bytes(data)
+    if len(data) in _CACHED_SIZES:
+        return _encode_cached(data)
+    return _encode(data)
+
+
+def b58decode(data: Union[str, bytes]) -> bytes:
+    """Decodes a base58 string to bytes.
+    Strings of 43 to 45 characters, such as hashes and public keys, are kept in an LRU cache.
+
+    Args:
+        data: The base58 string.
+
+    Returns:
+        The decoded bytes.
+
+    Raises:
+        ValueError: If the string contains a character that is not in the base58 alphabet.
+    """
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    data = bytes(data).rstrip()
+    if 43 <= len(data) <= 45:
+        return _decode_cached(data)
+    return _decode(data)
+
+
+def b58encode_many(items: Iterable[bytes]) -> List[bytes]:
+    """Encodes many inputs to base58.
+    The LRU cache is bypassed, since the items of a batch are usually seen once.
+
+    Args:
+        items: The bytes to encode.
+
+    Returns:
+        The list of base58 strings as bytes, in the same order as `items`.
+    """
+    return [_encode(bytes(item)) for item in items]
+
+
+def b58decode_many(items: Iterable[Union[str, bytes]]) -> List[bytes]:
+    """Decodes many base58 strings, bypassing the LRU cache.
+
+    Args:
+        items: The base58 strings.
+
+    Returns:
+        The list of decoded bytes, in the same order as `items`.
+    """
+    return [_decode((item.encode('ascii') if isinstance(item, str) else bytes(item)).rstrip()) for item in items]
+
+
+def cache_clear() -> None:
+    """Empties the LRU caches of `b58encode` and `b58decode`."""
+    _encode_cached.cache_clear()
+    _decode_cached.cache_clear()
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from typing import List
 from enum import Enum
-from protobuf_to_dict import protobuf_to_dict
-from pprint import pformat
 
-from pyost.rpc.pb import rpc_pb2 as pb
 from pyost.transaction import Transaction
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+pprint = lazy_import('pprint')
 
 
 class NodeInfo:
@@ -31,7 +32,10 @@ class NodeInfo:
             self.peer_count: int = 0
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'NetworkInfo(id={self.id!r}, peer_count={self.peer_count})'
 
         def from_raw(self, ni: pb.NetworkInfo) -> NodeInfo.NetworkInfo:
             """Deserializes a protobuf object to update this object's members.
@@ -57,6 +61,17 @@ class NodeInfo:
                 peer_count=self.peer_count
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'id': self.id,
+                'peer_count': self.peer_count
+            }
+
     def __init__(self):
         self.build_time: str = ''
         self.git_hash: str = ''
@@ -64,7 +79,10 @@ class NodeInfo:
         self.network: NodeInfo.NetworkInfo = None
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'NodeInfo(git_hash={self.git_hash!r}, mode={self.mode!r})'
 
     def from_raw(self, ni: pb.NodeInfoResponse) -> NodeInfo:
         """Deserializes a protobuf object to update this object's members.
@@ -94,6 +112,19 @@ class NodeInfo:
             network=self.network.to_raw() if self.network is not None else None
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'build_time': self.build_time,
+            'git_hash': self.git_hash,
+            'mode': self.mode,
+            'network': self.network.to_dict() if self.network is not None else None
+        }
+
 
 class ChainInfo:
     """Contains information about the blockchain.
@@ -118,7 +149,10 @@ class ChainInfo:
         self.witness_list: List[str] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'ChainInfo(net_name={self.net_name!r}, head_block={self.head_block}, lib_block={self.lib_block})'
 
     def from_raw(self, ci: pb.ChainInfoResponse) -> ChainInfo:
         """Deserializes a protobuf object to update this object's members.
@@ -154,6 +188,22 @@ class ChainInfo:
             witness_list=self.witness_list
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'net_name': self.net_name,
+            'protocol_version': self.protocol_version,
+            'head_block': self.head_block,
+            'head_block_hash': self.head_block_hash,
+            'lib_block': self.lib_block,
+            'lib_block_hash': self.lib_block_hash,
+            'witness_list': list(self.witness_list)
+        }
+
 
 class RAMInfo:
     """Contains information about the blockchain's RAM.
@@ -174,7 +224,10 @@ class RAMInfo:
         self.buy_price: float = 0.0
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'RAMInfo(used_ram={self.used_ram}, available_ram={self.available_ram}, buy_price={self.buy_price})'
 
     def from_raw(self, ri: pb.RAMInfoResponse) -> RAMInfo:
         """Deserializes a protobuf object to update this object's members.
@@ -206,6 +259,20 @@ class RAMInfo:
             buy_price=self.buy_price
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'used_ram': self.used_ram,
+            'available_ram': self.available_ram,
+            'total_ram': self.total_ram,
+            'sell_price': self.sell_price,
+            'buy_price': self.buy_price
+        }
+
 
 class GasRatio:
     """Contains information about the blockchain's gas ratios.
@@ -220,7 +287,10 @@ class GasRatio:
         self.median_gas_ratio: float = 0.0
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'GasRatio(lowest_gas_ratio={self.lowest_gas_ratio}, median_gas_ratio={self.median_gas_ratio})'
 
     def from_raw(self, gr: pb.GasRatioResponse) -> GasRatio:
         """Deserializes a protobuf object to update this object's members.
@@ -246,6 +316,17 @@ class GasRatio:
             median_gas_ratio=self.median_gas_ratio
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'lowest_gas_ratio': self.lowest_gas_ratio,
+            'median_gas_ratio': self.median_gas_ratio
+        }
+
 
 class Block:
     """Contains details about a block.
@@ -268,8 +349,8 @@ class Block:
 
     class Status(Enum):
         """Indicates the status of a block."""
-        PENDING = pb.BlockResponse.PENDING  #: Indicates that the block is pending to be processed.
-        IRREVERSIBLE = pb.BlockResponse.IRREVERSIBLE  #: Indicates that the block has been processed.
+        PENDING = 0  #: Indicates that the block is pending to be processed.
+        IRREVERSIBLE = 1  #: Indicates that the block has been processed.
         UNKNOWN = -1  #: Indicates an unknown error.
 
     class Info:
@@ -287,7 +368,10 @@ class Block:
             self.batch_index: List[int] = []
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'Info(mode={self.mode}, thread={self.thread}, batch_index={len(self.batch_index)})'
 
         def from_raw(self, ri: pb.Block.Info) -> Block.Info:
             """Deserializes a protobuf object to update this object's members.
@@ -315,6 +399,18 @@ class Block:
                 batch_index=self.batch_index
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'mode': self.mode,
+                'thread': self.thread,
+                'batch_index': list(self.batch_index)
+            }
+
     def __init__(self):
         self.status: Block.Status = Block.Status.UNKNOWN
         self.hash: str = ''
@@ -331,7 +427,11 @@ class Block:
         self.transactions: List[Transaction] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Block(number={self.number}, hash={self.hash!r}, status={self.status.name}, ' \
+            f'transactions={len(self.transactions)})'
 
     def from_raw(self, rb: pb.Block, status: pb.BlockResponse.Status) -> Block:
         """Deserializes a protobuf object to update this object's members.
@@ -384,3 +484,25 @@ class Block:
             info=self.info.to_raw() if self.info is not None else None,
             transactions=[tx.to_raw() for tx in self.transactions]
         )
+
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object and the `status`.
+        """
+        return {
+            'status': self.status.name,
+            'hash': self.hash,
+            'version': self.version,
+            'parent_hash': self.parent_hash,
+            'tx_merkle_hash': self.tx_merkle_hash,
+            'tx_receipt_merkle_hash': self.tx_receipt_merkle_hash,
+            'number': self.number,
+            'witness': self.witness,
+            'time': self.time,
+            'gas_usage': self.gas_usage,
+            'tx_count': self.tx_count,
+            'info': self.info.to_dict() if self.info is not None else None,
+            'transactions': [tx.to_dict() for tx in self.transactions]
+        }
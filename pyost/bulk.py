@@ -0,0 +1,228 @@
+from __future__ import annotations
+from decimal import Decimal
+from typing import List, Dict, TYPE_CHECKING
+
+from pyost.transaction import Transaction, TxReceipt, TransactionError, Action
+from pyost.gas import _ceil
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+
+class Transfer:
+    """Describes a single transfer of a `BulkTransfer` and its outcome.
+
+    Attributes:
+        token: The name of the token.
+        from_name: The account name to send tokens from.
+        to_name: The account name to send tokens to.
+        amount: The amount of tokens to send, as a string.
+        memo: A text to add to the transfer.
+        tx_hash: The hash of the `Transaction` that contains this transfer, once it has been sent.
+        success: True if the transfer has been executed, False if it failed, None before its receipt is known.
+        error: The error message of the `Transaction` if the transfer failed.
+    """
+
+    def __init__(self, token: str, from_name: str, to_name: str, amount: str, memo: str = ''):
+        self.token: str = token
+        self.from_name: str = from_name
+        self.to_name: str = to_name
+        self.amount: str = amount
+        self.memo: str = memo
+        self.tx_hash: str = None
+        self.success: bool = None
+        self.error: str = None
+
+    def __str__(self) -> str:
+        return f'{self.from_name} -> {self.to_name}: {self.amount} {self.token} ({self.success})'
+
+    def to_action(self) -> Action:
+        """Creates the ``token.iost transfer`` `Action` of this transfer.
+
+        Returns:
+            An `Action` object.
+        """
+        return Action('token.iost', 'transfer', self.token, self.from_name, self.to_name, self.amount, self.memo)
+
+
+class BulkTransfer:
+    """Packs many ``token.iost transfer`` actions into as few transactions as the node's limits allow.
+
+    Each `Transaction` is filled until its serialized size reaches `max_tx_size`, its estimated gas reaches
+    `max_gas_limit` or it contains `max_actions` actions. Its `AmountLimit` are the sums of its transfers
+    by token. Once sent, the outcome of each transfer is read from the ``token.iost/transfer``
+    receipts of its `TxReceipt`.
+
+    Warnings:
+        A `Transaction` is atomic: if one of its transfers fails, all its transfers are reverted.
+
+    Args:
+        iost: The `IOST` client used to create and send the transactions.
+        token: The default name of the token.
+        from_name: The default account name to send tokens from.
+        gas_per_transfer: The estimated gas used by one transfer. If the `IOST` client has a `gas_estimator`,
+            its estimate is used instead.
+        gas_margin: The factor applied to the estimated gas of a `Transaction` to get its `gas_limit`.
+        max_gas_limit: The highest `gas_limit` of a `Transaction`.
+        max_tx_size: The highest serialized size of a `Transaction` in bytes, including a reserve for its signatures.
+        max_actions: The highest number of transfers in a `Transaction`.
+
+    Example:
+        >>> bulk = BulkTransfer(iost, 'iost', 'admin')
+        >>> for name, amount in payouts.items():
+        >>>     bulk.add(name, amount, 'payout')
+        >>> failed = [t for t in bulk.send() if not t.success]
+    """
+
+    TX_SIZE_RESERVE = 1024  #: The number of bytes reserved for the fixed fields and the signatures of a `Transaction`.
+
+    def __init__(self, iost: IOST, token: str = 'iost', from_name: str = None,
+                 gas_per_transfer: float = 10000.0, gas_margin: float = 1.2,
+                 max_gas_limit: float = 4000000.0, max_tx_size: int = 65536, max_actions: int = 1000):
+        self.token: str = token
+        self.from_name: str = from_name
+        self.gas_per_transfer: float = gas_per_transfer
+        self.gas_margin: float = gas_margin
+        self.max_gas_limit: float = max_gas_limit
+        self.max_tx_size: int = max_tx_size
+        self.max_actions: int = max_actions
+        self.transfers: List[Transfer] = []
+        self._iost: IOST = iost
+        self._batches: List[List[Transfer]] = []
+
+    def __len__(self) -> int:
+        return len(self.transfers)
+
+    def add(self, to_name: str, amount: float, memo: str = '', token: str = None, from_name: str = None,
+            decimal: int = None) -> BulkTransfer:
+        """Adds a transfer.
+
+        Args:
+            to_name: The account name to send tokens to.
+            amount: The amount of tokens to send, formatted with the precision of the token by `IOST.format_amount`.
+            memo: A text to add to the transfer.
+            token: The name of the token, by default `token`.
+            from_name: The account name to send tokens from, by default `from_name`.
+            decimal: The precision of the token, to format the amount without fetching its `TokenInfo`.
+
+        Returns:
+            Itself.
+        """
+        from_name = from_name or self.from_name
+        if from_name is None:
+            raise ValueError('No account to send tokens from.')
+        token = token or self.token
+        amount = self._iost.format_amount(token, amount, decimal)
+        self.transfers.append(Transfer(token, from_name, to_name, amount, memo))
+        return self
+
+    def build(self) -> List[Transaction]:
+        """Packs the transfers into transactions.
+
+        Returns:
+            The list of `Transaction`, in the order of the transfers.
+        """
+        gas_per_transfer = self._gas_per_transfer()
+        max_transfers = min(self.max_actions, int(self.max_gas_limit / (gas_per_transfer * self.gas_margin)))
+        self._batches = []
+        txs = []
+        batch = []
+        size = self.TX_SIZE_RESERVE
+        for transfer in self.transfers:
+            action = transfer.to_action()
+            action_size = len(action.to_bytes()) + 4
+            if batch and (len(batch) >= max(1, max_transfers) or size + action_size > self.max_tx_size):
+                txs.append(self._create_tx(batch, gas_per_transfer))
+                batch = []
+                size = self.TX_SIZE_RESERVE
+            batch.append(transfer)
+            size += action_size
+        if batch:
+            txs.append(self._create_tx(batch, gas_per_transfer))
+        return txs
+
+    def send(self, wait: bool = True) -> List[Transfer]:
+        """Builds and sends the transactions, then waits for their receipts.
+        All the transactions are sent before the first receipt is waited for.
+
+        Args:
+            wait: If False, returns as soon as the transactions are sent, without the outcome of the transfers.
+
+        Returns:
+            The list of `Transfer`, with their `tx_hash` and, if `wait` is True, their `success`.
+        """
+        txs = self.build()
+        hashes = []
+        for tx, batch in zip(txs, self._batches):
+            tx_hash = self._iost.send_tx(tx)
+            hashes.append(tx_hash)
+            for transfer in batch:
+                transfer.tx_hash = tx_hash
+        if wait:
+            for tx_hash, batch in zip(hashes, self._batches):
+                try:
+                    receipt = self._iost.wait_tx(tx_hash)
+                except TransactionError as e:
+                    receipt = e.receipt
+                    if receipt is None:
+                        self._set_failed(batch, str(e))
+                        continue
+                except TimeoutError as e:
+                    self._set_failed(batch, str(e))
+                    continue
+                self.read_receipt(batch, receipt)
+        return self.transfers
+
+    @staticmethod
+    def read_receipt(batch: List[Transfer], receipt: TxReceipt) -> None:
+        """Sets the outcome of the transfers of a `Transaction` from its `TxReceipt`.
+        The n-th ``token.iost/transfer`` receipt is matched with the n-th transfer.
+
+        Args:
+            batch: The list of `Transfer` of the `Transaction`, in order.
+            receipt: The `TxReceipt` of the `Transaction`.
+        """
+        if not receipt.is_success():
+            BulkTransfer._set_failed(batch, receipt.message)
+            return
+        executed = sum(1 for r in receipt.receipts if r.func_name == 'token.iost/transfer')
+        for i, transfer in enumerate(batch):
+            transfer.success = i < executed
+            if not transfer.success:
+                transfer.error = 'No receipt for this transfer.'
+
+    @staticmethod
+    def amount_limits(batch: List[Transfer]) -> Dict[str, str]:
+        """Sums the amounts of transfers by token.
+
+        Args:
+            batch: A list of `Transfer`.
+
+        Returns:
+            The total amount as a string by token name.
+        """
+        totals = {}
+        for transfer in batch:
+            totals[transfer.token] = totals.get(transfer.token, Decimal(0)) + Decimal(transfer.amount)
+        return {token: format(total.normalize(), 'f') for token, total in totals.items()}
+
+    @staticmethod
+    def _set_failed(batch: List[Transfer], error: str) -> None:
+        for transfer in batch:
+            transfer.success = False
+            transfer.error = error
+
+    def _gas_per_transfer(self) -> float:
+        estimator = self._iost.gas_estimator
+        if estimator is None or not self.transfers:
+            return self.gas_per_transfer
+        gas, _ = estimator.estimate([self.transfers[0].to_action()])
+        return gas
+
+    def _create_tx(self, batch: List[Transfer], gas_per_transfer: float) -> Transaction:
+        tx = self._iost.create_tx(actions=[t.to_action() for t in batch])
+        for token, total in self.amount_limits(batch).items():
+            tx.add_amount_limit(token, total)
+        tx.gas_limit = float(min(self.max_gas_limit, _ceil(gas_per_transfer * len(batch) * self.gas_margin)))
+        self._batches.append(batch)
+        return tx
@@ -0,0 +1,436 @@
+from __future__ import annotations
+import json
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Dict, Set, TYPE_CHECKING
+
+from pyost.contract import Contract
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+    from pyost.account import AccountInfo, TokenBalance
+    from pyost.blockchain import Block
+    from pyost.follower import BlockFollower
+
+
+class TTLCache:
+    """A thread-safe mapping whose entries expire after a time to live,
+    the least recently used entries are evicted when it is full.
+
+    Args:
+        maxsize: The maximum number of entries.
+        ttl: The number of seconds an entry is valid after it has been set.
+        timer: The function that returns the current time in seconds.
+
+    Attributes:
+        maxsize: The maximum number of entries.
+        ttl: The number of seconds an entry is valid after it has been set.
+        hits: The number of successful lookups.
+        misses: The number of failed lookups, including expired entries.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, timer: Callable[[], float] = time.monotonic):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._timer: Callable[[], float] = timer
+        self._data: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value of a key if it has not expired.
+
+        Args:
+            key: The key.
+            default: The value returned if the key is missing or has expired.
+
+        Returns:
+            The cached value or `default`.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expires, value = item
+            if expires <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """Sets the value of a key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The key.
+            value: The value.
+            ttl: The time to live of this entry, by default the cache's `ttl`.
+        """
+        with self._lock:
+            self._data[key] = (self._timer() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes a key.
+
+        Args:
+            key: The key.
+            default: The value returned if the key is missing.
+
+        Returns:
+            The removed value, expired or not, or `default`.
+        """
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class AccountCache:
+    """Caches the `AccountInfo` and token balances of accounts, and drops those of the accounts
+    mentioned by the transactions of new blocks.
+
+    An account is mentioned by a `Transaction` when it is its publisher, one of its signers,
+    or a string argument of one of its actions or receipts, such as the recipient of a transfer.
+    Fed by a `BlockFollower`, the entries stay valid until the account changes,
+    the `ttl` only bounds the staleness of the changes that are not seen in the blocks.
+
+    The data is read from the longest chain by default, the same as the head blocks of `BlockFollower`.
+    A fetch that overlaps an invalidation is returned but not cached, since it may predate the change.
+
+    Args:
+        iost: The `IOST` client used to fetch the accounts.
+        maxsize: The maximum number of accounts, and of balances.
+        ttl: The number of seconds an entry is valid.
+        by_longest_chain: If True, gets data from the longest chain's head block instead of the last irreversible block.
+        timer: The function that returns the current time in seconds.
+
+    Attributes:
+        infos: The `TTLCache` of `AccountInfo` by account name.
+        balances: The `TTLCache` of `TokenBalance` by account name and token.
+        invalidations: The number of entries dropped because their account was mentioned in a block.
+
+    Example:
+        >>> cache = AccountCache(iost).follow(BlockFollower(iost).start())
+        >>> cache.get_balance('bob')
+    """
+
+    def __init__(self, iost: IOST, maxsize: int = 4096, ttl: float = 30.0, by_longest_chain: bool = True,
+                 timer: Callable[[], float] = time.monotonic):
+        self.infos: TTLCache = TTLCache(maxsize, ttl, timer)
+        self.balances: TTLCache = TTLCache(maxsize, ttl, timer)
+        self.by_longest_chain: bool = by_longest_chain
+        self.invalidations: int = 0
+        self._iost: IOST = iost
+        self._tokens: Set[str] = set()
+        self._generation: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def get_account_info(self, account_name: str) -> AccountInfo:
+        """Gets information about an account, from the cache if possible.
+
+        Args:
+            account_name: The name of the account.
+
+        Returns:
+            An `AccountInfo` object, shared with the other callers, that must not be modified.
+        """
+        info = self.infos.get(account_name)
+        if info is None:
+            generation = self._generation
+            info = self._iost.get_account_info(account_name, self.by_longest_chain)
+            self._put(self.infos, account_name, info, generation)
+        return info
+
+    def get_token_balance(self, account_name: str, token: str = 'iost') -> TokenBalance:
+        """Gets an account's token balance, from the cache if possible.
+
+        Args:
+            account_name: The name of the account.
+            token: The name of the token, default ``iost``.
+
+        Returns:
+            A `TokenBalance` object, shared with the other callers, that must not be modified.
+        """
+        key = (account_name, token)
+        balance = self.balances.get(key)
+        if balance is None:
+            generation = self._generation
+            balance = self._iost.get_token_balance(account_name, token, self.by_longest_chain)
+            self._tokens.add(token)
+            self._put(self.balances, key, balance, generation)
+        return balance
+
+    def get_balance(self, account_name: str, token: str = 'iost') -> float:
+        """Gets an account's token balance as a number.
+        The ``iost`` balance is read from a cached `AccountInfo` when there is one.
+
+        Args:
+            account_name: The name of the account.
+            token: The name of the token, default ``iost``.
+
+        Returns:
+            The token balance of the account.
+        """
+        if token == 'iost':
+            info = self.infos.get(account_name)
+            if info is not None:
+                return info.balance
+        return self.get_token_balance(account_name, token).balance
+
+    def invalidate(self, account_names: Iterable[str]) -> int:
+        """Drops the cached data of accounts.
+
+        Args:
+            account_names: The names of the accounts.
+
+        Returns:
+            The number of entries dropped.
+        """
+        count = 0
+        with self._lock:
+            self._generation += 1
+            for name in account_names:
+                if self.infos.pop(name) is not None:
+                    count += 1
+                for token in tuple(self._tokens):
+                    if self.balances.pop((name, token)) is not None:
+                        count += 1
+            self.invalidations += count
+        return count
+
+    def on_block(self, block: Block) -> None:
+        """Drops the cached data of the accounts mentioned by the transactions of a block.
+
+        Args:
+            block: The complete `Block`.
+        """
+        names = set()
+        for tx in block.transactions:
+            names.add(tx.publisher)
+            names.update(signer.split('@', 1)[0] for signer in tx.signers)
+            for action in tx.actions:
+                _add_strings(names, action.data)
+            if tx.tx_receipt is not None:
+                for receipt in tx.tx_receipt.receipts:
+                    _add_strings(names, receipt.content)
+        names.discard('')
+        self.invalidate(names)
+
+    def follow(self, follower: BlockFollower) -> AccountCache:
+        """Invalidates the cache with the blocks handed out by a `BlockFollower`.
+
+        Args:
+            follower: A `BlockFollower` that fetches complete blocks.
+
+        Returns:
+            Itself.
+
+        Raises:
+            ValueError: If the follower does not fetch complete blocks.
+        """
+        if not follower.complete:
+            raise ValueError('The follower must fetch complete blocks.')
+        follower.add_listener(self.on_block)
+        return self
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        with self._lock:
+            self._generation += 1
+            self.infos.clear()
+            self.balances.clear()
+
+    def _put(self, cache: TTLCache, key: Hashable, value: Any, generation: int) -> None:
+        # An invalidation since the fetch started may have dropped a newer value, do not cache a stale one.
+        with self._lock:
+            if self._generation == generation:
+                cache.put(key, value)
+
+
+class ABICache:
+    """Keeps the `Contract.ABI` of contracts, to check the arguments of calls without fetching
+    the contracts and their code each time.
+
+    The ABIs are stored with the version of their contract and, if `path` is set, saved to a JSON file
+    that is loaded by the next `ABICache`. The version of a contract loaded from the file is checked
+    against the chain on its first use, and its ABIs are replaced if the contract has been updated since.
+    Fed by a `BlockFollower`, the contracts updated by ``system.iost/updateCode`` are fetched again on next use.
+
+    Args:
+        iost: The `IOST` client used to fetch the contracts.
+        path: The path of the JSON file, None to keep the ABIs in memory only.
+
+    Example:
+        >>> iost.abi_cache = ABICache(iost, 'abis.json')
+        >>> iost.create_call_tx('token.iost', 'transfer', 'iost', 'admin', 'bob', 10)  # 10 becomes '10'
+        >>> iost.create_call_tx('token.iost', 'transfer', 'iost', 'bob')
+        ValueError: transfer takes 5 arguments (string, string, string, string, string), got 2.
+    """
+
+    def __init__(self, iost: IOST, path: str = None):
+        self.path: str = path
+        self._iost: IOST = iost
+        self._contracts: Dict[str, Contract] = {}
+        self._unverified: Set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                for contract_id, d in json.load(f).items():
+                    contract = Contract(contract_id, version=d['version'])
+                    contract.abis = [Contract.ABI().from_json(abi) for abi in d['abis']]
+                    self._contracts[contract_id] = contract
+                    self._unverified.add(contract_id)
+
+    def __contains__(self, contract_id: str) -> bool:
+        return contract_id in self._contracts
+
+    def get_contract(self, contract_id: str) -> Contract:
+        """Gets the ABIs of a contract, fetching it on first use.
+        A contract loaded from `path` is fetched on first use too, to check its version.
+
+        Args:
+            contract_id: The contract id, such as ``token.iost``.
+
+        Returns:
+            A `Contract` object without `code`.
+
+        Raises:
+            grpc.RpcError: If the contract cannot be fetched.
+        """
+        contract = self._contracts.get(contract_id)
+        if contract is None or contract_id in self._unverified:
+            fetched = self._iost.get_contract(contract_id)
+            with self._lock:
+                self._unverified.discard(contract_id)
+                if contract is not None and contract.version == fetched.version:
+                    return contract
+                contract = Contract(contract_id, language=fetched.language, version=fetched.version)
+                contract.abis = fetched.abis
+                self._contracts[contract_id] = contract
+                self._save()
+        return contract
+
+    def get_abi(self, contract_id: str, abi: str) -> Contract.ABI:
+        """Gets the ABI of a function of a contract.
+
+        Args:
+            contract_id: The contract id.
+            abi: The name of the function.
+
+        Returns:
+            A `Contract.ABI` object.
+
+        Raises:
+            ValueError: If the contract has no such function.
+            grpc.RpcError: If the contract cannot be fetched.
+        """
+        for contract_abi in self.get_contract(contract_id).abis:
+            if contract_abi.name == abi:
+                return contract_abi
+        raise ValueError(f'Contract {contract_id} has no abi {abi}.')
+
+    def check_args(self, contract_id: str, abi: str, args: List[Any]) -> List[Any]:
+        """Checks the arguments of a call with `Contract.ABI.check_args`.
+
+        Args:
+            contract_id: The contract id.
+            abi: The name of the function.
+            args: The arguments to pass to the function.
+
+        Returns:
+            The converted arguments.
+
+        Raises:
+            ValueError: If the function does not exist or if the arguments do not match its ABI.
+            grpc.RpcError: If the contract cannot be fetched.
+        """
+        return self.get_abi(contract_id, abi).check_args(args)
+
+    def invalidate(self, contract_id: str) -> None:
+        """Drops the ABIs of a contract, so that it is fetched again on next use.
+
+        Args:
+            contract_id: The contract id.
+        """
+        with self._lock:
+            self._unverified.discard(contract_id)
+            if self._contracts.pop(contract_id, None) is not None:
+                self._save()
+
+    def on_block(self, block: Block) -> None:
+        """Drops the ABIs of the contracts updated by the transactions of a block.
+
+        Args:
+            block: The complete `Block`.
+        """
+        for tx in block.transactions:
+            for action in tx.actions:
+                if action.contract == 'system.iost' and action.action_name == 'updateCode':
+                    try:
+                        self.invalidate(json.loads(json.loads(action.data)[0])['ID'])
+                    except (ValueError, KeyError, IndexError, TypeError):
+                        continue
+
+    def follow(self, follower: BlockFollower) -> ABICache:
+        """Invalidates the cache with the blocks handed out by a `BlockFollower`.
+
+        Args:
+            follower: A `BlockFollower` that fetches complete blocks.
+
+        Returns:
+            Itself.
+
+        Raises:
+            ValueError: If the follower does not fetch complete blocks.
+        """
+        if not follower.complete:
+            raise ValueError('The follower must fetch complete blocks.')
+        follower.add_listener(self.on_block)
+        return self
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {contract.id: {'version': contract.version, 'abis': [abi.to_dict() for abi in contract.abis]}
+                for contract in self._contracts.values()}
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+
+def _add_strings(names: Set[str], data: str) -> None:
+    try:
+        values = [json.loads(data)] if data else []
+    except ValueError:
+        return
+    while values:
+        value = values.pop()
+        if isinstance(value, str):
+            names.add(value)
+        elif isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, dict):
+            values.extend(value.values())
+
+
+_MISSING = object()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+from typing import List, Tuple, Any
+
+from pyost.lazy import lazy_import
+
+grpc = lazy_import('grpc')
+aio = lazy_import('grpc.aio')
+
+
+class ChannelConfig:
+    """Describes how the gRPC channels to a node are created.
+
+    A single HTTP/2 connection limits the number of concurrent calls, so `channels` connections
+    can be opened to the same node, and the unary calls are spread across them in round robin.
+
+    Args:
+        compression: The compression of the calls, ``gzip``, ``deflate`` or None.
+        max_receive_message_length: The maximum size of a response in bytes, -1 for unlimited.
+            Complete blocks can exceed the 4 MiB default of gRPC.
+        max_send_message_length: The maximum size of a request in bytes, -1 for unlimited.
+        keepalive_time_ms: The interval of the keepalive pings, so that idle proxies do not cut
+            long-lived ``Subscribe`` streams. None disables them.
+        keepalive_timeout_ms: How long to wait for the acknowledgement of a keepalive ping.
+        keepalive_permit_without_calls: Whether to send keepalive pings when there is no call in progress.
+        channels: The number of connections to open to the node.
+        secure: Whether to connect with TLS.
+        root_certificates: The PEM root certificates for TLS, the system ones by default.
+        options: Other gRPC channel arguments, such as ``[('grpc.primary_user_agent', 'bot')]``.
+
+    Example:
+        >>> iost = IOST(url, channel_config=ChannelConfig.profile('bulk-ingest', secure=True))
+    """
+
+    def __init__(self, compression: str = None,
+                 max_receive_message_length: int = None, max_send_message_length: int = None,
+                 keepalive_time_ms: int = None, keepalive_timeout_ms: int = 20000,
+                 keepalive_permit_without_calls: bool = False, channels: int = 1,
+                 secure: bool = False, root_certificates: bytes = None,
+                 options: List[Tuple[str, Any]] = None):
+        if compression not in (None, 'gzip', 'deflate'):
+            raise ValueError(f'Unknown compression {compression}.')
+        if channels < 1:
+            raise ValueError('channels must be at least 1.')
+        self.compression: str = compression
+        self.max_receive_message_length: int = max_receive_message_length
+        self.max_send_message_length: int = max_send_message_length
+        self.keepalive_time_ms: int = keepalive_time_ms
+        self.keepalive_timeout_ms: int = keepalive_timeout_ms
+        self.keepalive_permit_without_calls: bool = keepalive_permit_without_calls
+        self.channels: int = channels
+        self.secure: bool = secure
+        self.root_certificates: bytes = root_certificates
+        self.options: List[Tuple[str, Any]] = list(options or [])
+
+    @classmethod
+    def profile(cls, name: str, **overrides) -> ChannelConfig:
+        """Creates a `ChannelConfig` from one of the `PROFILES`.
+
+        Args:
+            name: The name of the profile, such as ``bulk-ingest`` or ``low-latency``.
+            **overrides: The arguments of `ChannelConfig` that replace those of the profile.
+
+        Returns:
+            A `ChannelConfig` object.
+
+        Raises:
+            ValueError: If the profile does not exist.
+        """
+        if name not in PROFILES:
+            raise ValueError(f'Unknown channel profile {name}, expected one of {", ".join(PROFILES)}.')
+        return cls(**dict(PROFILES[name], **overrides))
+
+    def grpc_options(self) -> List[Tuple[str, Any]]:
+        """Gets the gRPC channel arguments.
+
+        Returns:
+            A list of ``(key, value)`` tuples.
+        """
+        options = []
+        if self.max_receive_message_length is not None:
+            options.append(('grpc.max_receive_message_length', self.max_receive_message_length))
+        if self.max_send_message_length is not None:
+            options.append(('grpc.max_send_message_length', self.max_send_message_length))
+        if self.keepalive_time_ms is not None:
+            options.append(('grpc.keepalive_time_ms', self.keepalive_time_ms))
+            options.append(('grpc.keepalive_timeout_ms', self.keepalive_timeout_ms))
+            options.append(('grpc.keepalive_permit_without_calls', int(self.keepalive_permit_without_calls)))
+            options.append(('grpc.http2.max_pings_without_data', 0))
+        if self.channels > 1:
+            # Without it, channels with the same arguments share their connections.
+            options.append(('grpc.use_local_subchannel_pool', 1))
+        return options + self.options
+
+    def create_channel(self, url: str) -> grpc.Channel:
+        """Creates a single channel to a node.
+
+        Args:
+            url: The URL of the node including port number.
+
+        Returns:
+            A `grpc.Channel`.
+        """
+        if self.secure:
+            credentials = grpc.ssl_channel_credentials(self.root_certificates)
+            return grpc.secure_channel(url, credentials, self.grpc_options(), self._compression())
+        return grpc.insecure_channel(url, self.grpc_options(), self._compression())
+
+    def create_aio_channel(self, url: str) -> aio.Channel:
+        """Creates a single ``grpc.aio`` channel to a node, `channels` is ignored.
+
+        Args:
+            url: The URL of the node including port number.
+
+        Returns:
+            A `grpc.aio.Channel`.
+        """
+        if self.secure:
+            credentials = grpc.ssl_channel_credentials(self.root_certificates)
+            return aio.secure_channel(url, credentials, self.grpc_options(), self._compression())
+        return aio.insecure_channel(url, self.grpc_options(), self._compression())
+
+    def create_channels(self, url: str) -> List[grpc.Channel]:
+        """Creates the `channels` to a node.
+
+        Args:
+            url: The URL of the node including port number.
+
+        Returns:
+            A list of `grpc.Channel`.
+        """
+        return [self.create_channel(url) for _ in range(self.channels)]
+
+    def _compression(self):
+        if self.compression == 'gzip':
+            return grpc.Compression.Gzip
+        if self.compression == 'deflate':
+            return grpc.Compression.Deflate
+        return None
+
+
+PROFILES = {
+    'default': {},
+    'bulk-ingest': {
+        'compression': 'gzip',
+        'max_receive_message_length': 256 * 1024 * 1024,
+        'max_send_message_length': 64 * 1024 * 1024,
+        'keepalive_time_ms': 60000,
+        'channels': 4,
+    },
+    'low-latency': {
+        'max_receive_message_length': 64 * 1024 * 1024,
+        'keepalive_time_ms': 10000,
+        'keepalive_timeout_ms': 5000,
+        'keepalive_permit_without_calls': True,
+        'channels': 2,
+    },
+    'streaming': {
+        'max_receive_message_length': 64 * 1024 * 1024,
+        'keepalive_time_ms': 30000,
+        'keepalive_permit_without_calls': True,
+    },
+}  #: The arguments of `ChannelConfig` of each profile.
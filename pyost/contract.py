@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Sequence, Any
 import json
-from pprint import pformat
-from protobuf_to_dict import protobuf_to_dict
-from pyost.rpc.pb import rpc_pb2 as pb
 from pyost.transaction import AmountLimit
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+pprint = lazy_import('pprint')
 
 
 class Contract:
@@ -23,7 +24,7 @@ class Contract:
 
         Attributes:
             name: The name of the function.
-            args: The list of the function's argument names.
+            args: The list of the function's argument types, such as ``string``, ``number``, ``bool`` or ``json``.
             amount_limit: A list of `AmountLimit` objects.
         """
         def __init__(self):
@@ -32,7 +33,10 @@ class Contract:
             self.amount_limit: List[AmountLimit] = []
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'ABI(name={self.name!r}, args={len(self.args)})'
 
         def from_raw(self, abi: pb.Contract.ABI) -> Contract.ABI:
             """Deserializes a protobuf object to update this object's members.
@@ -44,7 +48,7 @@ class Contract:
                 Itself.
             """
             self.name = abi.name
-            self.args = abi.args
+            self.args = list(abi.args)
             self.amount_limit = [AmountLimit().from_raw(al) for al in abi.amount_limit
                                  ] if abi.amount_limit is not None else []
             return self
@@ -101,6 +105,27 @@ class Contract:
                 d['amountLimit'] = [{'token': al.token, 'val': al.value} for al in self.amount_limit]
             return d
 
+        def check_args(self, args: Sequence[Any]) -> List[Any]:
+            """Checks arguments against the types of the function's arguments, and converts them if possible.
+
+            Integers are converted to ``string`` arguments, numeric strings to ``number`` arguments,
+            and ``true`` or ``false`` to ``bool`` arguments. ``json`` arguments and unknown types are not checked.
+
+            Args:
+                args: The arguments to pass to the function.
+
+            Returns:
+                The converted arguments.
+
+            Raises:
+                ValueError: If the number of arguments is wrong, or if an argument cannot be converted,
+                    such as a float passed as a ``string``, whose precision is unknown.
+            """
+            if len(args) != len(self.args):
+                raise ValueError(f'{self.name} takes {len(self.args)} arguments ({", ".join(self.args)}), '
+                                 f'got {len(args)}.')
+            return [_check_arg(self.name, i, arg_type, arg) for i, (arg_type, arg) in enumerate(zip(self.args, args))]
+
     def __init__(self, id: str = '', code: str = '', language: str = '', version: str = ''):
         self.id: str = id
         self.code: str = code
@@ -109,7 +134,10 @@ class Contract:
         self.abis: List[Contract.ABI] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Contract(id={self.id!r}, language={self.language!r}, abis={len(self.abis)})'
 
     def from_raw(self, c: pb.Contract) -> Contract:
         """Deserializes a protobuf object to update this object's members.
@@ -142,6 +170,20 @@ class Contract:
             abis=[abi.to_raw() for abi in self.abis]
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object, the `abis` are converted by `ABI.to_dict`.
+        """
+        return {
+            'id': self.id,
+            'code': self.code,
+            'language': self.language,
+            'version': self.version,
+            'abis': [abi.to_dict() for abi in self.abis]
+        }
+
     def from_json(self, d: dict) -> Contract:
         """Deserializes a dictionary to update this object's members.
 
@@ -184,6 +226,40 @@ class Contract:
         })
 
 
+def _check_arg(abi: str, index: int, arg_type: str, arg: Any) -> Any:
+    if isinstance(arg, bytes):
+        arg = arg.decode('utf-8')
+    is_number = isinstance(arg, (int, float)) and not isinstance(arg, bool)
+    if arg_type == 'string':
+        if isinstance(arg, str):
+            return arg
+        if isinstance(arg, float):
+            # str() would write the binary rounding error of a float, such as 0.30000000000000004.
+            raise ValueError(f'Argument {index} of {abi} must be a string, got the float {arg!r}: '
+                             f'format it with the precision of its token, see TokenInfo.format_amount.')
+        if is_number:
+            return str(arg)
+    elif arg_type == 'number':
+        if is_number:
+            return arg
+        if isinstance(arg, str):
+            try:
+                return int(arg)
+            except ValueError:
+                try:
+                    return float(arg)
+                except ValueError:
+                    pass
+    elif arg_type == 'bool':
+        if isinstance(arg, bool):
+            return arg
+        if arg in ('true', 'false'):
+            return arg == 'true'
+    else:
+        return arg
+    raise ValueError(f'Argument {index} of {abi} must be a {arg_type}, got {arg!r}.')
+
+
 if __name__ == '__main__':
     with open('../examples/contract/lucky_bet.js.abi', 'r') as f:
         import json
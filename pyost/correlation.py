@@ -0,0 +1,227 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from pyost.blockchain import Block
+from pyost.transaction import TxReceipt, TransactionError
+from pyost.follower import BlockFollower
+from pyost.lazy import lazy_import
+
+futures = lazy_import('concurrent.futures')
+
+
+class TxTracker:
+    """Tracks the stages of a sent `Transaction` with a `Future` per stage.
+
+    The `packed` and `irreversible` futures are resolved with the `TxReceipt` of the transaction,
+    or with a TransactionError if its status code is not ``SUCCESS``, or a TimeoutError
+    if the transaction expires or its status code is ``TIMEOUT``.
+
+    Args:
+        tx_hash: The base58 hash string of the `Transaction`.
+        expiration: The expiration time of the `Transaction` in nanoseconds, 0 if unknown.
+
+    Attributes:
+        tx_hash: The base58 hash string of the `Transaction`.
+        expiration: The expiration time of the `Transaction` in nanoseconds, 0 if unknown.
+        registered: The `time.monotonic` time when the tracking started.
+        block_number: The number of the block that contains the `Transaction`, None if not packed yet.
+        pre_receipt: A `Future` resolved with the `TxReceipt` of the pre-execution done by `IOST.send_tx`.
+        packed: A `Future` resolved when the `Transaction` is packed in a block.
+        irreversible: A `Future` resolved when the block that contains the `Transaction` is irreversible.
+    """
+
+    def __init__(self, tx_hash: str, expiration: int = 0):
+        self.tx_hash: str = tx_hash
+        self.expiration: int = expiration
+        self.registered: float = time.monotonic()
+        self.block_number: int = None
+        self.pre_receipt: futures.Future = futures.Future()
+        self.packed: futures.Future = futures.Future()
+        self.irreversible: futures.Future = futures.Future()
+
+    def wait(self, timeout: float = None, irreversible: bool = False) -> TxReceipt:
+        """Waits for the `Transaction` to be packed, or to be irreversible.
+
+        Args:
+            timeout: The number of seconds to wait, None means forever.
+            irreversible: If True, waits for the ``irreversible`` stage instead of the ``packed`` one.
+
+        Returns:
+            The receipt of the `Transaction` as a `TxReceipt` object.
+
+        Raises:
+            TransactionError: If TxReceipt.StatusCode is not SUCCESS.
+            TimeoutError: If the transaction expired, TxReceipt.StatusCode is TIMEOUT or `timeout` passed.
+        """
+        future = self.irreversible if irreversible else self.packed
+        return future.result(timeout)
+
+    def _resolve(self, future: futures.Future, receipt: TxReceipt) -> None:
+        if future.done():
+            return
+        if receipt.status_code == TxReceipt.StatusCode.SUCCESS:
+            future.set_result(receipt)
+        elif receipt.status_code == TxReceipt.StatusCode.TIMEOUT:
+            future.set_exception(TimeoutError(receipt.message))
+        else:
+            future.set_exception(TransactionError(receipt.message, receipt))
+
+    def _fail(self, error: Exception) -> None:
+        for future in (self.pre_receipt, self.packed, self.irreversible):
+            if not future.done():
+                future.set_exception(error)
+
+
+class TxCorrelator:
+    """Matches the hashes of sent transactions against the receipts of the blocks handed out by a `BlockFollower`.
+
+    Once attached to an `IOST` client, every hash returned by `IOST.send_tx` is registered,
+    so no per-transaction polling RPC is needed to get the receipts.
+
+    Args:
+        max_recent: The number of receipts of unregistered transactions remembered,
+            for transactions packed before `IOST.send_tx` returned.
+        ttl: The number of seconds after which a transaction registered without expiration time
+            and not packed yet fails with a TimeoutError.
+
+    Example:
+        >>> correlator = TxCorrelator()
+        >>> correlator.attach(BlockFollower(iost).start())
+        >>> iost.correlator = correlator
+        >>> tracker = iost.send_and_track_tx(tx)
+        >>> tracker.packed.add_done_callback(lambda f: print(f.result()))
+    """
+
+    def __init__(self, max_recent: int = 100000, ttl: float = 600.0):
+        self.max_recent: int = max_recent
+        self.ttl: float = ttl
+        self._trackers: Dict[str, TxTracker] = {}
+        self._recent: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._trackers)
+
+    def attach(self, follower: BlockFollower) -> TxCorrelator:
+        """Adds `on_block`, `on_lib` and `on_fork` to the listeners of a `BlockFollower`.
+
+        Args:
+            follower: A `BlockFollower` that fetches complete blocks.
+
+        Returns:
+            Itself.
+        """
+        if not follower.complete:
+            raise ValueError('The follower must fetch complete blocks.')
+        follower.add_listener(self.on_block)
+        follower.add_lib_listener(self.on_lib)
+        follower.add_fork_listener(self.on_fork)
+        return self
+
+    def register(self, tx_hash: str, pre_receipt: TxReceipt = None, expiration: int = 0) -> TxTracker:
+        """Starts tracking a transaction.
+
+        Args:
+            tx_hash: The base58 hash string of the `Transaction`.
+            pre_receipt: The `TxReceipt` of the pre-execution returned by the node, if any.
+            expiration: The expiration time of the `Transaction` in nanoseconds.
+
+        Returns:
+            A `TxTracker`, the same one if the hash is already registered.
+        """
+        with self._lock:
+            tracker = self._trackers.get(tx_hash)
+            if tracker is None:
+                tracker = TxTracker(tx_hash, expiration)
+                self._trackers[tx_hash] = tracker
+            recent: Tuple[int, TxReceipt] = self._recent.pop(tx_hash, None)
+
+        if pre_receipt is not None and not tracker.pre_receipt.done():
+            tracker.pre_receipt.set_result(pre_receipt)
+        if recent is not None:
+            tracker.block_number = recent[0]
+            tracker._resolve(tracker.packed, recent[1])
+        return tracker
+
+    def get(self, tx_hash: str) -> TxTracker:
+        """Returns the `TxTracker` of a registered transaction, or None."""
+        return self._trackers.get(tx_hash)
+
+    def forget(self, tx_hash: str) -> None:
+        """Stops tracking a transaction, its pending futures are cancelled."""
+        with self._lock:
+            tracker = self._trackers.pop(tx_hash, None)
+        if tracker is not None:
+            for future in (tracker.pre_receipt, tracker.packed, tracker.irreversible):
+                future.cancel()
+
+    def on_block(self, block: Block) -> None:
+        """Resolves the ``packed`` stage of the registered transactions contained in a complete `Block`.
+
+        Args:
+            block: A `Block` fetched with ``complete=True``.
+        """
+        expired = []
+        with self._lock:
+            matched = []
+            for tx in block.transactions:
+                if tx.tx_receipt is None:
+                    continue
+                tracker = self._trackers.get(tx.hash)
+                if tracker is not None:
+                    matched.append((tracker, tx.tx_receipt))
+                else:
+                    self._recent[tx.hash] = (block.number, tx.tx_receipt)
+            while len(self._recent) > self.max_recent:
+                self._recent.popitem(last=False)
+            now = time.monotonic()
+            for tx_hash, tracker in self._trackers.items():
+                if tracker.block_number is not None:
+                    continue
+                if 0 < tracker.expiration < block.time or \
+                        (tracker.expiration == 0 and tracker.registered + self.ttl < now):
+                    expired.append(tx_hash)
+            for tx_hash in expired:
+                expired_tracker = self._trackers.pop(tx_hash)
+                expired_tracker._fail(TimeoutError(f'Transaction {tx_hash} expired before being packed.'))
+
+        for tracker, receipt in matched:
+            # A fork may hand out the same transaction again in another block.
+            tracker.block_number = block.number
+            tracker._resolve(tracker.packed, receipt)
+
+    def on_fork(self, block_number: int) -> None:
+        """Forgets the blocks of the transactions packed in a block removed by a fork,
+        so that they are not resolved as irreversible until they are packed again.
+        Their ``packed`` stage stays resolved, and they expire if the new branch does not contain them.
+
+        Args:
+            block_number: The number of the removed block.
+        """
+        with self._lock:
+            for tracker in self._trackers.values():
+                if tracker.block_number is not None and tracker.block_number >= block_number:
+                    tracker.block_number = None
+            for tx_hash in [h for h, (number, _) in self._recent.items() if number >= block_number]:
+                del self._recent[tx_hash]
+
+    def on_lib(self, lib_block: int) -> None:
+        """Resolves the ``irreversible`` stage of the transactions packed up to a block.
+
+        Args:
+            lib_block: The last irreversible block number.
+        """
+        with self._lock:
+            done = [tracker for tracker in self._trackers.values()
+                    if tracker.block_number is not None and tracker.block_number <= lib_block]
+            for tracker in done:
+                del self._trackers[tracker.tx_hash]
+
+        for tracker in done:
+            if tracker.packed.exception() is None:
+                tracker.irreversible.set_result(tracker.packed.result())
+            else:
+                tracker.irreversible.set_exception(tracker.packed.exception())
@@ -1,4 +1,10 @@
-from typing import List
+import struct
+from typing import List, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 KOOPMAN = 0xeb31d82e
 
@@ -24,6 +30,27 @@ def make_table(poly: int = KOOPMAN):
     return table
 
 
+def make_slicing_tables(poly: int = KOOPMAN, table: List[int] = None) -> List[List[int]]:
+    """Create the 8 tables of the slicing-by-8 algorithm for a polynomial.
+
+    Args:
+        poly: The polynomial function.
+        table: The table created by `make_table` for this polynomial, if already computed.
+
+    Returns:
+        A list of 8 tables, the first one is the table of `make_table`.
+    """
+    tables = [table or make_table(poly)]
+    for k in range(1, 8):
+        prev = tables[k - 1]
+        tables.append([(prev[i] >> 8) ^ tables[0][prev[i] & 0xff] for i in range(256)])
+    return tables
+
+
+KOOPMAN_TABLE = make_table(KOOPMAN)  #: The table of the Koopman polynomial, computed once at import.
+KOOPMAN_SLICING_TABLES = make_slicing_tables(KOOPMAN, KOOPMAN_TABLE)  #: The slicing-by-8 tables of the Koopman polynomial.
+
+
 def checksum(data: bytes, table: List[int], crc: int = 0) -> int:
     """Calculates a checksum with a CRC code and a polynomial table.
 
@@ -41,8 +68,69 @@ def checksum(data: bytes, table: List[int], crc: int = 0) -> int:
     return ~ crc & 0xffffffff
 
 
+def checksum_slicing(data: bytes, tables: List[List[int]] = KOOPMAN_SLICING_TABLES, crc: int = 0) -> int:
+    """Calculates a checksum 8 bytes at a time with the slicing-by-8 algorithm.
+    Returns the same value as `checksum` with ``tables[0]``.
+
+    Args:
+        data: The data to calculate the checksum for.
+        tables: The tables created by `make_slicing_tables`.
+        crc: The CRC code.
+
+    Returns:
+        The checksum.
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+    crc = ~ crc & 0xffffffff
+    words = len(data) // 8
+    if words:
+        values = struct.unpack_from(f'<{2 * words}I', data)
+        for i in range(0, 2 * words, 2):
+            one = values[i] ^ crc
+            two = values[i + 1]
+            crc = (t7[one & 0xff] ^ t6[(one >> 8) & 0xff] ^ t5[(one >> 16) & 0xff] ^ t4[one >> 24] ^
+                   t3[two & 0xff] ^ t2[(two >> 8) & 0xff] ^ t1[(two >> 16) & 0xff] ^ t0[two >> 24])
+    for v in data[8 * words:]:
+        crc = t0[(crc ^ v) & 0xff] ^ (crc >> 8)
+    return ~ crc & 0xffffffff
+
+
+def checksum_many(buffers: Iterable[bytes], table: List[int] = KOOPMAN_TABLE) -> List[int]:
+    """Calculates the checksums of many buffers at once.
+
+    If NumPy is installed, the buffers of the same length are processed together,
+    one byte position at a time across all of them, otherwise they are processed one by one.
+
+    Args:
+        buffers: The data to calculate the checksums for.
+        table: The polynomial table created by `make_table`.
+
+    Returns:
+        The list of checksums, in the same order as `buffers`.
+    """
+    buffers = [bytes(b) for b in buffers]
+    if np is None or len(buffers) < 2:
+        tables = KOOPMAN_SLICING_TABLES if table is KOOPMAN_TABLE else make_slicing_tables(table=table)
+        return [checksum_slicing(b, tables) for b in buffers]
+
+    by_length = {}
+    for i, b in enumerate(buffers):
+        by_length.setdefault(len(b), []).append(i)
+
+    np_table = np.array(table, dtype=np.uint32)
+    result = [0] * len(buffers)
+    for length, indices in by_length.items():
+        data = np.frombuffer(b''.join(buffers[i] for i in indices), dtype=np.uint8).reshape(len(indices), length)
+        crc = np.full(len(indices), 0xffffffff, dtype=np.uint32)
+        for j in range(length):
+            crc = np_table[(crc ^ data[:, j]) & 0xff] ^ (crc >> 8)
+        for i, c in zip(indices, (~crc).tolist()):
+            result[i] = c
+    return result
+
+
 def parity(data: bytes, little_endian=True) -> bytes:
-    """Creates a polynomial table and calculates the checksum of a message.
+    """Calculates the checksum of a message with the Koopman polynomial.
 
     Args:
         data: The data to calculate the checksum for.
@@ -51,11 +139,24 @@ def parity(data: bytes, little_endian=True) -> bytes:
     Returns:
         The checksum.
     """
-    crc32q = make_table(KOOPMAN)
-    crc = checksum(data, crc32q)
+    crc = checksum_slicing(data, KOOPMAN_SLICING_TABLES)
     return crc.to_bytes(4, 'little' if little_endian else 'big')
 
 
+def parity_many(buffers: Iterable[bytes], little_endian=True) -> List[bytes]:
+    """Calculates the checksums of many messages at once with `checksum_many`.
+
+    Args:
+        buffers: The data to calculate the checksums for.
+        little_endian: Tells whether the data should be packed as little or big endian.
+
+    Returns:
+        The list of checksums, in the same order as `buffers`.
+    """
+    byteorder = 'little' if little_endian else 'big'
+    return [crc.to_bytes(4, byteorder) for crc in checksum_many(buffers)]
+
+
 if __name__ == '__main__':
     base = bytes.fromhex('12345abcde')
 
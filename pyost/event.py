@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import List
 from enum import Enum
-from pprint import pformat
-from protobuf_to_dict import protobuf_to_dict
-from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+pprint = lazy_import('pprint')
 
 
 class Event:
@@ -16,17 +17,25 @@ class Event:
     """
 
     class Topic(Enum):
-        CONTRACT_RECEIPT = pb.Event.CONTRACT_RECEIPT  #: Contract receipt.
-        CONTRACT_EVENT = pb.Event.CONTRACT_EVENT  #: Contract event.
+        CONTRACT_RECEIPT = 0  #: Contract receipt.
+        CONTRACT_EVENT = 1  #: Contract event.
         UNKNOWN = -1  #: Unknown topic.
 
+        @classmethod
+        def _missing_(cls, value):
+            # Topics added to the node after this SDK are not an error.
+            return cls.UNKNOWN
+
     def __init__(self):
         self.topic: Event.Topic = Event.Topic.UNKNOWN
         self.data: str = ''
         self.time: int = 0
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Event(topic={self.topic.name}, time={self.time}, data={len(self.data)} chars)'
 
     def from_raw(self, e: pb.Event) -> Event:
         """Deserializes a protobuf object to update this object's members.
@@ -37,7 +46,7 @@ class Event:
         Returns:
             Itself.
         """
-        self.topic = e.topic
+        self.topic = Event.Topic(e.topic)
         self.data = e.data
         self.time = e.time
         return self
@@ -49,11 +58,23 @@ class Event:
             A protobuf object.
         """
         return pb.Event(
-            topic=self.topic,
+            topic=self.topic.value,
             data=self.data,
             time=self.time
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'topic': self.topic.name,
+            'data': self.data,
+            'time': self.time
+        }
+
 
 class SubscribeRequest:
     """Used to send event subscription request to the API.
@@ -80,6 +101,9 @@ class SubscribeRequest:
         def __init__(self, contract_id: str = ''):
             self.contract_id: str = contract_id
 
+        def __repr__(self) -> str:
+            return f'Filter(contract_id={self.contract_id!r})'
+
         def from_raw(self, f: pb.SubscribeRequest.Filter) -> SubscribeRequest.Filter:
             """Deserializes a protobuf object to update this object's members.
 
@@ -102,12 +126,26 @@ class SubscribeRequest:
                 contract_id=self.contract_id
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'contract_id': self.contract_id
+            }
+
     def __init__(self, topics: List[Event.Topic] = None, contract_id: str = ''):
         self.topics: List[Event.Topic] = topics or []
         self.filter = SubscribeRequest.Filter(contract_id)
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'SubscribeRequest(topics={[topic.name for topic in self.topics]}, ' \
+            f'contract_id={self.filter.contract_id!r})'
 
     def from_raw(self, sr: pb.SubscribeRequest) -> SubscribeRequest:
         """Deserializes a protobuf object to update this object's members.
@@ -118,7 +156,7 @@ class SubscribeRequest:
         Returns:
             Itself.
         """
-        self.topics = Event.Topic(sr.topics)
+        self.topics = [Event.Topic(topic) for topic in sr.topics]
         self.filter = SubscribeRequest.Filter().from_raw(sr.filter)
         return self
 
@@ -132,3 +170,14 @@ class SubscribeRequest:
             topics=[topic.value for topic in self.topics],
             filter=self.filter.to_raw() if self.filter is not None else None
         )
+
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'topics': [topic.name for topic in self.topics],
+            'filter': self.filter.to_dict() if self.filter is not None else None
+        }
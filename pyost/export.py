@@ -0,0 +1,214 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Iterable, Any, TYPE_CHECKING
+
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+futures = lazy_import('concurrent.futures')
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+BLOCK_COLUMNS = (
+    ('number', 'i8'),
+    ('time', 'i8'),
+    ('gas_usage', 'f8'),
+    ('tx_count', 'i8'),
+    ('witness', 'U'),
+)  #: The names and NumPy types of the columns of the block table.
+
+TX_COLUMNS = (
+    ('block_number', 'i8'),
+    ('hash', 'U'),
+    ('publisher', 'U'),
+    ('gas_ratio', 'f8'),
+    ('gas_limit', 'f8'),
+    ('action_count', 'i8'),
+    ('gas_usage', 'f8'),
+    ('status_code', 'i8'),
+)  #: The names and NumPy types of the columns of the transaction table, ``status_code`` is a `TxReceipt.StatusCode`.
+
+NO_RECEIPT = -1  #: The ``gas_usage`` and ``status_code`` of a transaction without receipt, such as a pending one.
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('Exporting to NumPy requires the numpy package.') from e
+    return numpy
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError('Exporting to Arrow requires the pyarrow package.') from e
+    return pyarrow
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class BlockColumns:
+    """Accumulates the fields of protobuf ``Block`` messages into columns, one list per field,
+    without converting them to `Block` and `Transaction` objects.
+
+    Attributes:
+        blocks: The columns of the block table, by name, see `BLOCK_COLUMNS`.
+        transactions: The columns of the transaction table, by name, see `TX_COLUMNS`.
+
+    Example:
+        >>> columns = BlockColumns().extend(raw_blocks)
+        >>> blocks, txs = columns.to_numpy()
+        >>> txs['gas_usage'][txs['status_code'] == 0].sum()
+    """
+
+    def __init__(self):
+        self.blocks: Dict[str, List[Any]] = {name: [] for name, _ in BLOCK_COLUMNS}
+        self.transactions: Dict[str, List[Any]] = {name: [] for name, _ in TX_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.blocks['number'])
+
+    def add(self, block: pb.Block) -> BlockColumns:
+        """Appends a block and its transactions to the columns.
+
+        Args:
+            block: The protobuf ``Block``, complete to export its transactions.
+
+        Returns:
+            Itself.
+        """
+        blocks = self.blocks
+        blocks['number'].append(block.number)
+        blocks['time'].append(block.time)
+        blocks['gas_usage'].append(block.gas_usage)
+        blocks['tx_count'].append(block.tx_count)
+        blocks['witness'].append(block.witness)
+
+        txs = self.transactions
+        for tx in block.transactions:
+            # An unset receipt reads as zeros, and status code 0 is SUCCESS.
+            receipt = tx.tx_receipt if tx.HasField('tx_receipt') else None
+            txs['block_number'].append(block.number)
+            txs['hash'].append(tx.hash)
+            txs['publisher'].append(tx.publisher)
+            txs['gas_ratio'].append(tx.gas_ratio)
+            txs['gas_limit'].append(tx.gas_limit)
+            txs['action_count'].append(len(tx.actions))
+            txs['gas_usage'].append(receipt.gas_usage if receipt is not None else NO_RECEIPT)
+            txs['status_code'].append(receipt.status_code if receipt is not None else NO_RECEIPT)
+        return self
+
+    def extend(self, blocks: Iterable[pb.Block]) -> BlockColumns:
+        """Appends several blocks to the columns.
+
+        Args:
+            blocks: The protobuf ``Block`` messages.
+
+        Returns:
+            Itself.
+        """
+        for block in blocks:
+            self.add(block)
+        return self
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """Converts the columns to NumPy structured arrays.
+        String columns are as wide as their longest value.
+
+        Returns:
+            The block array and the transaction array.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        np = _numpy()
+        return self._structured(np, BLOCK_COLUMNS, self.blocks), self._structured(np, TX_COLUMNS, self.transactions)
+
+    def to_arrow(self) -> Tuple[Any, Any]:
+        """Converts the columns to Arrow tables.
+
+        Returns:
+            The block table and the transaction table.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa = _pyarrow()
+        return pa.table(self.blocks), pa.table(self.transactions)
+
+    def to_tables(self, format: str = 'auto') -> Tuple[Any, Any]:
+        """Converts the columns to arrays or tables.
+
+        Args:
+            format: ``numpy``, ``arrow``, or ``auto`` for Arrow when pyarrow is installed, NumPy otherwise.
+
+        Returns:
+            The blocks and the transactions.
+
+        Raises:
+            ValueError: If the format is unknown.
+            ImportError: If the package of the format is not installed.
+        """
+        if format == 'auto':
+            format = 'arrow' if _has_pyarrow() else 'numpy'
+        if format == 'numpy':
+            return self.to_numpy()
+        if format == 'arrow':
+            return self.to_arrow()
+        raise ValueError(f'Unknown export format {format}, expected numpy, arrow or auto.')
+
+    @staticmethod
+    def _structured(np, columns: Tuple[Tuple[str, str], ...], values: Dict[str, List[Any]]):
+        arrays = [np.asarray(values[name], dtype=None if dtype == 'U' else dtype) for name, dtype in columns]
+        # An empty string column has no width, keep one character.
+        dtype = [(name, array.dtype if array.size else (dtype if dtype != 'U' else 'U1'))
+                 for (name, dtype), array in zip(columns, arrays)]
+        table = np.empty(len(arrays[0]), dtype=dtype)
+        for (name, _), array in zip(columns, arrays):
+            table[name] = array
+        return table
+
+
+def export_blocks(iost: IOST, start: int, end: int, format: str = 'auto', max_workers: int = 4) -> Tuple[Any, Any]:
+    """Fetches a range of complete blocks and exports them as columns.
+    The protobuf messages are read directly, no `Block` or `Transaction` object is created.
+
+    Args:
+        iost: The `IOST` client used to fetch the blocks.
+        start: The number of the first block.
+        end: The number of the block after the last one.
+        format: ``numpy``, ``arrow``, or ``auto`` for Arrow when pyarrow is installed, NumPy otherwise.
+        max_workers: The number of blocks fetched concurrently.
+
+    Returns:
+        The blocks and the transactions, see `BLOCK_COLUMNS` and `TX_COLUMNS`.
+
+    Raises:
+        ValueError: If the range or the format is invalid.
+
+    Example:
+        >>> blocks, txs = export_blocks(iost, 1000, 2000, format='numpy')
+        >>> blocks['gas_usage'].mean()
+    """
+    if end < start:
+        raise ValueError(f'Invalid block range {start}-{end}.')
+
+    def fetch(number: int) -> pb.Block:
+        request = pb.GetBlockByNumberRequest(number=number, complete=True)
+        return iost._call('GetBlockByNumber', request).block
+
+    numbers = range(start, end)
+    if max_workers > 1:
+        with futures.ThreadPoolExecutor(max_workers) as executor:
+            columns = BlockColumns().extend(executor.map(fetch, numbers))
+    else:
+        columns = BlockColumns().extend(map(fetch, numbers))
+    return columns.to_tables(format)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+from collections import deque
+from time import time_ns
+from decimal import Decimal
+from typing import List, Dict, Tuple, Iterable, Iterator, Callable, Union, TYPE_CHECKING
+
+from pyost.account import Account, format_amount
+from pyost.transaction import Transaction, Action
+from pyost.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+
+TOKEN_DECIMALS = {'iost': 8}  #: The precision of the tokens known without a node, by symbol.
+
+
+def _varint(value: int) -> bytes:
+    if value < 0:
+        value &= (1 << 64) - 1
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(buffer: bytes, pos: int) -> Tuple[int, int]:
+    """Returns the varint at `pos` and the position after it, raises IndexError if the buffer ends first."""
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError('Too many bytes when decoding varint.')
+
+
+def fixed_clock(start: int, step: int = 1) -> Callable[[], int]:
+    """Creates a deterministic time source for `TxFactory`.
+
+    Args:
+        start: The first time returned, in nanoseconds.
+        step: The number of nanoseconds added at each call.
+
+    Returns:
+        A function that returns ``start``, ``start + step``, ``start + 2 * step``...
+    """
+    state = [start - step]
+
+    def clock() -> int:
+        state[0] += step
+        return state[0]
+
+    return clock
+
+
+class TxFactory:
+    """Builds, hashes and signs transactions offline, with timestamps taken from a time source.
+
+    Signing is CPU bound while sending is network bound: the factory signs batches of transactions
+    ahead of time into a file of length-delimited ``TransactionRequest``, that `send_file` then streams
+    to a node as fast as it accepts them.
+
+    Args:
+        publisher: The `Account` that signs the transactions as publisher.
+        time_source: The function that returns the `time` of the next `Transaction`, in nanoseconds.
+        gas_ratio: The gas ratio of the transactions.
+        gas_limit: The maximum amount of gas that can be used to execute a transaction.
+        expiration: When the transactions expire, in seconds from their `time`.
+        delay: When to execute the transactions, default 0 means now.
+        default_limit: The limit of amount of coins, default ``unlimited``.
+        chain_id: The chain id.
+        token_decimals: The precision of the tokens by symbol, used by `format_amount`, by default `TOKEN_DECIMALS`.
+
+    Example:
+        >>> factory = TxFactory(admin, fixed_clock(start=send_window_ns, step=1000))
+        >>> actions = ([Action('token.iost', 'transfer', 'iost', 'admin', name, '1', '')] for name in names)
+        >>> hashes = factory.write('txs.bin', actions)
+        >>> send_file(iost, 'txs.bin')
+    """
+
+    def __init__(self, publisher: Account, time_source: Callable[[], int] = time_ns,
+                 gas_ratio: float = 1.0, gas_limit: float = 10000.0,
+                 expiration: int = 90, delay: int = 0, default_limit: str = 'unlimited',
+                 chain_id: int = 1024, token_decimals: Dict[str, int] = None):
+        self.publisher: Account = publisher
+        self.time_source: Callable[[], int] = time_source
+        self.gas_ratio: float = gas_ratio
+        self.gas_limit: float = gas_limit
+        self.expiration: int = expiration
+        self.delay: int = delay
+        self.default_limit: str = default_limit
+        self.chain_id: int = chain_id
+        self.token_decimals: Dict[str, int] = dict(TOKEN_DECIMALS if token_decimals is None else token_decimals)
+
+    @classmethod
+    def from_iost(cls, iost: IOST, time_source: Callable[[], int] = time_ns) -> TxFactory:
+        """Creates a `TxFactory` with the default values and the `publisher` of an `IOST` client.
+
+        Args:
+            iost: The `IOST` client.
+            time_source: The function that returns the `time` of the next `Transaction`, in nanoseconds.
+
+        Returns:
+            A `TxFactory` object.
+        """
+        return cls(iost.publisher, time_source, iost.gas_ratio, iost.gas_limit,
+                   iost.expiration, iost.delay, iost.default_limit, iost.chain_id)
+
+    def format_amount(self, token: str, amount: Union[int, float, str, Decimal], decimal: int = None) -> str:
+        """Formats an amount of tokens with the precision of the token, see `pyost.account.format_amount`.
+
+        Args:
+            token: The symbol of the token.
+            amount: The amount of tokens.
+            decimal: The precision of the token, by default the one in `token_decimals`.
+
+        Returns:
+            The amount as a string, with at most `decimal` digits after the point.
+
+        Raises:
+            ValueError: If the amount is not an integer or a string and the precision of the token is unknown.
+        """
+        if decimal is None:
+            decimal = self.token_decimals.get(token)
+        if decimal is not None:
+            return format_amount(amount, decimal)
+        if isinstance(amount, str):
+            return amount
+        if isinstance(amount, int) and not isinstance(amount, bool):
+            return str(amount)
+        raise ValueError(f'The precision of token {token} is unknown, pass its decimal or add it to token_decimals.')
+
+    def create_tx(self, actions: List[Action]) -> Transaction:
+        """Creates a signed `Transaction` whose `time` is read from the `time_source`.
+
+        Args:
+            actions: A list of `Action`.
+
+        Returns:
+            The `Transaction`, signed by the `publisher` and with its `hash` set.
+        """
+        tx = Transaction(expiration=self.expiration, delay=self.delay,
+                         gas_ratio=self.gas_ratio, gas_limit=self.gas_limit,
+                         actions=list(actions), chain_id=self.chain_id, time=self.time_source())
+        tx.add_amount_limit('*', self.default_limit)
+        self.publisher.sign_publish(tx)
+        tx._hash()
+        return tx
+
+    def build(self, batches: Iterable[List[Action]]) -> Iterator[Transaction]:
+        """Creates a signed `Transaction` for each list of `Action`.
+
+        Args:
+            batches: The lists of `Action`, one per `Transaction`.
+
+        Returns:
+            An iterator of `Transaction`.
+        """
+        for actions in batches:
+            yield self.create_tx(actions)
+
+    def write(self, path: str, batches: Iterable[List[Action]], append: bool = False) -> List[bytes]:
+        """Creates and signs a `Transaction` for each list of `Action`,
+        then writes it to a file as a length-delimited ``TransactionRequest``.
+
+        Args:
+            path: The path of the file.
+            batches: The lists of `Action`, one per `Transaction`.
+            append: If True, adds the transactions after the ones already in the file,
+                otherwise the file is overwritten.
+
+        Returns:
+            The binary hashes of the transactions, in the order of the file.
+        """
+        hashes = []
+        with open(path, 'ab' if append else 'wb') as f:
+            for tx in self.build(batches):
+                data = tx.to_request_raw().SerializeToString()
+                f.write(_varint(len(data)) + data)
+                hashes.append(tx.hash)
+        return hashes
+
+
+def read_file(path: str, chunk_size: int = 1 << 20) -> Iterator[pb.TransactionRequest]:
+    """Reads the ``TransactionRequest`` written by `TxFactory.write`.
+
+    Args:
+        path: The path of the file.
+        chunk_size: The number of bytes read at once.
+
+    Returns:
+        An iterator of ``TransactionRequest``.
+    """
+    buffer = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buffer += chunk
+            pos = 0
+            while pos < len(buffer):
+                try:
+                    size, start = _read_varint(buffer, pos)
+                except IndexError:
+                    break
+                if start + size > len(buffer):
+                    break
+                yield pb.TransactionRequest.FromString(buffer[start:start + size])
+                pos = start + size
+            buffer = buffer[pos:]
+            if not chunk:
+                if buffer:
+                    raise ValueError(f'{path} ends with a truncated TransactionRequest.')
+                return
+
+
+def send_file(iost: IOST, path: str, max_in_flight: int = 64) -> List[str]:
+    """Streams the transactions of a file written by `TxFactory.write` to a node,
+    keeping up to `max_in_flight` ``SendTransaction`` calls running at once.
+
+    Args:
+        iost: The `IOST` client connected to the node.
+        path: The path of the file.
+        max_in_flight: The maximum number of concurrent calls.
+
+    The calls are spread over the channels of the client by `IOST.next_stub`.
+
+    Returns:
+        The hashes returned by the node, in the order of the file.
+
+    Raises:
+        grpc.RpcError: If the node rejects a `Transaction`.
+    """
+    hashes = []
+    pending = deque()
+    for request in read_file(path):
+        if len(pending) >= max_in_flight:
+            hashes.append(pending.popleft().result().hash)
+        pending.append(iost.next_stub().SendTransaction.future(request))
+    while pending:
+        hashes.append(pending.popleft().result().hash)
+    return hashes
@@ -0,0 +1,156 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import List, Callable, TYPE_CHECKING
+
+from pyost.blockchain import Block
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+
+class BlockFollower:
+    """Follows the blockchain's head block and hands each new `Block` to a list of listeners.
+
+    The node is polled every `interval` seconds. When the parent hash of a new block does not
+    match the block previously handed out at the same height, the follower rewinds to the fork
+    point, hands the numbers of the removed blocks to the fork listeners, and hands the blocks
+    of the new branch out again.
+
+    Args:
+        iost: The `IOST` client used to fetch blocks.
+        start_block: The number of the first block to hand out, by default the current head block.
+        complete: If True, fetches the whole blocks including their `Transactions` and receipts.
+        interval: The number of seconds to wait between two polls.
+        max_fork_depth: The number of recent block hashes remembered to detect forks.
+
+    Attributes:
+        next_block: The number of the next block to hand out.
+        lib_block: The last irreversible block number handed out to the lib listeners.
+        last_error: The last exception raised while polling or by a listener, if any.
+
+    Example:
+        >>> follower = BlockFollower(iost)
+        >>> follower.add_listener(lambda block: print(block.number))
+        >>> follower.start()
+    """
+
+    def __init__(self, iost: IOST, start_block: int = None, complete: bool = True,
+                 interval: float = 0.5, max_fork_depth: int = 64):
+        self.next_block: int = start_block
+        self.lib_block: int = -1
+        self.complete: bool = complete
+        self.interval: float = interval
+        self.max_fork_depth: int = max_fork_depth
+        self.last_error: Exception = None
+        self._iost: IOST = iost
+        self._listeners: List[Callable[[Block], None]] = []
+        self._lib_listeners: List[Callable[[int], None]] = []
+        self._fork_listeners: List[Callable[[int], None]] = []
+        self._hashes: OrderedDict = OrderedDict()
+        self._thread: threading.Thread = None
+        self._stopped: threading.Event = threading.Event()
+
+    def add_listener(self, listener: Callable[[Block], None]) -> BlockFollower:
+        """Adds a function called with each new `Block`.
+
+        Args:
+            listener: The function to call.
+
+        Returns:
+            Itself.
+        """
+        self._listeners.append(listener)
+        return self
+
+    def add_lib_listener(self, listener: Callable[[int], None]) -> BlockFollower:
+        """Adds a function called with the new last irreversible block number each time it increases.
+
+        Args:
+            listener: The function to call.
+
+        Returns:
+            Itself.
+        """
+        self._lib_listeners.append(listener)
+        return self
+
+    def add_fork_listener(self, listener: Callable[[int], None]) -> BlockFollower:
+        """Adds a function called with the number of each block handed out then removed by a fork,
+        from the highest one, before the blocks of the new branch are handed out.
+
+        Args:
+            listener: The function to call.
+
+        Returns:
+            Itself.
+        """
+        self._fork_listeners.append(listener)
+        return self
+
+    def poll(self) -> int:
+        """Fetches and hands out the blocks produced since the last poll.
+
+        Returns:
+            The number of blocks handed out.
+        """
+        info = self._iost.get_chain_info()
+        if self.next_block is None:
+            self.next_block = info.head_block
+
+        count = 0
+        while self.next_block <= info.head_block and not self._stopped.is_set():
+            block = self._iost.get_block_by_num(self.next_block, complete=self.complete)
+            parent_hash = self._hashes.get(block.number - 1)
+            if parent_hash is not None and parent_hash != block.parent_hash:
+                # A fork replaced the previous block, hand out the new branch from its fork point.
+                self._hashes.popitem(last=True)
+                self.next_block -= 1
+                self._notify(self._fork_listeners, self.next_block)
+                continue
+
+            self._hashes[block.number] = block.hash
+            while len(self._hashes) > self.max_fork_depth:
+                self._hashes.popitem(last=False)
+            self._notify(self._listeners, block)
+            self.next_block += 1
+            count += 1
+
+        if info.lib_block > self.lib_block:
+            self.lib_block = info.lib_block
+            self._notify(self._lib_listeners, info.lib_block)
+        return count
+
+    def start(self) -> BlockFollower:
+        """Starts polling in a background thread.
+
+        Returns:
+            Itself.
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = e
+            self._stopped.wait(self.interval)
+
+    def _notify(self, listeners: List[Callable], value) -> None:
+        for listener in listeners:
+            try:
+                listener(value)
+            except Exception as e:
+                self.last_error = e
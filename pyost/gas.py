@@ -0,0 +1,301 @@
+from __future__ import annotations
+import json
+import math
+import threading
+from collections import deque
+from typing import List, Dict, Tuple, TYPE_CHECKING
+
+from pyost.transaction import Transaction, TxReceipt, TransactionError, Action
+from pyost.blockchain import Block, GasRatio
+from pyost.follower import BlockFollower
+from pyost.cache import TTLCache
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+
+def _ceil(value: float) -> int:
+    """Rounds up, ignoring the floating point error of a product such as ``100 * 1.1``."""
+    return int(math.ceil(round(value, 6)))
+
+
+class GasEstimator:
+    """Estimates the gas and RAM used by transactions from cached ``ExecTransaction`` dry runs.
+
+    Transactions are grouped by shape: the contract, ABI and argument types of each of their `Action`.
+    The first transaction of a shape is dry-run with `IOST.exec_tx` and its usage is cached for `ttl` seconds,
+    so the next transactions of the same shape get their `gas_limit` without any RPC.
+
+    Args:
+        iost: The `IOST` client used to dry-run the transactions, its `publisher` signs them.
+        ttl: The number of seconds a dry run result is valid.
+        margin: The factor applied to the estimated gas usage to get the `gas_limit`.
+        ram_margin: The factor applied to the estimated RAM usage to get the amount of RAM to buy.
+        min_gas_limit: The lowest `gas_limit` that can be set.
+        max_gas_limit: The highest `gas_limit` that can be set, also used for the dry runs.
+        ram_payer: If set, the name of the account that buys the RAM used by the transactions in `apply`.
+        maxsize: The maximum number of shapes kept in cache.
+
+    Example:
+        >>> iost.gas_estimator = GasEstimator(iost)
+        >>> iost.call('token.iost', 'transfer', 'iost', 'a', 'b', '1', '')  # gas_limit is set automatically
+    """
+
+    def __init__(self, iost: IOST, ttl: float = 600.0, margin: float = 1.2, ram_margin: float = 1.1,
+                 min_gas_limit: float = 6000.0, max_gas_limit: float = 4000000.0,
+                 ram_payer: str = None, maxsize: int = 4096):
+        self.margin: float = margin
+        self.ram_margin: float = ram_margin
+        self.min_gas_limit: float = min_gas_limit
+        self.max_gas_limit: float = max_gas_limit
+        self.ram_payer: str = ram_payer
+        self.dry_runs: int = 0
+        self._iost: IOST = iost
+        self._cache: TTLCache = TTLCache(maxsize, ttl)
+
+    @staticmethod
+    def shape(actions: List[Action]) -> Tuple:
+        """Returns the cache key of a list of `Action`: their contract, ABI and argument types.
+
+        Args:
+            actions: The list of `Action`.
+
+        Returns:
+            A hashable tuple.
+        """
+        return tuple((a.contract, a.action_name, tuple(type(arg).__name__ for arg in json.loads(a.data)))
+                     for a in actions)
+
+    def estimate(self, actions: List[Action]) -> Tuple[float, Dict[str, int]]:
+        """Estimates the gas and RAM used by a list of `Action`, dry-running them if their shape is not in cache.
+
+        Args:
+            actions: The list of `Action`.
+
+        Returns:
+            The gas usage and the RAM usage in bytes by account name.
+
+        Raises:
+            TransactionError: If the dry run fails.
+            ValueError: If the `IOST` client has no `publisher` to sign the dry run.
+        """
+        key = self.shape(actions)
+        usage = self._cache.get(key)
+        if usage is None:
+            receipt = self._dry_run(actions)
+            usage = (receipt.gas_usage, dict(receipt.ram_usage))
+            self._cache.put(key, usage)
+        return usage
+
+    def apply(self, tx: Transaction) -> Transaction:
+        """Sets the `gas_limit` of a `Transaction` from its estimated usage plus the safety `margin`.
+        If `ram_payer` is set, also prepends an ``ram.iost buy`` `Action` for each account that uses RAM,
+        replacing the ones prepended by a previous call, so applying twice gives the same `Transaction`.
+
+        Warnings:
+            This must be called before the `Transaction` is signed.
+
+        Args:
+            tx: The `Transaction`.
+
+        Returns:
+            The `Transaction`.
+
+        Raises:
+            TransactionError: If the dry run fails.
+            ValueError: If the `IOST` client has no `publisher` to sign the dry run.
+        """
+        if self.ram_payer is not None:
+            tx.actions = self._strip_ram_buys(tx.actions)
+        gas, ram = self.estimate(tx.actions)
+        if self.ram_payer is not None:
+            buys = [Action('ram.iost', 'buy', self.ram_payer, name, _ceil(amount * self.ram_margin))
+                    for name, amount in sorted(ram.items()) if amount > 0]
+            if buys:
+                tx.actions = buys + tx.actions
+                gas, ram = self.estimate(tx.actions)
+        tx.gas_limit = float(min(self.max_gas_limit, max(self.min_gas_limit, _ceil(gas * self.margin))))
+        return tx
+
+    def invalidate(self, actions: List[Action] = None) -> None:
+        """Removes the cached usage of a shape, or of all shapes.
+
+        Args:
+            actions: A list of `Action` of the shape to remove, None to remove all.
+        """
+        if actions is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self.shape(actions))
+
+    def _strip_ram_buys(self, actions: List[Action]) -> List[Action]:
+        start = 0
+        while start < len(actions) and actions[start].contract == 'ram.iost' \
+                and actions[start].action_name == 'buy' and json.loads(actions[start].data)[:1] == [self.ram_payer]:
+            start += 1
+        return actions[start:]
+
+    def _dry_run(self, actions: List[Action]) -> TxReceipt:
+        tx = self._iost.create_tx(actions=list(actions))
+        tx.gas_limit = self.max_gas_limit
+        self.dry_runs += 1
+        receipt = self._iost.exec_tx(tx)
+        if receipt.status_code != TxReceipt.StatusCode.SUCCESS:
+            raise TransactionError(receipt.message, receipt)
+        return receipt
+
+
+class GasRatioOracle:
+    """Suggests a gas ratio for a target inclusion latency from the gas ratios paid in recent blocks.
+
+    The lowest gas ratio of each recent block is kept in a ring buffer. If a fraction ``F(r)`` of the
+    recent blocks accepted a gas ratio ``r``, a transaction is included within ``n`` blocks with a probability
+    ``1 - (1 - F(r)) ** n``, so `ratio_for` returns the percentile that reaches the `confidence` in ``n`` blocks.
+    Empty blocks count as accepting any gas ratio.
+
+    Blocks are fed to `on_block`, either by `attach` to an existing `BlockFollower` or by `start`,
+    which also samples `IOST.get_gas_ratio` in a background thread.
+
+    Args:
+        iost: The `IOST` client used by `start` and `sample`.
+        size: The number of blocks and of transactions kept in the ring buffers.
+        confidence: The probability of inclusion targeted by `ratio_for`.
+        target_latency: The default target latency of `ratio_for`, in seconds.
+        block_time: The number of seconds between two blocks.
+        min_ratio: The lowest gas ratio that can be suggested.
+        max_ratio: The highest gas ratio that can be suggested.
+
+    Attributes:
+        gas_ratio: The last `GasRatio` sampled from the node, None before the first sample.
+        last_error: The last exception raised in the background thread, if any.
+
+    Example:
+        >>> iost.gas_ratio_oracle = GasRatioOracle(iost).start()
+        >>> tx = iost.create_tx(target_latency=1.0)
+    """
+
+    def __init__(self, iost: IOST, size: int = 1024, confidence: float = 0.9, target_latency: float = 1.5,
+                 block_time: float = 0.5, min_ratio: float = 1.0, max_ratio: float = 100.0):
+        self.confidence: float = confidence
+        self.target_latency: float = target_latency
+        self.block_time: float = block_time
+        self.min_ratio: float = min_ratio
+        self.max_ratio: float = max_ratio
+        self.gas_ratio: GasRatio = None
+        self.last_error: Exception = None
+        self._iost: IOST = iost
+        self._block_minima: deque = deque(maxlen=size)
+        self._tx_ratios: deque = deque(maxlen=size)
+        self._sorted: Dict[bool, List[float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._follower: BlockFollower = None
+        self._thread: threading.Thread = None
+        self._stopped: threading.Event = threading.Event()
+
+    def on_block(self, block: Block) -> None:
+        """Adds the gas ratios of the transactions of a complete `Block` to the ring buffers.
+
+        Args:
+            block: A `Block` fetched with ``complete=True``.
+        """
+        ratios = [tx.gas_ratio for tx in block.transactions]
+        with self._lock:
+            self._block_minima.append(min(ratios) if ratios else self.min_ratio)
+            self._tx_ratios.extend(ratios)
+            self._sorted.clear()
+
+    def sample(self) -> GasRatio:
+        """Samples the gas ratios of the head block with `IOST.get_gas_ratio`.
+
+        Returns:
+            A `GasRatio` object.
+        """
+        self.gas_ratio = self._iost.get_gas_ratio()
+        return self.gas_ratio
+
+    def percentile(self, p: float, per_block: bool = True) -> float:
+        """Returns a percentile of the recent gas ratios.
+
+        Args:
+            p: The percentile, between 0 and 100.
+            per_block: If True, uses the lowest gas ratio of each block, otherwise the gas ratio of each transaction.
+
+        Returns:
+            The gas ratio, or None if no block has been seen.
+        """
+        with self._lock:
+            values = self._sorted.get(per_block)
+            if values is None:
+                values = sorted(self._block_minima if per_block else self._tx_ratios)
+                self._sorted[per_block] = values
+        if not values:
+            return None
+        index = min(len(values) - 1, max(0, int(math.ceil(p / 100.0 * len(values))) - 1))
+        return values[index]
+
+    def ratio_for(self, target_latency: float = None) -> float:
+        """Suggests a gas ratio to get a `Transaction` packed within a target latency.
+
+        Args:
+            target_latency: The number of seconds, by default `target_latency`.
+
+        Returns:
+            The gas ratio, between `min_ratio` and `max_ratio`. Falls back to the median gas ratio
+                of the last sample, or to `min_ratio`, if no block has been seen.
+        """
+        latency = self.target_latency if target_latency is None else target_latency
+        blocks = max(1.0, latency / self.block_time)
+        quantile = 1.0 - (1.0 - self.confidence) ** (1.0 / blocks)
+        ratio = self.percentile(100.0 * quantile)
+        if ratio is None:
+            ratio = self.gas_ratio.median_gas_ratio if self.gas_ratio is not None else self.min_ratio
+        return min(self.max_ratio, max(self.min_ratio, ratio))
+
+    def attach(self, follower: BlockFollower) -> GasRatioOracle:
+        """Adds `on_block` to the listeners of a `BlockFollower`.
+
+        Args:
+            follower: A `BlockFollower` that fetches complete blocks.
+
+        Returns:
+            Itself.
+        """
+        if not follower.complete:
+            raise ValueError('The follower must fetch complete blocks.')
+        follower.add_listener(self.on_block)
+        return self
+
+    def start(self, interval: float = 1.0, history: int = 0) -> GasRatioOracle:
+        """Starts sampling the gas ratios and following the blocks in a background thread.
+
+        Args:
+            interval: The number of seconds between two samples.
+            history: The number of blocks before the head block to read first.
+
+        Returns:
+            Itself.
+        """
+        if self._thread is None:
+            head_block = self._iost.get_chain_info().head_block
+            self._follower = BlockFollower(self._iost, max(0, head_block - history))
+            self.attach(self._follower)
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.sample()
+                self._follower.poll()
+            except Exception as e:
+                self.last_error = e
+            self._stopped.wait(interval)
@@ -1,17 +1,31 @@
-import grpc
+from __future__ import annotations
 import time
-from typing import List, Type
-from collections import Iterable
-from base58 import b58encode
+import itertools
+from collections import deque
+from decimal import Decimal
+from typing import List, Dict, Tuple, Type, Iterable, Union
+from pyost.b58 import b58encode
 
-from pyost.rpc.pb import rpc_pb2 as pb, rpc_pb2_grpc
 from pyost.blockchain import Block, NodeInfo, ChainInfo, RAMInfo, GasRatio
-from pyost.account import Account, AccountInfo, TokenBalance, Token721Balance
+from pyost.account import Account, AccountInfo, TokenBalance, Token721Balance, TokenInfo, format_amount
 from pyost.transaction import Transaction, TxReceipt, TransactionError, Action
 from pyost.contract import Contract
 from pyost.signature import KeyPair
+from pyost.keypool import KeyPool
 from pyost.algorithm import Algorithm, Ed25519
 from pyost.event import Event, SubscribeRequest
+from pyost.subscription import Subscription, ResilientSubscription
+from pyost.correlation import TxCorrelator, TxTracker
+from pyost.gas import GasEstimator, GasRatioOracle
+from pyost.cache import TTLCache, ABICache
+from pyost.bulk import BulkTransfer
+from pyost.policy import CallPolicy
+from pyost.channel import ChannelConfig
+from pyost.lazy import lazy_import
+
+grpc = lazy_import('grpc')
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+rpc_pb2_grpc = lazy_import('pyost.rpc.pb.rpc_pb2_grpc')
 
 
 class IOST:
@@ -26,6 +40,17 @@ class IOST:
         expiration: When the transaction expires, in seconds from now.
         default_limit: The limit of amount of coins, default ``unlimited``.
         publisher: The `Account` that will be used by default to sign transaction that have no publisher.
+        correlator: If set, a `TxCorrelator` that registers every transaction sent by `send_tx`.
+        gas_estimator: If set, a `GasEstimator` that sets the `gas_limit` of the unsigned transactions sent by `send_tx`
+            whose `gas_limit` is still the default one.
+        gas_ratio_oracle: If set, a `GasRatioOracle` that replaces `gas_ratio` in `create_tx`.
+        abi_cache: If set, an `ABICache` that checks the arguments of `create_call_tx`.
+        token_infos: The `TTLCache` of `TokenInfo` by symbol and ``by_longest_chain`` used by `get_token_info`,
+            valid for an hour.
+        interceptors: The gRPC client interceptors of the channel, such as a `MetricsInterceptor`.
+        policy: The `CallPolicy` that sets the deadlines, retries and hedging of the unary calls.
+        hedge_urls: The URLs of the nodes that the read calls are hedged to.
+        channel_config: The `ChannelConfig` of the channels, such as ``ChannelConfig.profile('bulk-ingest')``.
 
     Raises:
         ConnectionError: If the connection cannot be established before `timeout` seconds.
@@ -36,7 +61,9 @@ class IOST:
                  delay: int = 0, expiration: int = 90, default_limit='unlimited',
                  wait_time: int = 3, wait_max_retry: int = 10,
                  publisher: Account = None,
-                 chain_id: int = 1024):
+                 chain_id: int = 1024, interceptors: List = None,
+                 policy: CallPolicy = None, hedge_urls: List[str] = None,
+                 channel_config: ChannelConfig = None):
         self.timeout: int = timeout
         self.gas_ratio: float = gas_ratio
         self.gas_limit: float = gas_limit
@@ -47,15 +74,55 @@ class IOST:
         self.wait_max_retry: int = wait_max_retry
         self.publisher: Account = publisher
         self.chain_id: int = chain_id
-        self._channel = grpc.insecure_channel(url)
+        self.correlator: TxCorrelator = None
+        self.gas_estimator: GasEstimator = None
+        self.gas_ratio_oracle: GasRatioOracle = None
+        self.abi_cache: ABICache = None
+        self.token_infos: TTLCache = TTLCache(maxsize=1024, ttl=3600.0)
+        self.interceptors: List = interceptors or []
+        self.policy: CallPolicy = policy or CallPolicy()
+        self.hedge_urls: List[str] = hedge_urls or []
+        self.channel_config: ChannelConfig = channel_config or ChannelConfig()
+        self._channels = [self._intercept(channel) for channel in self.channel_config.create_channels(url)]
+        self._channel = self._channels[0]
+        self._hedge_channels = [self._intercept(self.channel_config.create_channel(hedge_url))
+                                for hedge_url in self.hedge_urls]
         self._stub = None
+        self._hedge_stubs = []
+        self._stub_cycle = None
 
         try:
-            grpc.channel_ready_future(self._channel).result(timeout=self.timeout)
+            for channel in self._channels:
+                grpc.channel_ready_future(channel).result(timeout=self.timeout)
         except grpc.FutureTimeoutError as e:
             raise ConnectionError('Error connecting to server') from e
         else:
-            self._stub = rpc_pb2_grpc.ApiServiceStub(self._channel)
+            stubs = [rpc_pb2_grpc.ApiServiceStub(channel) for channel in self._channels]
+            self._stub = stubs[0]
+            self._stub_cycle = itertools.cycle(stubs).__next__
+            self._hedge_stubs = [rpc_pb2_grpc.ApiServiceStub(channel) for channel in self._hedge_channels]
+
+    def _intercept(self, channel: grpc.Channel) -> grpc.Channel:
+        if self.interceptors:
+            channel = grpc.intercept_channel(channel, *self.interceptors)
+        return channel
+
+    def _call(self, method: str, request):
+        return self.policy.call([self.next_stub()] + self._hedge_stubs, method, request)
+
+    def next_stub(self) -> rpc_pb2_grpc.ApiServiceStub:
+        """Gets the ``ApiServiceStub`` of the next channel to the node, the channels are used in round robin.
+        It is meant for the streaming and pipelined calls that the `policy` does not handle.
+
+        Returns:
+            An ``ApiServiceStub``.
+        """
+        return self._stub_cycle()
+
+    def close(self) -> None:
+        """Closes the channels to the node and to the hedge nodes."""
+        for channel in self._channels + self._hedge_channels:
+            channel.close()
 
     def get_node_info(self) -> NodeInfo:
         """Gets information about the node.
@@ -66,7 +133,7 @@ class IOST:
         Returns:
             A `NodeInfo` object.
         """
-        res: pb.NodeInfoResponse = self._stub.GetNodeInfo(pb.EmptyRequest())
+        res: pb.NodeInfoResponse = self._call('GetNodeInfo', pb.EmptyRequest())
         return NodeInfo().from_raw(res)
 
     def get_chain_info(self) -> ChainInfo:
@@ -78,7 +145,7 @@ class IOST:
         Returns:
             A `ChainInfo` object.
         """
-        res: pb.ChainInfoResponse = self._stub.GetChainInfo(pb.EmptyRequest())
+        res: pb.ChainInfoResponse = self._call('GetChainInfo', pb.EmptyRequest())
         return ChainInfo().from_raw(res)
 
     def get_ram_info(self) -> RAMInfo:
@@ -91,7 +158,7 @@ class IOST:
             A `RAMInfo` object.
         """
 
-        res: pb.RAMInfoResponse = self._stub.GetRAMInfo(pb.EmptyRequest())
+        res: pb.RAMInfoResponse = self._call('GetRAMInfo', pb.EmptyRequest())
         return RAMInfo().from_raw(res)
 
     def get_tx_by_hash(self, tx_hash: str) -> Transaction:
@@ -108,7 +175,7 @@ class IOST:
                 The status attribute is set with the status code of `pb.TransactionResponse`.
         """
         req = pb.TxHashRequest(hash=tx_hash)
-        res: pb.TransactionResponse = self._stub.GetTxByHash(req)
+        res: pb.TransactionResponse = self._call('GetTxByHash', req)
         tx = Transaction().from_raw(res.transaction)
         tx.status = Transaction.Status(res.status)
         return tx
@@ -126,7 +193,7 @@ class IOST:
             TxReceipt: a `TxReceipt` deserialized from `pb.TxReceipt`.
         """
         req = pb.TxHashRequest(hash=tx_hash)
-        tr: pb.TxReceipt = self._stub.GetTxReceiptByTxHash(req)
+        tr: pb.TxReceipt = self._call('GetTxReceiptByTxHash', req)
         return TxReceipt().from_raw(tr)
 
     def get_block_by_hash(self, block_hash: str, complete: bool = False) -> Block:
@@ -144,7 +211,7 @@ class IOST:
             Block: A `Block` object that contains a list of `Transactions` if `complete` is True.
         """
         req = pb.GetBlockByHashRequest(hash=block_hash, complete=complete)
-        res: pb.BlockResponse = self._stub.GetBlockByHash(req)
+        res: pb.BlockResponse = self._call('GetBlockByHash', req)
         return Block().from_raw(res.block, res.status)
 
     def get_block_by_num(self, block_num: int, complete: bool = False) -> Block:
@@ -162,7 +229,7 @@ class IOST:
             Block: A `Block` object that contains a list of `Transactions` if `complete` is True.
         """
         req = pb.GetBlockByNumberRequest(number=block_num, complete=complete)
-        res: pb.BlockResponse = self._stub.GetBlockByNumber(req)
+        res: pb.BlockResponse = self._call('GetBlockByNumber', req)
         return Block().from_raw(res.block, res.status)
 
     def get_account_info(self, account_name: str, by_longest_chain: bool = False) -> AccountInfo:
@@ -179,7 +246,7 @@ class IOST:
             An `AccountInfo` object.
         """
         req = pb.GetAccountRequest(name=account_name, by_longest_chain=by_longest_chain)
-        acc: pb.Account = self._stub.GetAccount(req)
+        acc: pb.Account = self._call('GetAccount', req)
         return AccountInfo().from_raw(acc)
 
     def get_token_balance(self, account_name: str, token: str = 'iost', by_longest_chain: bool = False) -> TokenBalance:
@@ -197,7 +264,7 @@ class IOST:
             A `TokenBalance` object.
         """
         req = pb.GetTokenBalanceRequest(account=account_name, token=token, by_longest_chain=by_longest_chain)
-        res: pb.GetTokenBalanceResponse = self._stub.GetTokenBalance(req)
+        res: pb.GetTokenBalanceResponse = self._call('GetTokenBalance', req)
         return TokenBalance().from_raw(res)
 
     def get_balance(self, account_name: str, token: str = 'iost', by_longest_chain: bool = False) -> float:
@@ -216,6 +283,94 @@ class IOST:
         """
         return self.get_token_balance(account_name, token, by_longest_chain).balance
 
+    def get_balances(self, account_names: Iterable[str], tokens: Iterable[str] = ('iost',),
+                     by_longest_chain: bool = False, concurrency: int = 64) -> Dict[Tuple[str, str], Union[float, Exception]]:
+        """Gets the token balances of many accounts, keeping up to `concurrency` calls running at once.
+
+        Duplicate accounts and tokens are only queried once. The calls are spread across the channels
+        of the client and get the deadline of the `policy`, but they are not retried.
+
+        Args:
+            account_names: The names of the accounts.
+            tokens: The names of the tokens, default ``iost``.
+            by_longest_chain: If True, gets data from the longest chain's head block or last irreversible block.
+            concurrency: The maximum number of concurrent calls.
+
+        Returns:
+            The balance of each account and token, by ``(account_name, token)``,
+            or the exception raised by its call, such as a `grpc.RpcError`.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+
+        Example:
+            >>> balances = iost.get_balances(users, ['iost', 'emogi'])
+            >>> failed = [key for key, balance in balances.items() if isinstance(balance, Exception)]
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1.')
+        tokens = list(dict.fromkeys(tokens))
+        timeout = self.policy.deadline_for('GetTokenBalance')
+        balances = {}
+        pending = deque()
+
+        def collect(key, future) -> None:
+            try:
+                balances[key] = future.result().balance
+            except grpc.RpcError as e:
+                balances[key] = e
+
+        for account_name in dict.fromkeys(account_names):
+            for token in tokens:
+                if len(pending) >= concurrency:
+                    collect(*pending.popleft())
+                req = pb.GetTokenBalanceRequest(account=account_name, token=token, by_longest_chain=by_longest_chain)
+                pending.append(((account_name, token), self.next_stub().GetTokenBalance.future(req, timeout=timeout)))
+        while pending:
+            collect(*pending.popleft())
+        return balances
+
+    def get_token_info(self, symbol: str, by_longest_chain: bool = False, cached: bool = True) -> TokenInfo:
+        """Gets the description of a token.
+
+        Note:
+            REST API: GET "/getTokenInfo/{symbol}/{by_longest_chain}"
+
+        Args:
+            symbol: The symbol of the token, such as ``iost``.
+            by_longest_chain: If True, gets data from the longest chain's head block or last irreversible block.
+            cached: If True, returns the `TokenInfo` kept in `token_infos` if there is one.
+                Its `decimal` never changes, but its `current_supply` may be outdated.
+
+        Returns:
+            A `TokenInfo` object.
+        """
+        key = (symbol, by_longest_chain)
+        if cached:
+            info = self.token_infos.get(key)
+            if info is not None:
+                return info
+        req = pb.GetTokenInfoRequest(symbol=symbol, by_longest_chain=by_longest_chain)
+        res: pb.TokenInfo = self._call('GetTokenInfo', req)
+        info = TokenInfo().from_raw(res)
+        self.token_infos.put(key, info)
+        return info
+
+    def format_amount(self, token: str, amount: Union[int, float, str, Decimal], decimal: int = None) -> str:
+        """Formats an amount of tokens with the precision of the token, see `pyost.account.format_amount`.
+
+        Args:
+            token: The symbol of the token.
+            amount: The amount of tokens.
+            decimal: The precision of the token, by default the `TokenInfo.decimal` of `get_token_info`.
+
+        Returns:
+            The amount as a string, with at most `decimal` digits after the point.
+        """
+        if decimal is None:
+            decimal = self.get_token_info(token).decimal
+        return format_amount(amount, decimal)
+
     def get_token721_balance(self, account_name: str, token: str, by_longest_chain: bool = False) -> Token721Balance:
         """Gets an account's ERC721 token balance.
 
@@ -231,7 +386,7 @@ class IOST:
             A `Token721Balance` object.
         """
         req = pb.GetTokenBalanceRequest(account=account_name, token=token, by_longest_chain=by_longest_chain)
-        res: pb.GetToken721BalanceResponse = self._stub.GetToken721Balance(req)
+        res: pb.GetToken721BalanceResponse = self._call('GetToken721Balance', req)
         return Token721Balance().from_raw(res)
 
     def get_token721_metadata(self, token: str, token_id: str, by_longest_chain: bool = False) -> str:
@@ -249,7 +404,7 @@ class IOST:
             The metadata of the token as a string.
         """
         req = pb.GetToken721InfoRequest(token=token, token_id=token_id, by_longest_chain=by_longest_chain)
-        res: pb.GetToken721MetadataResponse = self._stub.GetToken721Metadata(req)
+        res: pb.GetToken721MetadataResponse = self._call('GetToken721Metadata', req)
         return res.metadata
 
     def get_token721_owner(self, token: str, token_id: str, by_longest_chain: bool = False) -> str:
@@ -267,7 +422,7 @@ class IOST:
             The token owner's name.
         """
         req = pb.GetToken721InfoRequest(token=token, token_id=token_id, by_longest_chain=by_longest_chain)
-        res: pb.GetToken721OwnerResponse = self._stub.GetToken721Owner(req)
+        res: pb.GetToken721OwnerResponse = self._call('GetToken721Owner', req)
         return res.owner
 
     def get_gas_ratio(self) -> GasRatio:
@@ -279,7 +434,7 @@ class IOST:
         Returns:
             A `GasRatio` object.
         """
-        res: pb.GasRatioResponse = self._stub.GetGasRatio(pb.EmptyRequest())
+        res: pb.GasRatioResponse = self._call('GetGasRatio', pb.EmptyRequest())
         return GasRatio().from_raw(res)
 
     def get_contract(self, id: str, by_longest_chain: bool = False) -> Contract:
@@ -296,7 +451,7 @@ class IOST:
             A `Contract` object.
         """
         req = pb.GetContractRequest(id=id, by_longest_chain=by_longest_chain)
-        res: pb.Contract = self._stub.GetContract(req)
+        res: pb.Contract = self._call('GetContract', req)
         return Contract().from_raw(res)
 
     def get_contract_storage(self, id: str, key: str, field: str = '', by_longest_chain: bool = False) -> str:
@@ -316,7 +471,7 @@ class IOST:
             `StateDB[key]` or `StateDB[key][field]` as a string.
         """
         req = pb.GetContractStorageRequest(id=id, key=key, field=field, by_longest_chain=by_longest_chain)
-        res: pb.GetContractStorageResponse = self._stub.GetContractStorage(req)
+        res: pb.GetContractStorageResponse = self._call('GetContractStorage', req)
         return res.data
 
     def get_contract_storage_fields(self, id: str, fields: str = '', by_longest_chain: bool = False) -> str:
@@ -335,12 +490,14 @@ class IOST:
             A string.
         """
         req = pb.GetContractStorageFieldsRequest(id=id, fields=fields, by_longest_chain=by_longest_chain)
-        res: pb.GetContractStorageFieldsResponse = self._stub.GetContractStorageFields(req)
+        res: pb.GetContractStorageFieldsResponse = self._call('GetContractStorageFields', req)
         return res.data
 
     def send_tx(self, tx: Transaction) -> str:
         """Sends a `Transaction` serialized as a `TransactionRequest`.
         If the `Transaction` has no publisher set, signs it with the default `publisher`.
+        If a `gas_estimator` is set, the `Transaction` has no signature yet and its `gas_limit` is still
+        the default `gas_limit`, sets its `gas_limit` first. An explicit `gas_limit` is kept.
 
         Notes:
             REST API: POST "/sendTx" (tx in the body)
@@ -351,13 +508,39 @@ class IOST:
         Returns:
             The hash value of the `Transaction` received by the node.
         """
+        return self._send_tx(tx)[0]
+
+    def _send_tx(self, tx: Transaction) -> Tuple[str, TxTracker]:
+        if self.gas_estimator is not None and not tx.signatures and not tx.publisher_signatures \
+                and tx.gas_limit == self.gas_limit:
+            self.gas_estimator.apply(tx)
+
         if tx.publisher == '':
             if self.publisher is None:
                 raise ValueError('No publisher has signed the transaction.')
             self.publisher.sign_publish(tx)
 
-        res: pb.SendTransactionResponse = self._stub.SendTransaction(tx.to_request_raw())
-        return res.hash
+        res: pb.SendTransactionResponse = self._call('SendTransaction', tx.to_request_raw())
+        if self.correlator is not None:
+            pre_receipt = TxReceipt().from_raw(res.pre_tx_receipt) if res.HasField('pre_tx_receipt') else None
+            return res.hash, self.correlator.register(res.hash, pre_receipt, tx.expiration)
+        return res.hash, None
+
+    def send_and_track_tx(self, tx: Transaction) -> TxTracker:
+        """Helper function that combines `send_tx` and `TxCorrelator.register`.
+
+        Args:
+            tx: The `Transaction` to send.
+
+        Returns:
+            A `TxTracker` whose futures are resolved by the `correlator` as the `Transaction` is packed.
+
+        Raises:
+            ValueError: If no `correlator` is set.
+        """
+        if self.correlator is None:
+            raise ValueError('No correlator has been set.')
+        return self._send_tx(tx)[1]
 
     def exec_tx(self, tx: Transaction) -> TxReceipt:
         """Executes a `Transaction` serialized as a `TransactionRequest`.
@@ -372,12 +555,12 @@ class IOST:
         Returns:
             The receipt of the transaction as a `TxReceipt` object.
         """
-        if tx.publisher is None:
+        if tx.publisher == '':
             if self.publisher is None:
                 raise ValueError('No publisher has signed the transaction.')
             self.publisher.sign_publish(tx)
 
-        tr: pb.TxReceipt = self._stub.ExecTransaction(tx.to_request_raw())
+        tr: pb.TxReceipt = self._call('ExecTransaction', tx.to_request_raw())
         return TxReceipt().from_raw(tr)
 
     def send_and_wait_tx(self, tx: Transaction) -> TxReceipt:
@@ -455,34 +638,61 @@ class IOST:
         raise TimeoutError(f'Receipt cannot be found before {max_retry} trials.')
 
     # post: "/subscribe"
-    def subscribe(self, topics: List[Event.Topic], contract_id: str = '') -> Iterable:
+    def subscribe(self, topics: List[Event.Topic], contract_id: str = '') -> Subscription:
         """Subscribes to a list of topics.
 
         Args:
             topics: A list of `Event.Topic` to listen to.
             contract_id: A filter to only listen to the events of a particular contract.
 
-        Yields:
-            Returns the `Events` one by one.
+        Returns:
+            A `Subscription` that yields the `Events` one by one, until its ``close`` method is called.
 
         Example:
             >>> for event in iost.subscribe(topics, contract_id):
             >>>     print(event)
         """
         sr = SubscribeRequest(topics, contract_id)
-        for res in self._stub.Subscribe(sr.to_raw()):
-            yield Event().from_raw(res.event)
+        return Subscription(self.next_stub().Subscribe(sr.to_raw()))
+
+    def subscribe_resilient(self, topics: List[Event.Topic], contract_id: str = '',
+                            start_block: int = None, min_backoff: float = 1.0,
+                            max_backoff: float = 30.0, max_retry: int = None) -> ResilientSubscription:
+        """Subscribes to a list of topics, reconnects when the stream drops and backfills the missed receipts.
 
-    def create_tx(self, actions: List[Action] = None) -> Transaction:
+        Args:
+            topics: A list of `Event.Topic` to listen to.
+            contract_id: A filter to only listen to the events of a particular contract.
+            start_block: If set, backfills the receipts of the blocks after this number before listening.
+            min_backoff: The number of seconds to wait before the first reconnection attempt.
+            max_backoff: The maximum number of seconds to wait between two reconnection attempts.
+            max_retry: The number of consecutive failed attempts before raising a ConnectionError, None means forever.
+
+        Returns:
+            A `ResilientSubscription` that yields each `Event` exactly once.
+
+        Example:
+            >>> for event in iost.subscribe_resilient(topics, contract_id):
+            >>>     print(event)
+        """
+        return ResilientSubscription(self, topics, contract_id, start_block,
+                                     min_backoff, max_backoff, max_retry)
+
+    def create_tx(self, actions: List[Action] = None, target_latency: float = None) -> Transaction:
         """Creates a `Transaction` with default values from this class members.
 
         Args:
             actions: A list of `Actions`.
+            target_latency: If a `gas_ratio_oracle` is set, the number of seconds within which
+                the `Transaction` should be packed, by default the oracle's `target_latency`.
 
         Returns:
             A `Transaction` object.
         """
-        tx = Transaction(gas_limit=self.gas_limit, gas_ratio=self.gas_ratio,
+        gas_ratio = self.gas_ratio
+        if self.gas_ratio_oracle is not None:
+            gas_ratio = self.gas_ratio_oracle.ratio_for(target_latency)
+        tx = Transaction(gas_limit=self.gas_limit, gas_ratio=gas_ratio,
                          expiration=self.expiration, delay=self.delay, actions=actions,
                          chain_id=self.chain_id)
         tx.add_amount_limit('*', self.default_limit)
@@ -498,7 +708,12 @@ class IOST:
 
         Returns:
             A `Transaction` object.
+
+        Raises:
+            ValueError: If the `abi_cache` is set and the arguments do not match the abi.
         """
+        if self.abi_cache is not None:
+            args = self.abi_cache.check_args(contract, abi, args)
         return self.create_tx(actions=[Action(contract, abi, *args)])
 
     def create_publish_tx(self, contract: Contract) -> Transaction:
@@ -512,23 +727,40 @@ class IOST:
         """
         return self.create_call_tx('system.iost', 'setCode', contract.to_json())
 
-    def create_transfer_tx(self, token: str, from_name: str, to_name: str, amount: float, memo='') -> Transaction:
+    def create_transfer_tx(self, token: str, from_name: str, to_name: str, amount: float, memo='',
+                           decimal: int = None) -> Transaction:
         """Creates a `Transaction` that contains an `Action` to transfer tokens between accounts.
 
         Args:
             token: The name of the token.
             from_name: The account name to send tokens from.
             to_name: The account name to send tokens to.
-            amount: The amount of tokens to send.
+            amount: The amount of tokens to send, formatted with the precision of the token by `format_amount`.
             memo: A text to add to the transaction.
+            decimal: The precision of the token, to format the amount without fetching its `TokenInfo`.
 
         Returns:
             A `Transaction` object.
         """
-        tx = self.create_call_tx('token.iost', 'transfer', token, from_name, to_name, str(amount), memo)
-        tx.add_amount_limit(token, str(amount))
+        amount = self.format_amount(token, amount, decimal)
+        tx = self.create_call_tx('token.iost', 'transfer', token, from_name, to_name, amount, memo)
+        tx.add_amount_limit(token, amount)
         return tx
 
+    def create_bulk_transfer(self, token: str = 'iost', from_name: str = None) -> BulkTransfer:
+        """Creates a `BulkTransfer` that packs many transfers into few transactions.
+
+        Args:
+            token: The default name of the token.
+            from_name: The default account name to send tokens from, by default the name of the `publisher`.
+
+        Returns:
+            A `BulkTransfer` object.
+        """
+        if from_name is None and self.publisher is not None:
+            from_name = self.publisher.name
+        return BulkTransfer(self, token, from_name)
+
     def create_new_account_tx(self, new_name: str, creator_name: str,
                               owner_key: str, active_key: str,
                               initial_ram: int = 0, initial_gas_pledge: float = 10.0,
@@ -549,16 +781,24 @@ class IOST:
             A `Transaction` object.
         """
         tx = self.create_tx()
+        self._add_new_account_actions(tx, new_name, creator_name, owner_key, active_key,
+                                      initial_ram, initial_gas_pledge, initial_coins)
+        return tx
+
+    @staticmethod
+    def _add_new_account_actions(tx: Transaction, new_name: str, creator_name: str,
+                                 owner_key: str, active_key: str, initial_ram: int,
+                                 initial_gas_pledge: float, initial_coins: float) -> None:
         tx.add_action('auth.iost', 'signUp', new_name, owner_key, active_key)
         if initial_ram > 0:
             tx.add_action('ram.iost', 'buy', creator_name, new_name, initial_ram)
         if initial_gas_pledge < 10.0:
             raise ValueError('minimum gas pledge is 10.0')
         if initial_gas_pledge - 10.0 > 0:
-            tx.add_action('gas.iost', 'pledge', creator_name, new_name, str(initial_gas_pledge - 10.0))
+            tx.add_action('gas.iost', 'pledge', creator_name, new_name, format_amount(initial_gas_pledge - 10.0, 8))
         if initial_coins > 0.0:
-            tx.add_action('token.iost', 'transfer', 'iost', creator_name, new_name, str(initial_coins), '')
-        return tx
+            tx.add_action('token.iost', 'transfer', 'iost', creator_name, new_name,
+                          format_amount(initial_coins, 8), '')
 
     def call(self, contract: str, abi: str, *args) -> TxReceipt:
         """Helper function that combines `create_transfer_tx` and `send_and_wait_tx`.
@@ -649,9 +889,66 @@ class IOST:
         account.add_key_pair(kp, 'owner')
         account.add_key_pair(kp, 'active')
 
-        tx = self.create_new_account_tx(new_name, creator_name,
-                                        b58encode(account.get_key_pair('owner').pubkey),
-                                        b58encode(account.get_key_pair('active').pubkey),
+        pubkey = b58encode(kp.pubkey)
+        tx = self.create_new_account_tx(new_name, creator_name, pubkey, pubkey,
                                         initial_ram, initial_gas_pledge, initial_coins)
         self.send_and_wait_tx(tx)
         return account
+
+    def new_accounts(self, new_names: List[str], creator_name: str,
+                     initial_ram: int = 0, initial_gas_pledge: float = 11.0,
+                     initial_coins: float = 0.0, algo_cls: Type[Algorithm] = Ed25519,
+                     key_pool: KeyPool = None, accounts_per_tx: int = 20,
+                     raise_errors: bool = True) -> List[Account]:
+        """Creates many accounts, packing the `Actions` of several accounts per `Transaction`.
+
+        All the transactions are sent first, then their receipts are waited for,
+        so the confirmation delays of the transactions overlap.
+
+        Args:
+            new_names: The names of the accounts to create.
+            creator_name: The name of the account that will pledge tokens to the new accounts.
+            initial_ram: The amount of RAM to buy for each new account.
+            initial_gas_pledge: The amount of tokens to pledge for each new account.
+            initial_coins: The amount of coins to transfer to each new account.
+            algo_cls: The class type of the `Algorithm` to use to generate the `KeyPair` if there is no `key_pool`.
+            key_pool: If set, a `KeyPool` of pre-generated `KeyPair` to use.
+            accounts_per_tx: The maximum number of accounts created by a `Transaction`.
+            raise_errors: If True, raises the error of the first failed `Transaction` once all have been waited for.
+
+        Returns:
+            The list of created `Account` objects, the accounts of failed transactions are omitted.
+
+        Raises:
+            TransactionError: If Transaction.Status is unknown or if TxReceipt.StatusCode is not SUCCESS.
+            TimeoutError: If TxReceipt.StatusCode is TIMEOUT
+                or no transaction can be found after `wait_time` x `wait_max_retry` have passed.
+        """
+        batches = []
+        for i in range(0, len(new_names), accounts_per_tx):
+            tx = self.create_tx()
+            accounts = []
+            names = new_names[i:i + accounts_per_tx]
+            # One call per batch, a persisted pool records the keys taken once.
+            kps = key_pool.get_many(len(names)) if key_pool is not None else [KeyPair(algo_cls) for _ in names]
+            for name, kp in zip(names, kps):
+                account = Account(name)
+                account.add_key_pair(kp, 'owner')
+                account.add_key_pair(kp, 'active')
+                pubkey = b58encode(kp.pubkey)
+                self._add_new_account_actions(tx, name, creator_name, pubkey, pubkey,
+                                              initial_ram, initial_gas_pledge, initial_coins)
+                accounts.append(account)
+            batches.append((self.send_tx(tx), accounts))
+
+        created = []
+        error = None
+        for tx_hash, accounts in batches:
+            try:
+                self.wait_tx(tx_hash)
+                created.extend(accounts)
+            except (TransactionError, TimeoutError) as e:
+                error = error or e
+        if error is not None and raise_errors:
+            raise error
+        return created
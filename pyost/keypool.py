@@ -0,0 +1,250 @@
+from __future__ import annotations
+import os
+import base64
+import hashlib
+import threading
+from collections import deque
+from typing import List, Tuple, Type
+
+from pyost.signature import KeyPair
+from pyost.algorithm import Algorithm, Ed25519, get_algorithm_by_id
+from pyost.lazy import lazy_import
+
+futures = lazy_import('concurrent.futures')
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _generate_keys(algo_id: int, count: int) -> List[Tuple[bytes, bytes]]:
+    """Generates secret and public keys in a worker process.
+
+    Args:
+        algo_id: The id of the `Algorithm`.
+        count: The number of keys to generate.
+
+    Returns:
+        A list of secret and public key pairs.
+    """
+    algo_cls = get_algorithm_by_id(algo_id)
+    keys = []
+    for _ in range(count):
+        seckey = algo_cls.gen_seckey()
+        keys.append((seckey, algo_cls.get_pubkey(seckey)))
+    return keys
+
+
+class KeyPool:
+    """A pool of pre-generated `KeyPair`, filled by worker processes and optionally persisted encrypted to disk.
+
+    Key generation, and above all public key derivation, is CPU bound: filling the pool ahead of time
+    across processes keeps it out of the account creation path.
+
+    The keys taken by `get` are recorded as consumed in a small ``.consumed`` file next to `path`,
+    which holds the number of keys taken from the start of the saved file, so that a crash
+    before the next `save` does not hand them out again. It contains no secret.
+
+    Args:
+        algo_cls: The class type of the `Algorithm` used to generate the keys.
+        path: If set, the file where unused keys are saved by `save` and loaded from when the pool is created.
+        password: The password used to encrypt the file at `path`, required if `path` is set.
+        low_watermark: `start` refills the pool when it contains fewer keys than this.
+        batch_size: The number of keys generated by each worker task.
+        processes: The number of worker processes, by default the number of CPUs.
+
+    Warnings:
+        The file at `path` contains secret keys: keys returned by `get` stay in it, encrypted,
+            until the next call to `save`.
+        Persistence requires the ``cryptography`` package, installed by ``pip install pyost[keypool]``.
+
+    Example:
+        >>> pool = KeyPool(Ed25519, 'keys.bin', b'password')
+        >>> pool.fill(10000)
+        >>> pool.save()
+        >>> accounts = iost.new_accounts(names, 'admin', key_pool=pool)
+    """
+
+    def __init__(self, algo_cls: Type[Algorithm] = Ed25519, path: str = None, password: bytes = None,
+                 low_watermark: int = 1000, batch_size: int = 500, processes: int = None):
+        if path is not None and not password:
+            raise ValueError('A password is required to persist the keys.')
+        self.algo_cls: Type[Algorithm] = algo_cls
+        self.path: str = path
+        self.low_watermark: int = low_watermark
+        self.batch_size: int = batch_size
+        self.processes: int = processes
+        self._password: bytes = password
+        self._keys: deque = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._salt: bytes = None
+        self._saved: int = 0
+        self._consumed: int = 0
+        self._thread: threading.Thread = None
+        self._stopped: threading.Event = threading.Event()
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def fill(self, count: int) -> KeyPool:
+        """Generates keys with a pool of worker processes and adds them to the pool.
+
+        Args:
+            count: The number of keys to generate.
+
+        Returns:
+            Itself.
+        """
+        sizes = [self.batch_size] * (count // self.batch_size)
+        if count % self.batch_size:
+            sizes.append(count % self.batch_size)
+        algo_id = self.algo_cls.__int__()
+        with futures.ProcessPoolExecutor(self.processes) as executor:
+            for keys in executor.map(_generate_keys, [algo_id] * len(sizes), sizes):
+                self._keys.extend(keys)
+        return self
+
+    def get(self) -> KeyPair:
+        """Takes a `KeyPair` from the pool, or generates one if the pool is empty.
+
+        Returns:
+            A `KeyPair` object.
+        """
+        keys = self._take(1)
+        if not keys:
+            return KeyPair(self.algo_cls)
+        seckey, pubkey = keys[0]
+        return KeyPair(self.algo_cls, seckey, pubkey)
+
+    def get_many(self, count: int) -> List[KeyPair]:
+        """Takes several `KeyPair` from the pool, filling it first if it contains too few keys.
+
+        Args:
+            count: The number of `KeyPair`.
+
+        Returns:
+            A list of `KeyPair` objects.
+        """
+        if len(self._keys) < count:
+            self.fill(count - len(self._keys))
+        keys = self._take(count)
+        return [KeyPair(self.algo_cls, seckey, pubkey) for seckey, pubkey in keys] + \
+            [KeyPair(self.algo_cls) for _ in range(count - len(keys))]
+
+    def start(self, interval: float = 1.0) -> KeyPool:
+        """Starts a background thread that refills the pool up to twice the `low_watermark`.
+
+        Args:
+            interval: The number of seconds between two checks.
+
+        Returns:
+            Itself.
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def save(self) -> None:
+        """Encrypts and writes the unused keys to `path`."""
+        if self.path is None:
+            raise ValueError('No path has been set.')
+        with self._lock:
+            keys = list(self._keys)
+            blob = bytearray()
+            for seckey, pubkey in keys:
+                blob += bytes([len(seckey)]) + seckey + bytes([len(pubkey)]) + pubkey
+            salt = os.urandom(16)
+            token = self._fernet(salt).encrypt(bytes([self.algo_cls.__int__()]) + bytes(blob))
+            _write_atomic(self.path, salt + token)
+            # The consumed count of the previous file does not match the new salt, it is ignored.
+            self._salt, self._saved, self._consumed = salt, len(keys), 0
+
+    def load(self) -> KeyPool:
+        """Reads and decrypts the keys saved at `path` and adds them to the front of the pool,
+        skipping the keys already consumed by `get`.
+
+        Returns:
+            Itself.
+
+        Raises:
+            ValueError: If the password is wrong or the keys were generated with another `Algorithm`.
+            ImportError: If the ``cryptography`` package is not installed.
+        """
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        salt = data[:16]
+        fernet = self._fernet(salt)
+        from cryptography.fernet import InvalidToken
+        try:
+            blob = fernet.decrypt(data[16:])
+        except InvalidToken as e:
+            raise ValueError('Cannot decrypt the key pool, wrong password?') from e
+        if blob[0] != self.algo_cls.__int__():
+            raise ValueError(f'The key pool contains keys of algorithm {blob[0]}.')
+        keys = []
+        i = 1
+        while i < len(blob):
+            seckey = blob[i + 1:i + 1 + blob[i]]
+            i += 1 + blob[i]
+            pubkey = blob[i + 1:i + 1 + blob[i]]
+            i += 1 + blob[i]
+            keys.append((seckey, pubkey))
+        consumed = self._read_consumed(salt)
+        with self._lock:
+            self._keys.extendleft(reversed(keys[consumed:]))
+            self._salt, self._saved, self._consumed = salt, len(keys), consumed
+        return self
+
+    def _take(self, count: int) -> List[Tuple[bytes, bytes]]:
+        with self._lock:
+            keys = []
+            while len(keys) < count:
+                try:
+                    keys.append(self._keys.popleft())
+                except IndexError:
+                    break
+            # The saved keys are at the front of the pool, record how many of them are gone.
+            saved = min(len(keys), self._saved - self._consumed)
+            if saved > 0:
+                self._consumed += saved
+                _write_atomic(self.path + '.consumed', f'{self._salt.hex()} {self._consumed}'.encode())
+            return keys
+
+    def _read_consumed(self, salt: bytes) -> int:
+        try:
+            with open(self.path + '.consumed', 'rb') as f:
+                file_salt, consumed = f.read().decode().split()
+                consumed = int(consumed)
+        except (OSError, ValueError):
+            return 0
+        return consumed if file_salt == salt.hex() else 0
+
+    def _fernet(self, salt: bytes):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise ImportError('KeyPool persistence requires the cryptography package.') from e
+        key = hashlib.scrypt(self._password, salt=salt, n=2 ** 14, r=8, p=1, dklen=32)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.is_set():
+            if len(self._keys) < self.low_watermark:
+                self.fill(2 * self.low_watermark - len(self._keys))
+            self._stopped.wait(interval)
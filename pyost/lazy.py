@@ -0,0 +1,42 @@
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """A placeholder for a module that is imported on the first access to one of its attributes.
+
+    Once imported, the attributes of the module are copied to the placeholder,
+    so that later accesses cost the same as with the module itself.
+
+    Args:
+        name: The absolute name of the module, such as ``pyost.rpc.pb.rpc_pb2``.
+    """
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f'<lazy module {self.__name__!r}>'
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Gets a module that is imported on first use.
+    If the module is already imported, it is returned as is.
+
+    Args:
+        name: The absolute name of the module.
+
+    Returns:
+        The module, or a `LazyModule` that imports it on first use.
+
+    Example:
+        >>> grpc = lazy_import('grpc')
+        >>> grpc.insecure_channel(url)  # grpc is imported here
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
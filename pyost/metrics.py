@@ -0,0 +1,385 @@
+from __future__ import annotations
+import bisect
+import os
+import threading
+import time
+from collections import Counter, deque
+from typing import List, Dict, Tuple, Callable, Iterator, Any
+
+import grpc
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  #: In seconds.
+
+
+class Histogram:
+    """A histogram with fixed bucket upper bounds, as in Prometheus.
+
+    Args:
+        buckets: The sorted upper bounds of the buckets, a last bucket without upper bound is added.
+
+    Attributes:
+        buckets: The upper bounds of the buckets.
+        counts: The number of values in each bucket, the last one counts the values above all the bounds.
+        count: The number of values.
+        sum: The sum of the values.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Adds a value.
+
+        Args:
+            value: The value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile by linear interpolation within its bucket.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimated value, None if the histogram is empty.
+                Values above the last bound are estimated as the last bound.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class RpcRecord:
+    """Describes a completed RPC.
+
+    Attributes:
+        method: The name of the method, such as ``GetChainInfo``.
+        start: The time when the call started, in seconds since the epoch.
+        duration: The number of seconds until the call completed.
+        code: The name of the final `grpc.StatusCode`, such as ``OK`` or ``UNAVAILABLE``.
+        request_bytes: The size of the serialized request.
+        response_bytes: The size of the serialized responses.
+        responses: The number of responses, for streaming calls.
+    """
+
+    __slots__ = ('method', 'start', 'duration', 'code', 'request_bytes', 'response_bytes', 'responses')
+
+    def __init__(self, method: str, start: float, duration: float, code: str,
+                 request_bytes: int, response_bytes: int, responses: int = 1):
+        self.method: str = method
+        self.start: float = start
+        self.duration: float = duration
+        self.code: str = code
+        self.request_bytes: int = request_bytes
+        self.response_bytes: int = response_bytes
+        self.responses: int = responses
+
+    def __repr__(self) -> str:
+        return f'RpcRecord({self.method}, {self.code}, {self.duration * 1000:.3f} ms)'
+
+
+class MetricsSink:
+    """The interface of the sinks of a `MetricsInterceptor`, both methods do nothing by default."""
+
+    def on_start(self, method: str) -> None:
+        """Called when a call starts.
+
+        Args:
+            method: The name of the method.
+        """
+
+    def on_end(self, record: RpcRecord) -> None:
+        """Called when a call completes, successfully or not.
+
+        Args:
+            record: The `RpcRecord` of the call.
+        """
+
+
+class CallbackSink(MetricsSink):
+    """Forwards the records to a function.
+
+    Args:
+        on_end: The function called with the `RpcRecord` of each completed call.
+        on_start: The function called with the method name of each started call.
+    """
+
+    def __init__(self, on_end: Callable[[RpcRecord], None], on_start: Callable[[str], None] = None):
+        self._on_end: Callable[[RpcRecord], None] = on_end
+        self._on_start: Callable[[str], None] = on_start
+
+    def on_start(self, method: str) -> None:
+        if self._on_start is not None:
+            self._on_start(method)
+
+    def on_end(self, record: RpcRecord) -> None:
+        self._on_end(record)
+
+
+class MethodStats:
+    """The aggregated metrics of a method.
+
+    Attributes:
+        latency: The `Histogram` of the call durations in seconds.
+        codes: The number of calls by status code name.
+        in_flight: The number of calls started but not completed.
+        request_bytes: The total size of the requests.
+        response_bytes: The total size of the responses.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.latency: Histogram = Histogram(buckets)
+        self.codes: Counter = Counter()
+        self.in_flight: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+
+
+class RpcMetrics(MetricsSink):
+    """Aggregates the calls by method: latency histogram, status codes, in-flight calls and payload sizes.
+
+    Args:
+        buckets: The upper bounds of the latency histogram buckets, in seconds.
+
+    Example:
+        >>> metrics = RpcMetrics()
+        >>> iost = IOST(url, interceptors=[MetricsInterceptor(metrics)])
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = buckets
+        self._stats: Dict[str, MethodStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __getitem__(self, method: str) -> MethodStats:
+        with self._lock:
+            return self._get(method)
+
+    def methods(self) -> List[str]:
+        """Returns the names of the methods that have been called."""
+        with self._lock:
+            return sorted(self._stats)
+
+    def on_start(self, method: str) -> None:
+        with self._lock:
+            self._get(method).in_flight += 1
+
+    def on_end(self, record: RpcRecord) -> None:
+        with self._lock:
+            stats = self._get(record.method)
+            stats.in_flight -= 1
+            stats.latency.observe(record.duration)
+            stats.codes[record.code] += 1
+            stats.request_bytes += record.request_bytes
+            stats.response_bytes += record.response_bytes
+
+    def to_prometheus(self, prefix: str = 'pyost_rpc') -> str:
+        """Exports the metrics in the Prometheus text format.
+
+        Args:
+            prefix: The prefix of the metric names.
+
+        Returns:
+            The text to serve on a ``/metrics`` endpoint.
+        """
+        with self._lock:
+            stats = [(f'method="{method}"', self._stats[method]) for method in sorted(self._stats)]
+            lines = [f'# TYPE {prefix}_latency_seconds histogram']
+            for label, st in stats:
+                cumulative = 0
+                for bound, count in zip(st.latency.buckets, st.latency.counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_latency_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_latency_seconds_bucket{{{label},le="+Inf"}} {st.latency.count}')
+                lines.append(f'{prefix}_latency_seconds_sum{{{label}}} {st.latency.sum}')
+                lines.append(f'{prefix}_latency_seconds_count{{{label}}} {st.latency.count}')
+            lines.append(f'# TYPE {prefix}_calls_total counter')
+            for label, st in stats:
+                for code, count in sorted(st.codes.items()):
+                    lines.append(f'{prefix}_calls_total{{{label},code="{code}"}} {count}')
+            lines.append(f'# TYPE {prefix}_in_flight gauge')
+            lines.extend(f'{prefix}_in_flight{{{label}}} {st.in_flight}' for label, st in stats)
+            lines.append(f'# TYPE {prefix}_request_bytes_total counter')
+            lines.extend(f'{prefix}_request_bytes_total{{{label}}} {st.request_bytes}' for label, st in stats)
+            lines.append(f'# TYPE {prefix}_response_bytes_total counter')
+            lines.extend(f'{prefix}_response_bytes_total{{{label}}} {st.response_bytes}' for label, st in stats)
+        return '\n'.join(lines) + '\n'
+
+    def _get(self, method: str) -> MethodStats:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = MethodStats(self.buckets)
+        return stats
+
+
+class Span:
+    """An OpenTelemetry-style span of a call.
+
+    Attributes:
+        trace_id: A random 128 bits id, as 32 hexadecimal characters.
+        span_id: A random 64 bits id, as 16 hexadecimal characters.
+        name: The full name of the method, such as ``rpcpb.ApiService/GetChainInfo``.
+        start_time: The start time in nanoseconds since the epoch.
+        end_time: The end time in nanoseconds since the epoch.
+        attributes: The attributes, following the OpenTelemetry RPC semantic conventions.
+        status: ``OK`` or ``ERROR``.
+    """
+
+    __slots__ = ('trace_id', 'span_id', 'name', 'start_time', 'end_time', 'attributes', 'status')
+
+    def __init__(self, record: RpcRecord):
+        self.trace_id: str = os.urandom(16).hex()
+        self.span_id: str = os.urandom(8).hex()
+        self.name: str = f'rpcpb.ApiService/{record.method}'
+        self.start_time: int = int(record.start * 1e9)
+        self.end_time: int = int((record.start + record.duration) * 1e9)
+        self.attributes: Dict[str, Any] = {
+            'rpc.system': 'grpc',
+            'rpc.service': 'rpcpb.ApiService',
+            'rpc.method': record.method,
+            'rpc.grpc.status_code': record.code,
+            'rpc.request.size': record.request_bytes,
+            'rpc.response.size': record.response_bytes,
+        }
+        self.status: str = 'OK' if record.code == 'OK' else 'ERROR'
+
+
+class SpanSink(MetricsSink):
+    """Converts each call to a `Span`, kept in a ring buffer and optionally forwarded to an OpenTelemetry tracer.
+
+    Args:
+        tracer: An ``opentelemetry.trace.Tracer``, if set a span is started and ended on it for each call.
+        maxlen: The number of spans kept in `spans`.
+
+    Attributes:
+        spans: The most recent `Span`.
+    """
+
+    def __init__(self, tracer=None, maxlen: int = 1024):
+        self.tracer = tracer
+        self.spans: deque = deque(maxlen=maxlen)
+
+    def on_end(self, record: RpcRecord) -> None:
+        span = Span(record)
+        self.spans.append(span)
+        if self.tracer is not None:
+            otel_span = self.tracer.start_span(span.name, start_time=span.start_time, attributes=span.attributes)
+            otel_span.end(end_time=span.end_time)
+
+
+def _method_name(method) -> str:
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rsplit('/', 1)[-1]
+
+
+class _StreamCall:
+    """Proxies a response-streaming call, counting the responses and their size.
+    The call is reported when its iteration ends, or when it is cancelled."""
+
+    def __init__(self, call, on_done: Callable[[int, int], None]):
+        self._call = call
+        self._on_done: Callable[[int, int], None] = on_done
+        self._responses: int = 0
+        self._bytes: int = 0
+        self._reported: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        call.add_done_callback(self._on_call_done)
+
+    def __getattr__(self, name: str):
+        return getattr(self._call, name)
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except (StopIteration, grpc.RpcError):
+            self._report()
+            raise
+        self._responses += 1
+        self._bytes += response.ByteSize()
+        return response
+
+    def _on_call_done(self, call) -> None:
+        if call.cancelled():
+            self._report()
+
+    def _report(self) -> None:
+        with self._lock:
+            if self._reported:
+                return
+            self._reported = True
+        self._on_done(self._responses, self._bytes)
+
+
+class MetricsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """A gRPC client interceptor that reports every call of a channel to sinks.
+
+    Args:
+        *sinks: The `MetricsSink` that receive the calls, a `RpcMetrics` is created if there is none.
+
+    Attributes:
+        sinks: The list of `MetricsSink`.
+
+    Example:
+        >>> metrics = RpcMetrics()
+        >>> spans = SpanSink()
+        >>> iost = IOST(url, interceptors=[MetricsInterceptor(metrics, spans)])
+    """
+
+    def __init__(self, *sinks: MetricsSink):
+        self.sinks: List[MetricsSink] = list(sinks) or [RpcMetrics()]
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = _method_name(client_call_details.method)
+        start, started = self._start(method)
+        outcome = continuation(client_call_details, request)
+
+        def done(future):
+            code = future.code()
+            response_bytes = future.result().ByteSize() if code == grpc.StatusCode.OK else 0
+            self._end(method, start, started, code, request.ByteSize(), response_bytes)
+
+        outcome.add_done_callback(done)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        method = _method_name(client_call_details.method)
+        start, started = self._start(method)
+        call = continuation(client_call_details, request)
+
+        def done(responses, response_bytes):
+            self._end(method, start, started, call.code(), request.ByteSize(), response_bytes, responses)
+
+        return _StreamCall(call, done)
+
+    def _start(self, method: str) -> Tuple[float, float]:
+        for sink in self.sinks:
+            sink.on_start(method)
+        return time.time(), time.perf_counter()
+
+    def _end(self, method: str, start: float, started: float, code: grpc.StatusCode,
+             request_bytes: int, response_bytes: int, responses: int = 1) -> None:
+        code_name = code.name if code is not None else 'UNKNOWN'
+        record = RpcRecord(method, start, time.perf_counter() - started, code_name,
+                           request_bytes, response_bytes, responses)
+        for sink in self.sinks:
+            sink.on_end(record)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+import struct
+from typing import List, Dict, Tuple
+
+from pyost.b58 import b58encode
+from pyost.account import Account
+from pyost.signature import Signature
+from pyost.transaction import Transaction, Action, AmountLimit
+from pyost.factory import TxFactory, _varint
+
+# Wire types of the protobuf encoding.
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+
+
+def _key(number: int, wire_type: int) -> bytes:
+    return _varint(number << 3 | wire_type)
+
+
+def _int_field(number: int, value: int) -> bytes:
+    return _key(number, _VARINT) + _varint(value) if value else b''
+
+
+def _double_field(number: int, value: float) -> bytes:
+    return _key(number, _FIXED64) + struct.pack('<d', value) if value else b''
+
+
+def _bytes_field(number: int, value: bytes) -> bytes:
+    return _key(number, _LENGTH_DELIMITED) + _varint(len(value)) + value
+
+
+def _string_field(number: int, value: str) -> bytes:
+    return _bytes_field(number, value.encode('utf-8')) if value else b''
+
+
+def encode_action(action: Action) -> bytes:
+    """Serializes an `Action` as a protobuf ``Action`` message.
+
+    Args:
+        action: The `Action`.
+
+    Returns:
+        The same bytes as ``action.to_raw().SerializeToString()``.
+    """
+    return _string_field(1, action.contract) + _string_field(2, action.action_name) + _string_field(3, action.data)
+
+
+def encode_amount_limit(amount_limit: AmountLimit) -> bytes:
+    """Serializes an `AmountLimit` as a protobuf ``AmountLimit`` message.
+
+    Args:
+        amount_limit: The `AmountLimit`.
+
+    Returns:
+        The same bytes as ``amount_limit.to_raw().SerializeToString()``.
+    """
+    return _string_field(1, amount_limit.token) + _string_field(2, amount_limit.value)
+
+
+def encode_signature(signature: Signature) -> bytes:
+    """Serializes a `Signature` as a protobuf ``Signature`` message.
+
+    Args:
+        signature: The `Signature`.
+
+    Returns:
+        The same bytes as ``signature.to_raw().SerializeToString()``.
+    """
+    return (_int_field(1, signature.algo_cls.ID)
+            + (_bytes_field(2, signature.sig) if signature.sig else b'')
+            + (_bytes_field(3, signature.pubkey) if signature.pubkey else b''))
+
+
+def encode_tx_request(tx: Transaction) -> bytes:
+    """Serializes a `Transaction` as a protobuf ``TransactionRequest`` message, without protobuf.
+
+    Args:
+        tx: The `Transaction`.
+
+    Returns:
+        The same bytes as ``tx.to_request_raw().SerializeToString()``,
+            ready to be sent to a node or written to a file.
+    """
+    parts = [
+        _int_field(1, tx.time),
+        _int_field(2, tx.expiration),
+        _double_field(3, tx.gas_ratio),
+        _double_field(4, tx.gas_limit),
+        _int_field(5, tx.delay),
+        _int_field(6, tx.chain_id),
+    ]
+    parts.extend(_bytes_field(7, encode_action(action)) for action in tx.actions)
+    parts.extend(_bytes_field(8, encode_amount_limit(limit)) for limit in tx.amount_limits)
+    parts.extend(_bytes_field(9, signer.encode('utf-8')) for signer in tx.signers)
+    parts.extend(_bytes_field(10, encode_signature(signature)) for signature in tx.signatures)
+    parts.append(_string_field(11, tx.publisher))
+    parts.extend(_bytes_field(12, encode_signature(signature)) for signature in tx.publisher_signatures)
+    return b''.join(parts)
+
+
+class OfflineSigner(TxFactory):
+    """Builds, hashes and signs transactions without a node connection, gRPC or protobuf.
+
+    It uses the same defaults as `IOST.create_tx`, and serializes the signed transactions
+    with `encode_tx_request`, so that a cold wallet or a short-lived worker only needs
+    `SimpleEncoder`, sha3 and the crypto backend of its keys.
+
+    Args:
+        publisher: The `Account` that signs the transactions as publisher.
+        time_source: The function that returns the `time` of the next `Transaction`, in nanoseconds.
+        gas_ratio: The gas ratio of the transactions.
+        gas_limit: The maximum amount of gas that can be used to execute a transaction.
+        expiration: When the transactions expire, in seconds from their `time`.
+        delay: When to execute the transactions, default 0 means now.
+        default_limit: The limit of amount of coins, default ``unlimited``.
+        chain_id: The chain id.
+        token_decimals: The precision of the tokens by symbol, used by `format_amount`, by default `TOKEN_DECIMALS`.
+
+    Example:
+        >>> signer = OfflineSigner(admin)
+        >>> tx_hash, request = signer.sign(signer.create_transfer_tx('iost', 'admin', 'bob', 10.0))
+        >>> open('tx.bin', 'wb').write(request)
+    """
+
+    def create_unsigned_tx(self, actions: List[Action], amount_limits: Dict[str, str] = None) -> Transaction:
+        """Creates a `Transaction` that is not signed yet, to add signers before `sign`.
+
+        Args:
+            actions: A list of `Action`.
+            amount_limits: The amount limits per token, in addition to the ``*`` default limit.
+
+        Returns:
+            A `Transaction` object.
+        """
+        tx = Transaction(expiration=self.expiration, delay=self.delay,
+                         gas_ratio=self.gas_ratio, gas_limit=self.gas_limit,
+                         actions=list(actions), chain_id=self.chain_id, time=self.time_source())
+        tx.add_amount_limit('*', self.default_limit)
+        for token, amount in (amount_limits or {}).items():
+            tx.add_amount_limit(token, amount)
+        return tx
+
+    def create_call_tx(self, contract: str, abi: str, *args) -> Transaction:
+        """Creates an unsigned `Transaction` that contains an `Action` to call an abi.
+
+        Args:
+            contract: The name of the contract.
+            abi: The name of the abi to call.
+            *args: The arguments to pass to the abi.
+
+        Returns:
+            A `Transaction` object.
+        """
+        return self.create_unsigned_tx([Action(contract, abi, *args)])
+
+    def create_transfer_tx(self, token: str, from_name: str, to_name: str, amount: float, memo='',
+                           decimal: int = None) -> Transaction:
+        """Creates an unsigned `Transaction` that contains an `Action` to transfer tokens between accounts.
+
+        Args:
+            token: The name of the token.
+            from_name: The account name to send tokens from.
+            to_name: The account name to send tokens to.
+            amount: The amount of tokens to send, formatted with the precision of the token by `format_amount`.
+            memo: A text to add to the transaction.
+            decimal: The precision of the token, by default the one in `token_decimals`.
+
+        Returns:
+            A `Transaction` object.
+
+        Raises:
+            ValueError: If the amount is not an integer or a string and the precision of the token is unknown.
+        """
+        amount = self.format_amount(token, amount, decimal)
+        return self.create_unsigned_tx([Action('token.iost', 'transfer', token, from_name, to_name, amount, memo)],
+                                       {token: amount})
+
+    def sign(self, tx: Transaction, signers: List[Tuple[Account, str]] = None) -> Tuple[str, bytes]:
+        """Signs a `Transaction` with its signers then with the `publisher`, and serializes it.
+
+        Args:
+            tx: The unsigned `Transaction`.
+            signers: The accounts that sign the `Transaction` before the publisher, with their permission.
+
+        Returns:
+            The base58 hash of the `Transaction`, and its serialized ``TransactionRequest``.
+        """
+        for account, permission in signers or []:
+            tx.add_signer(account.name, permission)
+        for account, permission in signers or []:
+            account.sign(tx, permission)
+        self.publisher.sign_publish(tx)
+        return b58encode(tx._hash()).decode(), encode_tx_request(tx)
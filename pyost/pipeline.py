@@ -0,0 +1,201 @@
+from __future__ import annotations
+import json
+import time
+import threading
+from queue import Queue, Empty, Full
+from typing import List, Iterable, Iterator, Callable, Any, Union
+
+from pyost.event import Event
+
+
+class ContractReceipt:
+    """A decoded ``CONTRACT_RECEIPT`` event.
+
+    Attributes:
+        time: The timestamp of the event.
+        data: The raw data of the event.
+        value: The JSON-decoded data, or the raw data if it is not valid JSON.
+    """
+    __slots__ = ('time', 'data', 'value')
+    topic = Event.Topic.CONTRACT_RECEIPT
+
+    def __init__(self, time: int = 0, data: str = '', value: Any = None):
+        self.time: int = time
+        self.data: str = data
+        self.value: Any = value
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(time={self.time}, value={self.value!r})'
+
+
+class ContractEvent(ContractReceipt):
+    """A decoded ``CONTRACT_EVENT`` event.
+
+    Attributes:
+        time: The timestamp of the event.
+        data: The raw data of the event.
+        value: The JSON-decoded data, or the raw data if it is not valid JSON.
+    """
+    __slots__ = ()
+    topic = Event.Topic.CONTRACT_EVENT
+
+
+DecodedEvent = Union[ContractReceipt, ContractEvent]
+
+_RECORDS = {
+    Event.Topic.CONTRACT_RECEIPT: ContractReceipt,
+    Event.Topic.CONTRACT_EVENT: ContractEvent,
+}
+
+
+def _loads(data: str) -> Any:
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data
+
+
+def decode_events(events: List[Event]) -> List[Union[DecodedEvent, Event]]:
+    """Decodes the JSON data of a list of events into typed records.
+
+    Each payload is parsed on its own, so that an invalid payload cannot merge with its neighbours.
+    The events whose topic cannot be decoded, such as ``UNKNOWN``, are returned as they are.
+
+    Args:
+        events: The list of `Event` to decode.
+
+    Returns:
+        A list of `ContractReceipt`, `ContractEvent` and undecoded `Event`, in the same order as `events`.
+    """
+    records = []
+    for e in events:
+        record = _RECORDS.get(e.topic)
+        records.append(record(e.time, e.data, _loads(e.data)) if record is not None else e)
+    return records
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error: BaseException = error
+
+
+_END = object()
+
+
+class EventBatcher:
+    """Gathers a stream of events into micro-batches, flushed by count or by time.
+
+    The source is consumed by a background thread so that a batch is handed downstream
+    once `max_delay` seconds have passed after its first event, even if the source is idle.
+
+    Args:
+        events: The source of `Event`, such as `IOST.subscribe` or `IOST.subscribe_resilient`.
+        max_size: The maximum number of events in a batch.
+        max_delay: The maximum number of seconds to wait for a batch to fill up.
+        decode: If True, the batches contain records decoded by `decode_events` instead of `Event`,
+            the events of unknown topics are left undecoded.
+        buffer_size: The maximum number of events read ahead, by default 4 x `max_size`.
+
+    Example:
+        >>> batcher = EventBatcher(iost.subscribe(topics, contract_id), max_size=500, max_delay=0.2)
+        >>> for batch in batcher:
+        >>>     store(batch)
+    """
+
+    PUT_TIMEOUT = 0.1  #: Seconds between two checks of `close` by the reader thread while the buffer is full.
+
+    def __init__(self, events: Iterable[Event], max_size: int = 256, max_delay: float = 0.1,
+                 decode: bool = True, buffer_size: int = None):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.max_size: int = max_size
+        self.max_delay: float = max_delay
+        self.decode: bool = decode
+        self._events: Iterable[Event] = events
+        self._queue: Queue = Queue(buffer_size or 4 * max_size)
+        self._thread: threading.Thread = None
+        self._closed: bool = False
+
+    def __iter__(self) -> Iterator[List[Union[Event, DecodedEvent]]]:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._read, daemon=True)
+            self._thread.start()
+
+        while not self._closed:
+            item = self._queue.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            end = None
+            while len(batch) < self.max_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is _END or isinstance(item, _Failure):
+                    end = item
+                    break
+                batch.append(item)
+
+            yield decode_events(batch) if self.decode else batch
+
+            if end is _END:
+                return
+            if end is not None:
+                raise end.error
+
+    def run(self, handler: Callable[[List[Union[Event, DecodedEvent]]], None]) -> None:
+        """Hands each batch to a handler until the source is exhausted or `close` is called.
+
+        Args:
+            handler: A function called with each batch.
+        """
+        for batch in self:
+            handler(batch)
+
+    def close(self) -> None:
+        """Stops reading the source, and the iteration after the current batch.
+
+        The source is cancelled or closed if it provides a ``cancel`` or a ``close`` method, as `Subscription`,
+        `ResilientSubscription` and gRPC streams do, so that the reader thread is not left blocked on it.
+        """
+        self._closed = True
+        for name in ('cancel', 'close'):
+            stop = getattr(self._events, name, None)
+            if stop is not None:
+                try:
+                    stop()
+                except ValueError:
+                    # A generator cannot be closed while the reader thread runs it,
+                    # the reader stops at the next event instead.
+                    pass
+                break
+        try:
+            self._queue.put_nowait(_END)
+        except Full:
+            pass
+
+    def _put(self, item) -> bool:
+        while not self._closed:
+            try:
+                self._queue.put(item, timeout=self.PUT_TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _read(self) -> None:
+        try:
+            for event in self._events:
+                if not self._put(event):
+                    return
+        except Exception as e:
+            if not self._closed:
+                self._put(_Failure(e))
+            return
+        self._put(_END)
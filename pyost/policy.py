@@ -0,0 +1,229 @@
+from __future__ import annotations
+import queue
+import random
+import threading
+import time
+from typing import List, Dict, Tuple, Any
+
+from pyost.lazy import lazy_import
+
+grpc = lazy_import('grpc')
+metrics = lazy_import('pyost.metrics')
+
+READ_METHODS = frozenset((
+    'GetNodeInfo', 'GetChainInfo', 'GetRAMInfo', 'GetTxByHash', 'GetTxReceiptByTxHash',
+    'GetBlockByHash', 'GetBlockByNumber', 'GetAccount', 'GetTokenBalance', 'GetToken721Balance',
+    'GetToken721Metadata', 'GetToken721Owner', 'GetGasRatio', 'GetContract', 'GetContractStorage',
+    'GetBatchContractStorage', 'GetContractStorageFields', 'GetTokenInfo', 'GetProducerVoteInfo',
+    'GetVoterBonus', 'GetCandidateBonus',
+))  #: The idempotent methods of ``ApiService``, that can be retried and hedged.
+
+RETRY_CODES = ('UNAVAILABLE', 'DEADLINE_EXCEEDED')  #: The names of the `grpc.StatusCode` retried by default.
+
+
+class RetryBudget:
+    """Limits the retries of all the calls sharing it, so that retries cannot overload a failing node.
+
+    This is the token bucket of gRPC's retry throttling: each retryable failure removes a token,
+    each success adds `token_ratio` tokens, and retries are only allowed while more than half
+    of the `max_tokens` are left.
+
+    Args:
+        max_tokens: The size of the bucket.
+        token_ratio: The number of tokens added by a successful call.
+
+    Attributes:
+        max_tokens: The size of the bucket.
+        token_ratio: The number of tokens added by a successful call.
+        tokens: The current number of tokens.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        if max_tokens <= 0:
+            raise ValueError('max_tokens must be positive.')
+        self.max_tokens: float = max_tokens
+        self.token_ratio: float = token_ratio
+        self.tokens: float = max_tokens
+        self._lock = threading.Lock()
+
+    def on_success(self) -> None:
+        """Adds `token_ratio` tokens, up to `max_tokens`."""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.token_ratio)
+
+    def on_failure(self) -> None:
+        """Removes a token."""
+        with self._lock:
+            self.tokens = max(0.0, self.tokens - 1.0)
+
+    def can_retry(self) -> bool:
+        """Tells if a failed call may be retried.
+
+        Returns:
+            True if more than half of the tokens are left.
+        """
+        with self._lock:
+            return self.tokens > self.max_tokens / 2
+
+
+class CallPolicy:
+    """Applies deadlines, retries and hedging to the unary calls of an `IOST` client.
+
+    Every call gets a deadline, so that a stuck call raises a ``DEADLINE_EXCEEDED`` `grpc.RpcError`
+    instead of blocking forever. The idempotent `read_methods` are also retried on `retry_codes`
+    with exponential backoff and full jitter, within the limits of a `RetryBudget`.
+
+    When the client has hedge nodes, a read that has not completed after the `hedge_quantile` of
+    its recent latencies is sent again to the hedge nodes, and the first successful response wins.
+    Hedging starts once `hedge_min_samples` calls of the method have been observed.
+
+    Args:
+        deadline: The default deadline of a call, in seconds.
+        deadlines: The deadlines of specific methods, such as ``{'GetBlockByNumber': 30.0}``.
+            A deadline of None means no deadline.
+        max_attempts: The maximum number of attempts of a read method, including the first one.
+        initial_backoff: The maximum delay before the first retry, in seconds.
+        max_backoff: The maximum delay between two attempts, in seconds.
+        backoff_multiplier: The factor applied to the maximum delay after each retry.
+        retry_codes: The `grpc.StatusCode`, or their names, that make a read method retried.
+        budget: The `RetryBudget` shared by the calls, a new one by default.
+        hedge_quantile: The latency quantile after which a read is hedged.
+        hedge_min_delay: The minimum delay before hedging a read, in seconds.
+        hedge_min_samples: The number of latencies of a method observed before hedging it.
+        read_methods: The names of the methods that can be retried and hedged.
+
+    Attributes:
+        budget: The `RetryBudget`.
+        retries: The number of retried attempts.
+        hedges: The number of hedged attempts.
+
+    Example:
+        >>> policy = CallPolicy(deadline=5.0, deadlines={'GetBlockByNumber': 20.0})
+        >>> iost = IOST('node1:30002', policy=policy, hedge_urls=['node2:30002'])
+    """
+
+    def __init__(self, deadline: float = 30.0, deadlines: Dict[str, float] = None,
+                 max_attempts: int = 3, initial_backoff: float = 0.1, max_backoff: float = 2.0,
+                 backoff_multiplier: float = 2.0, retry_codes: Tuple = RETRY_CODES,
+                 budget: RetryBudget = None, hedge_quantile: float = 0.95, hedge_min_delay: float = 0.005,
+                 hedge_min_samples: int = 20, read_methods=READ_METHODS):
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1.')
+        self.deadline: float = deadline
+        self.deadlines: Dict[str, float] = dict(deadlines or {})
+        self.max_attempts: int = max_attempts
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.backoff_multiplier: float = backoff_multiplier
+        self.retry_codes: Tuple[grpc.StatusCode, ...] = tuple(
+            grpc.StatusCode[code] if isinstance(code, str) else code for code in retry_codes)
+        self.budget: RetryBudget = budget or RetryBudget()
+        self.hedge_quantile: float = hedge_quantile
+        self.hedge_min_delay: float = hedge_min_delay
+        self.hedge_min_samples: int = hedge_min_samples
+        self.read_methods = frozenset(read_methods)
+        self.retries: int = 0
+        self.hedges: int = 0
+        self._latencies: Dict[str, metrics.Histogram] = {}
+        self._lock = threading.Lock()
+
+    def deadline_for(self, method: str) -> float:
+        """Gets the deadline of a method.
+
+        Args:
+            method: The name of the method, such as ``GetChainInfo``.
+
+        Returns:
+            The deadline in seconds, None if the method has no deadline.
+        """
+        return self.deadlines.get(method, self.deadline)
+
+    def hedge_delay(self, method: str) -> float:
+        """Gets the delay after which a call of a method is hedged.
+
+        Args:
+            method: The name of the method.
+
+        Returns:
+            The delay in seconds, None if the method has not been observed enough to be hedged.
+        """
+        with self._lock:
+            histogram = self._latencies.get(method)
+            if histogram is None or histogram.count < self.hedge_min_samples:
+                return None
+            return max(self.hedge_min_delay, histogram.quantile(self.hedge_quantile))
+
+    def call(self, stubs: List[Any], method: str, request) -> Any:
+        """Calls a method of the first stub, retrying and hedging it on the others if it is a read.
+
+        Args:
+            stubs: The ``ApiServiceStub`` of the primary node, then those of the hedge nodes.
+            method: The name of the method, such as ``GetChainInfo``.
+            request: The request message.
+
+        Returns:
+            The response message.
+
+        Raises:
+            grpc.RpcError: If the last attempt fails.
+        """
+        read = method in self.read_methods
+        attempts = self.max_attempts if read else 1
+        backoff = self.initial_backoff
+        for attempt in range(attempts):
+            try:
+                response = self._attempt(stubs if read else stubs[:1], method, request)
+            except grpc.RpcError as e:
+                if e.code() not in self.retry_codes:
+                    raise
+                self.budget.on_failure()
+                if attempt + 1 >= attempts or not self.budget.can_retry():
+                    raise
+                time.sleep(random.uniform(0, backoff))
+                backoff = min(self.max_backoff, backoff * self.backoff_multiplier)
+                with self._lock:
+                    self.retries += 1
+            else:
+                self.budget.on_success()
+                return response
+
+    def _observe(self, method: str, latency: float) -> None:
+        with self._lock:
+            histogram = self._latencies.get(method)
+            if histogram is None:
+                histogram = self._latencies[method] = metrics.Histogram()
+            histogram.observe(latency)
+
+    def _attempt(self, stubs: List[Any], method: str, request) -> Any:
+        timeout = self.deadline_for(method)
+        started = time.perf_counter()
+        delay = self.hedge_delay(method) if len(stubs) > 1 else None
+        if delay is None:
+            response = getattr(stubs[0], method)(request, timeout=timeout)
+            self._observe(method, time.perf_counter() - started)
+            return response
+
+        done = queue.Queue()
+        primary = getattr(stubs[0], method).future(request, timeout=timeout)
+        primary.add_done_callback(done.put)
+        futures = [primary]
+        try:
+            first = done.get(timeout=delay)
+        except queue.Empty:
+            with self._lock:
+                self.hedges += 1
+            for stub in stubs[1:]:
+                future = getattr(stub, method).future(request, timeout=timeout)
+                future.add_done_callback(done.put)
+                futures.append(future)
+            first = done.get()
+        pending = len(futures) - 1
+        while first.code() != grpc.StatusCode.OK and pending:
+            first = done.get()
+            pending -= 1
+        for future in futures:
+            if future is not first:
+                future.cancel()
+        if first is primary and first.code() == grpc.StatusCode.OK:
+            self._observe(method, time.perf_counter() - started)
+        return first.result()
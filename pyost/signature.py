@@ -1,9 +1,12 @@
+from __future__ import annotations
 from typing import Type
-from base58 import b58encode
+from pyost.b58 import b58encode
 
-from pyost.rpc.pb import rpc_pb2 as pb
 from pyost.algorithm import Algorithm, get_algorithm_by_id
 from pyost.simpleencoder import SimpleEncoder
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
 
 
 class Signature:
@@ -89,16 +92,17 @@ class KeyPair:
     Args:
         algo_cls: The class type of the `Algorithm` to use, such as `Ed25519`.
         seckey: The secret key, if None a new secret key will be generated with the `Algorithm` factory method.
+        pubkey: The public key of `seckey` if it is already known, if None it is inferred from the secret key.
 
     Attributes:
         algo_cls: The class type of the `Algorithm` used to create the keys.
         seckey: The secret key generated by the `Algorithm`.
         pubkey: The public key inferred from the secret key.
     """
-    def __init__(self, algo_cls: Type[Algorithm], seckey: bytes = None):
+    def __init__(self, algo_cls: Type[Algorithm], seckey: bytes = None, pubkey: bytes = None):
         self.algo_cls: Type[Algorithm] = algo_cls
         self.seckey: bytes = seckey if seckey is not None else algo_cls.gen_seckey()
-        self.pubkey: bytes = algo_cls.get_pubkey(self.seckey)
+        self.pubkey: bytes = pubkey if pubkey is not None and seckey is not None else algo_cls.get_pubkey(self.seckey)
 
     def __repr__(self):
         return f"{{'algo_cls': {self.algo_cls.__int__()},\n" \
@@ -0,0 +1,256 @@
+from __future__ import annotations
+import time
+import random
+from collections import Counter, deque
+from typing import List, Iterator, TYPE_CHECKING
+
+from pyost.blockchain import Block
+from pyost.event import Event, SubscribeRequest
+from pyost.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from pyost.iost import IOST
+
+grpc = lazy_import('grpc')
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+
+
+class Subscription:
+    """Iterates over the events of a ``Subscribe`` stream, and can be cancelled from another thread.
+
+    Args:
+        call: The ``Subscribe`` call.
+
+    Example:
+        >>> subscription = iost.subscribe(topics, contract_id)
+        >>> threading.Timer(60, subscription.close).start()
+        >>> for event in subscription:
+        >>>     print(event)
+    """
+
+    def __init__(self, call):
+        self._call = call
+
+    def __iter__(self) -> Iterator[Event]:
+        try:
+            for res in self._call:
+                yield Event().from_raw(res.event)
+        except grpc.RpcError as e:
+            if not (isinstance(e, grpc.Call) and e.code() == grpc.StatusCode.CANCELLED):
+                raise
+
+    def close(self) -> None:
+        """Cancels the stream, the iteration stops."""
+        self._call.cancel()
+
+
+class ResilientSubscription:
+    """Subscribes to a list of topics and survives dropped ``Subscribe`` streams.
+
+    When the stream breaks, reconnects with an exponential backoff, then fills the gap by
+    scanning the blocks produced since the previous connection with ``complete=True``
+    and extracting the receipts of the filtered contract.
+    The events of the blocks where the backfill and the streams overlap are deduplicated,
+    so that each one is yielded exactly once.
+
+    Args:
+        iost: The `IOST` client used to open streams and fetch blocks.
+        topics: A list of `Event.Topic` to listen to.
+        contract_id: A filter to only listen to the events of a particular contract.
+        start_block: If set, the receipts of the blocks after this number are backfilled
+            when the first stream is opened, e.g. to resume from a persisted `last_block`.
+        min_backoff: The number of seconds to wait before the first reconnection attempt.
+        max_backoff: The maximum number of seconds to wait between two reconnection attempts.
+        max_retry: The number of consecutive failed attempts before giving up, None means forever.
+        dedupe_size: The maximum number of events remembered at the edges of the backfills to drop duplicates.
+
+    Attributes:
+        last_time: The `time` of the last `Event` yielded.
+        last_block: The number of the last block known to be covered by either the stream or the backfill.
+        reconnects: The number of times the stream has been reopened.
+
+    Warning:
+        Only ``CONTRACT_RECEIPT`` events can be rebuilt from blocks, ``CONTRACT_EVENT`` events
+            emitted while disconnected are lost.
+        Events are identified by their topic and data. Where a backfill overlaps a stream, two identical
+            events are yielded as many times as the block or the stream that has the most of them.
+
+    Example:
+        >>> for event in iost.subscribe_resilient(topics, contract_id):
+        >>>     print(event)
+    """
+
+    TIME_MARGIN = 3 * 10 ** 9  #: Nanoseconds between a block's time and the time of its events, used to skip blocks.
+
+    def __init__(self, iost: IOST, topics: List[Event.Topic], contract_id: str = '',
+                 start_block: int = None, min_backoff: float = 1.0, max_backoff: float = 30.0,
+                 max_retry: int = None, dedupe_size: int = 10000):
+        self.topics: List[Event.Topic] = topics
+        self.contract_id: str = contract_id
+        self.min_backoff: float = min_backoff
+        self.max_backoff: float = max_backoff
+        self.max_retry: int = max_retry
+        self.dedupe_size: int = dedupe_size
+        self.last_time: int = 0
+        self.last_block: int = start_block
+        self.reconnects: int = 0
+        self._iost: IOST = iost
+        # The events yielded within TIME_MARGIN of the last one, which the next backfill may rebuild.
+        self._recent: deque = deque()
+        self._recent_keys: Counter = Counter()
+        # The events of the previous streams that the running backfill has not rebuilt yet.
+        self._streamed: Counter = Counter()
+        # The events of the last backfill, which the new stream may yield again until its time passes `_backfill_end`.
+        self._backfilled: Counter = Counter()
+        self._backfill_end: int = 0
+        self._call = None
+        self._closed: bool = False
+
+    def __iter__(self) -> Iterator[Event]:
+        failures = 0
+        while not self._closed:
+            try:
+                # The stream is opened before reading the head block so that no block can fall
+                # between the end of the backfill and the first event of the stream.
+                self._call = self._iost.next_stub().Subscribe(SubscribeRequest(self.topics, self.contract_id).to_raw())
+                head_block = self._iost.get_chain_info().head_block
+                if self.last_block is not None:
+                    first_block = self.last_block + 1
+                    if self.last_time > 0:
+                        first_block = self._first_block_since(self.last_time - self.TIME_MARGIN,
+                                                              first_block, head_block)
+                    for event in self._backfill(first_block, head_block):
+                        yield event
+                self.last_block = head_block
+
+                for res in self._call:
+                    failures = 0
+                    event = Event().from_raw(res.event)
+                    if self._accept_streamed(event):
+                        yield event
+                # The server closed the stream gracefully, reconnect after the same backoff as after an error,
+                # so that a server that keeps closing the streams is not flooded.
+                if not self._closed:
+                    failures += 1
+                    time.sleep(self._backoff(failures))
+            except grpc.RpcError as e:
+                if self._closed or (isinstance(e, grpc.Call) and e.code() == grpc.StatusCode.CANCELLED):
+                    return
+                failures += 1
+                if self.max_retry is not None and failures > self.max_retry:
+                    raise ConnectionError(f'Subscription lost after {failures} attempts') from e
+                time.sleep(self._backoff(failures))
+            finally:
+                self._cancel()
+            self.reconnects += 1
+
+    def close(self) -> None:
+        """Cancels the underlying stream and stops the iteration."""
+        self._closed = True
+        self._cancel()
+
+    def _cancel(self) -> None:
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+
+    def _backoff(self, failures: int) -> float:
+        """Returns the number of seconds to wait before the next attempt, with full jitter."""
+        delay = min(self.max_backoff, self.min_backoff * 2 ** (failures - 1))
+        return random.uniform(self.min_backoff, max(self.min_backoff, delay))
+
+    def _accept_streamed(self, event: Event) -> bool:
+        """Tells whether an event of the stream has not been yielded by the last backfill, and remembers it."""
+        key = (event.topic, event.data)
+        if self._backfilled:
+            if event.time > self._backfill_end:
+                self._backfilled.clear()
+            elif self._backfilled[key] > 0:
+                self._backfilled[key] -= 1
+                return False
+        self._remember(event.time, key)
+        return True
+
+    def _accept_backfilled(self, event: Event) -> bool:
+        """Tells whether an event of a backfill has not been yielded by a previous stream, and remembers it."""
+        key = (event.topic, event.data)
+        if self._streamed[key] > 0:
+            self._streamed[key] -= 1
+            return False
+        if len(self._backfilled) < self.dedupe_size:
+            self._backfilled[key] += 1
+        self._remember(event.time, key)
+        return True
+
+    def _remember(self, timestamp: int, key: tuple) -> None:
+        self.last_time = max(self.last_time, timestamp)
+        self._recent.append((timestamp, key))
+        self._recent_keys[key] += 1
+        while self._recent and (self._recent[0][0] < self.last_time - self.TIME_MARGIN
+                                or len(self._recent) > self.dedupe_size):
+            _, old_key = self._recent.popleft()
+            self._recent_keys[old_key] -= 1
+            if self._recent_keys[old_key] <= 0:
+                del self._recent_keys[old_key]
+
+    def _first_block_since(self, timestamp: int, first_block: int, last_block: int) -> int:
+        """Binary searches the first block created at or after a timestamp.
+
+        Args:
+            timestamp: The time in nanoseconds.
+            first_block: The lower bound of the search.
+            last_block: The upper bound of the search.
+
+        Returns:
+            The number of the block, or `last_block` + 1 if all the blocks are older.
+        """
+        lo, hi = first_block, last_block + 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._iost.get_block_by_num(mid).time < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _backfill(self, first_block: int, last_block: int) -> Iterator[Event]:
+        """Rebuilds the ``CONTRACT_RECEIPT`` events of a range of blocks.
+
+        Args:
+            first_block: The number of the first block to scan.
+            last_block: The number of the last block to scan, included.
+
+        Yields:
+            The `Events` that have not been seen yet.
+        """
+        self._backfilled.clear()
+        if Event.Topic.CONTRACT_RECEIPT not in self.topics:
+            return
+        self._streamed = Counter(self._recent_keys)
+        for number in range(first_block, last_block + 1):
+            block = self._iost.get_block_by_num(number, complete=True)
+            self._backfill_end = block.time + self.TIME_MARGIN
+            for event in receipt_events(block, self.contract_id):
+                if self._accept_backfilled(event):
+                    yield event
+        self._streamed.clear()
+
+
+def receipt_events(block: Block, contract_id: str = '') -> Iterator[Event]:
+    """Extracts the ``CONTRACT_RECEIPT`` events from the transactions' receipts of a block.
+
+    Args:
+        block: A `Block` retrieved with ``complete=True``.
+        contract_id: Only extracts the receipts of the functions of this contract, all if empty.
+
+    Yields:
+        An `Event` per receipt, its `time` is the time of the block.
+    """
+    prefix = contract_id + '/'
+    for tx in block.transactions:
+        if tx.tx_receipt is None:
+            continue
+        for receipt in tx.tx_receipt.receipts:
+            if contract_id == '' or receipt.func_name.startswith(prefix):
+                yield Event().from_raw(pb.Event(topic=pb.Event.CONTRACT_RECEIPT,
+                                                data=receipt.content, time=block.time))
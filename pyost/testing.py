@@ -0,0 +1,438 @@
+from __future__ import annotations
+import json
+import queue
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha3_256 as sha3
+from typing import List, Dict, Tuple, Iterator
+
+import grpc
+
+from pyost.rpc.pb import rpc_pb2 as pb, rpc_pb2_grpc
+from pyost.b58 import b58encode
+
+
+def _hash(data: bytes) -> str:
+    return b58encode(sha3(data).digest()).decode()
+
+
+class FakeNode(rpc_pb2_grpc.ApiServiceServicer):
+    """An in-process fake IOST node serving the ``ApiService`` over gRPC from an in-memory chain.
+
+    Sent transactions are executed when the next block is produced, every `block_time` seconds
+    or on each call to `produce_block`. Only ``token.iost transfer`` and ``auth.iost signUp`` change
+    the state, any other `Action` succeeds without effect. Each executed `Action` adds a receipt
+    named ``contract/action_name`` whose content is the `Action` data, and each receipt
+    is published to the ``CONTRACT_RECEIPT`` subscribers.
+
+    Hashes are computed from the serialized messages: they are unique but differ from a real node's.
+
+    Args:
+        block_time: The number of seconds between two blocks, 0 to only produce blocks with `produce_block`.
+        latency: The number of seconds each unary call waits before being processed.
+        failure_rate: The probability that a call fails with ``UNAVAILABLE``.
+        lib_lag: The number of blocks between the head block and the last irreversible block.
+        gas_per_action: The gas used by each `Action`.
+        chain_id: The chain id, transactions with another chain id are rejected.
+        seed: The seed of the random failures.
+        max_workers: The number of threads of the gRPC server.
+
+    Attributes:
+        blocks: The list of produced blocks, the first one is the genesis block.
+        balances: The token balances by account name and token.
+        storage: The contract storage values by contract id, key and field.
+        contracts: The contracts by id.
+        token_infos: The token information by symbol.
+        calls: The number of calls by method name.
+
+    Example:
+        >>> with FakeNode(block_time=0.1) as node:
+        >>>     node.add_account('admin', 1000.0)
+        >>>     iost = IOST(node.url)
+    """
+
+    def __init__(self, block_time: float = 0.5, latency: float = 0.0, failure_rate: float = 0.0,
+                 lib_lag: int = 2, gas_per_action: float = 1000.0, chain_id: int = 1024,
+                 seed: int = None, max_workers: int = 32):
+        self.block_time: float = block_time
+        self.latency: float = latency
+        self.failure_rate: float = failure_rate
+        self.lib_lag: int = lib_lag
+        self.gas_per_action: float = gas_per_action
+        self.chain_id: int = chain_id
+        self.max_workers: int = max_workers
+        self.blocks: List[pb.Block] = [pb.Block(hash=_hash(b'genesis'), number=0, time=time.time_ns(),
+                                                witness='fake')]
+        self.balances: Dict[Tuple[str, str], float] = {}
+        self.storage: Dict[Tuple[str, str, str], str] = {}
+        self.contracts: Dict[str, pb.Contract] = {}
+        self.token_infos: Dict[str, pb.TokenInfo] = {
+            'iost': pb.TokenInfo(symbol='iost', full_name='IOST', issuer='token.iost',
+                                 total_supply=90000000000, current_supply=21000000000, decimal=8, can_transfer=True)}
+        self.calls: Counter = Counter()
+        self._accounts: Dict[str, pb.Account] = {}
+        self._pending: List[Tuple[str, pb.Transaction]] = []
+        self._txs: Dict[str, Tuple[pb.Transaction, int]] = {}
+        self._failures: Dict[str, deque] = {}
+        self._subscribers: List[Tuple[pb.SubscribeRequest, queue.Queue]] = []
+        self._random: random.Random = random.Random(seed)
+        self._lock: threading.RLock = threading.RLock()
+        self._server: grpc.Server = None
+        self._thread: threading.Thread = None
+        self._stopped: threading.Event = threading.Event()
+        self.port: int = None
+
+    @property
+    def url(self) -> str:
+        """The URL to connect to, once the node is started."""
+        return f'localhost:{self.port}'
+
+    def __enter__(self) -> FakeNode:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self, port: int = 0) -> FakeNode:
+        """Starts the gRPC server and the block production.
+
+        Args:
+            port: The port to listen to on localhost, 0 to pick a free port.
+
+        Returns:
+            Itself.
+        """
+        self._server = grpc.server(ThreadPoolExecutor(self.max_workers))
+        rpc_pb2_grpc.add_ApiServiceServicer_to_server(self, self._server)
+        self.port = self._server.add_insecure_port(f'localhost:{port}')
+        self._server.start()
+        self._stopped.clear()
+        if self.block_time > 0:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, grace: float = None) -> None:
+        """Stops the block production and the gRPC server.
+
+        Args:
+            grace: The number of seconds given to the running calls to complete.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def add_account(self, name: str, balance: float = 0.0, token: str = 'iost') -> FakeNode:
+        """Creates an account.
+
+        Args:
+            name: The name of the account.
+            balance: Its initial balance.
+            token: The token of the initial balance.
+
+        Returns:
+            Itself.
+        """
+        with self._lock:
+            self._accounts[name] = pb.Account(name=name)
+            self.balances[(name, token)] = balance
+        return self
+
+    def set_storage(self, contract_id: str, key: str, value: str, field: str = '') -> FakeNode:
+        """Sets a value of the storage of a contract.
+
+        Args:
+            contract_id: The id of the contract.
+            key: The key.
+            value: The value, usually a JSON string.
+            field: The field of the key if it is a map.
+
+        Returns:
+            Itself.
+        """
+        with self._lock:
+            self.storage[(contract_id, key, field)] = value
+        return self
+
+    def fail_next(self, method: str, count: int = 1, code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE) -> FakeNode:
+        """Makes the next calls to a method fail.
+
+        Args:
+            method: The name of the method, such as ``GetChainInfo``.
+            count: The number of calls that fail.
+            code: The status code of the failures.
+
+        Returns:
+            Itself.
+        """
+        with self._lock:
+            self._failures.setdefault(method, deque()).extend([code] * count)
+        return self
+
+    def produce_block(self) -> pb.Block:
+        """Executes the pending transactions in a new block and publishes their receipts to the subscribers.
+
+        Returns:
+            The new block.
+        """
+        with self._lock:
+            parent = self.blocks[-1]
+            number = parent.number + 1
+            txs = []
+            for tx_hash, tx in self._pending:
+                tx.tx_receipt.CopyFrom(self._execute(tx_hash, tx, commit=True))
+                txs.append(tx)
+                self._txs[tx_hash] = (tx, number)
+            self._pending = []
+            block = pb.Block(number=number, parent_hash=parent.hash, time=time.time_ns(), witness='fake',
+                             tx_count=len(txs), gas_usage=sum(tx.tx_receipt.gas_usage for tx in txs),
+                             transactions=txs)
+            block.hash = _hash(block.SerializeToString())
+            self.blocks.append(block)
+            for tx in txs:
+                for receipt in tx.tx_receipt.receipts:
+                    self._publish(pb.Event(topic=pb.Event.CONTRACT_RECEIPT, data=receipt.content,
+                                           time=block.time), receipt.func_name)
+        return block
+
+    def emit_event(self, contract_id: str, data: str) -> None:
+        """Publishes a ``CONTRACT_EVENT`` to the subscribers.
+
+        Args:
+            contract_id: The id of the contract that emits the event.
+            data: The data of the event.
+        """
+        with self._lock:
+            self._publish(pb.Event(topic=pb.Event.CONTRACT_EVENT, data=data, time=time.time_ns()), contract_id)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.block_time):
+            self.produce_block()
+
+    def _publish(self, event: pb.Event, source: str) -> None:
+        for request, events in self._subscribers:
+            contract_id = request.filter.contract_id
+            if event.topic in request.topics and (not contract_id or source.split('/')[0] == contract_id):
+                events.put(event)
+
+    def _enter(self, method: str, context: grpc.ServicerContext) -> None:
+        with self._lock:
+            self.calls[method] += 1
+            failures = self._failures.get(method)
+            code = failures.popleft() if failures else None
+            if code is None and self.failure_rate > 0 and self._random.random() < self.failure_rate:
+                code = grpc.StatusCode.UNAVAILABLE
+        if self.latency > 0:
+            time.sleep(self.latency)
+        if code is not None:
+            context.abort(code, f'Injected failure of {method}.')
+
+    @property
+    def _lib(self) -> int:
+        return max(0, len(self.blocks) - 1 - self.lib_lag)
+
+    def _execute(self, tx_hash: str, tx: pb.Transaction, commit: bool) -> pb.TxReceipt:
+        balances = {}
+        accounts = {}
+        receipt = pb.TxReceipt(tx_hash=tx_hash, status_code=pb.TxReceipt.SUCCESS)
+        for action in tx.actions:
+            receipt.gas_usage += self.gas_per_action
+            if receipt.gas_usage > tx.gas_limit:
+                return pb.TxReceipt(tx_hash=tx_hash, gas_usage=tx.gas_limit, status_code=pb.TxReceipt.GAS_RUN_OUT,
+                                    message='out of gas')
+            try:
+                args = json.loads(action.data)
+            except ValueError:
+                return pb.TxReceipt(tx_hash=tx_hash, status_code=pb.TxReceipt.WRONG_PARAMETER,
+                                    message=f'invalid action data: {action.data}')
+            if (action.contract, action.action_name) == ('token.iost', 'transfer'):
+                token, from_name, to_name, amount = args[0], args[1], args[2], float(args[3])
+                from_balance = balances.get((from_name, token), self.balances.get((from_name, token), 0.0))
+                if from_balance < amount:
+                    return pb.TxReceipt(tx_hash=tx_hash, gas_usage=receipt.gas_usage,
+                                        status_code=pb.TxReceipt.BALANCE_NOT_ENOUGH,
+                                        message=f'balance not enough {from_balance} < {amount}')
+                balances[(from_name, token)] = from_balance - amount
+                balances[(to_name, token)] = balances.get((to_name, token),
+                                                          self.balances.get((to_name, token), 0.0)) + amount
+            elif (action.contract, action.action_name) == ('auth.iost', 'signUp'):
+                if args[0] in self._accounts or args[0] in accounts:
+                    return pb.TxReceipt(tx_hash=tx_hash, gas_usage=receipt.gas_usage,
+                                        status_code=pb.TxReceipt.RUNTIME_ERROR, message=f'id existed: {args[0]}')
+                accounts[args[0]] = pb.Account(name=args[0])
+            receipt.returns.append('')
+            receipt.receipts.add(func_name=f'{action.contract}/{action.action_name}', content=action.data)
+        if commit:
+            self.balances.update(balances)
+            self._accounts.update(accounts)
+        return receipt
+
+    @staticmethod
+    def _to_tx(tx_hash: str, request: pb.TransactionRequest) -> pb.Transaction:
+        return pb.Transaction(hash=tx_hash, time=request.time, expiration=request.expiration,
+                              gas_ratio=request.gas_ratio, gas_limit=request.gas_limit, delay=request.delay,
+                              chain_id=request.chain_id, actions=request.actions, signers=request.signers,
+                              publisher=request.publisher, amount_limit=request.amount_limit)
+
+    def _block_response(self, block: pb.Block, complete: bool) -> pb.BlockResponse:
+        status = pb.BlockResponse.IRREVERSIBLE if block.number <= self._lib else pb.BlockResponse.PENDING
+        if not complete and block.transactions:
+            block = pb.Block(hash=block.hash, number=block.number, parent_hash=block.parent_hash, time=block.time,
+                             witness=block.witness, tx_count=block.tx_count, gas_usage=block.gas_usage)
+        return pb.BlockResponse(status=status, block=block)
+
+    def GetNodeInfo(self, request: pb.EmptyRequest, context) -> pb.NodeInfoResponse:
+        self._enter('GetNodeInfo', context)
+        return pb.NodeInfoResponse(build_time='', git_hash='', mode='ModeNormal', code_version='fake',
+                                   server_time=time.time_ns(), network=pb.NetworkInfo(id='fake', peer_count=0))
+
+    def GetChainInfo(self, request: pb.EmptyRequest, context) -> pb.ChainInfoResponse:
+        self._enter('GetChainInfo', context)
+        with self._lock:
+            head = self.blocks[-1]
+            lib = self.blocks[self._lib]
+        return pb.ChainInfoResponse(net_name='fakenet', protocol_version='1.0', chain_id=self.chain_id,
+                                    head_block=head.number, head_block_hash=head.hash, head_block_time=head.time,
+                                    lib_block=lib.number, lib_block_hash=lib.hash, lib_block_time=lib.time,
+                                    witness_list=['fake'])
+
+    def GetRAMInfo(self, request: pb.EmptyRequest, context) -> pb.RAMInfoResponse:
+        self._enter('GetRAMInfo', context)
+        return pb.RAMInfoResponse(used_ram=0, available_ram=1 << 40, total_ram=1 << 40, sell_price=0.01, buy_price=0.01)
+
+    def GetTxByHash(self, request: pb.TxHashRequest, context) -> pb.TransactionResponse:
+        self._enter('GetTxByHash', context)
+        with self._lock:
+            if request.hash in self._txs:
+                tx, number = self._txs[request.hash]
+                status = pb.TransactionResponse.IRREVERSIBLE if number <= self._lib else pb.TransactionResponse.PACKED
+                return pb.TransactionResponse(status=status, transaction=tx, block_number=number)
+            for tx_hash, tx in self._pending:
+                if tx_hash == request.hash:
+                    return pb.TransactionResponse(status=pb.TransactionResponse.PENDING, transaction=tx)
+        context.abort(grpc.StatusCode.NOT_FOUND, f'tx not found: {request.hash}')
+
+    def GetTxReceiptByTxHash(self, request: pb.TxHashRequest, context) -> pb.TxReceipt:
+        self._enter('GetTxReceiptByTxHash', context)
+        with self._lock:
+            if request.hash in self._txs:
+                return self._txs[request.hash][0].tx_receipt
+        context.abort(grpc.StatusCode.NOT_FOUND, f'receipt not found: {request.hash}')
+
+    def GetBlockByHash(self, request: pb.GetBlockByHashRequest, context) -> pb.BlockResponse:
+        self._enter('GetBlockByHash', context)
+        with self._lock:
+            for block in reversed(self.blocks):
+                if block.hash == request.hash:
+                    return self._block_response(block, request.complete)
+        context.abort(grpc.StatusCode.NOT_FOUND, f'block not found: {request.hash}')
+
+    def GetBlockByNumber(self, request: pb.GetBlockByNumberRequest, context) -> pb.BlockResponse:
+        self._enter('GetBlockByNumber', context)
+        with self._lock:
+            if 0 <= request.number < len(self.blocks):
+                return self._block_response(self.blocks[request.number], request.complete)
+        context.abort(grpc.StatusCode.NOT_FOUND, f'block not found: {request.number}')
+
+    def GetAccount(self, request: pb.GetAccountRequest, context) -> pb.Account:
+        self._enter('GetAccount', context)
+        with self._lock:
+            if request.name in self._accounts:
+                account = pb.Account()
+                account.CopyFrom(self._accounts[request.name])
+                account.balance = self.balances.get((request.name, 'iost'), 0.0)
+                return account
+        context.abort(grpc.StatusCode.NOT_FOUND, f'account not found: {request.name}')
+
+    def GetTokenBalance(self, request: pb.GetTokenBalanceRequest, context) -> pb.GetTokenBalanceResponse:
+        self._enter('GetTokenBalance', context)
+        with self._lock:
+            return pb.GetTokenBalanceResponse(balance=self.balances.get((request.account, request.token), 0.0))
+
+    def GetGasRatio(self, request: pb.EmptyRequest, context) -> pb.GasRatioResponse:
+        self._enter('GetGasRatio', context)
+        with self._lock:
+            ratios = sorted(tx.gas_ratio for tx in self.blocks[-1].transactions) or [1.0]
+        return pb.GasRatioResponse(lowest_gas_ratio=ratios[0], median_gas_ratio=ratios[len(ratios) // 2])
+
+    def GetContract(self, request: pb.GetContractRequest, context) -> pb.Contract:
+        self._enter('GetContract', context)
+        with self._lock:
+            if request.id in self.contracts:
+                return self.contracts[request.id]
+        context.abort(grpc.StatusCode.NOT_FOUND, f'contract not found: {request.id}')
+
+    def GetContractStorage(self, request: pb.GetContractStorageRequest, context) -> pb.GetContractStorageResponse:
+        self._enter('GetContractStorage', context)
+        with self._lock:
+            head = self.blocks[-1]
+            data = self.storage.get((request.id, request.key, request.field), 'null')
+        return pb.GetContractStorageResponse(data=data, block_hash=head.hash, block_number=head.number)
+
+    def GetBatchContractStorage(self, request: pb.GetBatchContractStorageRequest,
+                                context) -> pb.GetBatchContractStorageResponse:
+        self._enter('GetBatchContractStorage', context)
+        with self._lock:
+            head = self.blocks[-1]
+            datas = [self.storage.get((request.id, kf.key, kf.field), 'null') for kf in request.key_fields]
+        return pb.GetBatchContractStorageResponse(datas=datas, block_hash=head.hash, block_number=head.number)
+
+    def GetContractStorageFields(self, request: pb.GetContractStorageFieldsRequest,
+                                 context) -> pb.GetContractStorageFieldsResponse:
+        self._enter('GetContractStorageFields', context)
+        with self._lock:
+            head = self.blocks[-1]
+            fields = [field for contract_id, key, field in self.storage
+                      if contract_id == request.id and key == request.key and field]
+        return pb.GetContractStorageFieldsResponse(fields=fields, block_hash=head.hash, block_number=head.number)
+
+    def GetTokenInfo(self, request: pb.GetTokenInfoRequest, context) -> pb.TokenInfo:
+        self._enter('GetTokenInfo', context)
+        with self._lock:
+            if request.symbol in self.token_infos:
+                return self.token_infos[request.symbol]
+        context.abort(grpc.StatusCode.NOT_FOUND, f'token not found: {request.symbol}')
+
+    def SendTransaction(self, request: pb.TransactionRequest, context) -> pb.SendTransactionResponse:
+        self._enter('SendTransaction', context)
+        if request.chain_id != self.chain_id:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f'invalid chain id: {request.chain_id}')
+        if request.expiration < time.time_ns():
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, 'tx expired')
+        tx_hash = _hash(request.SerializeToString())
+        tx = self._to_tx(tx_hash, request)
+        with self._lock:
+            if tx_hash in self._txs or any(h == tx_hash for h, _ in self._pending):
+                context.abort(grpc.StatusCode.ALREADY_EXISTS, f'duplicate tx: {tx_hash}')
+            pre_receipt = self._execute(tx_hash, tx, commit=False)
+            self._pending.append((tx_hash, tx))
+        return pb.SendTransactionResponse(hash=tx_hash, pre_tx_receipt=pre_receipt)
+
+    def ExecTransaction(self, request: pb.TransactionRequest, context) -> pb.TxReceipt:
+        self._enter('ExecTransaction', context)
+        tx_hash = _hash(request.SerializeToString())
+        with self._lock:
+            return self._execute(tx_hash, self._to_tx(tx_hash, request), commit=False)
+
+    def Subscribe(self, request: pb.SubscribeRequest, context) -> Iterator[pb.SubscribeResponse]:
+        self._enter('Subscribe', context)
+        subscriber = (request, queue.Queue())
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            while context.is_active() and not self._stopped.is_set():
+                try:
+                    event = subscriber[1].get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                yield pb.SubscribeResponse(event=event)
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
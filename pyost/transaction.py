@@ -4,12 +4,14 @@ from typing import List, Dict
 from enum import Enum
 from time import time_ns
 from hashlib import sha3_256 as sha3
-from protobuf_to_dict import protobuf_to_dict
-from pprint import pformat
 
-from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.b58 import b58encode
 from pyost.signature import Signature, KeyPair
 from pyost.simpleencoder import SimpleEncoder
+from pyost.lazy import lazy_import
+
+pb = lazy_import('pyost.rpc.pb.rpc_pb2')
+pprint = lazy_import('pprint')
 
 
 class Action:
@@ -34,7 +36,10 @@ class Action:
         self.data: str = json.dumps(nobytes_args)
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Action(contract={self.contract!r}, action_name={self.action_name!r})'
 
     def from_raw(self, ar: pb.Action) -> Action:
         """Deserializes a protobuf object to update this object's members.
@@ -61,6 +66,18 @@ class Action:
             action_name=self.action_name,
             data=self.data)
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'contract': self.contract,
+            'action_name': self.action_name,
+            'data': self.data
+        }
+
     def to_bytes(self) -> bytes:
         """Serializes this object to bytes, used to calculate the hash of a `Transaction`.
 
@@ -91,7 +108,10 @@ class AmountLimit:
         self.value: str = value
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'AmountLimit(token={self.token!r}, value={self.value!r})'
 
     def from_raw(self, al: pb.AmountLimit) -> AmountLimit:
         """Deserializes a protobuf object to update this object's members.
@@ -117,6 +137,17 @@ class AmountLimit:
             value=self.value,
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'token': self.token,
+            'value': self.value
+        }
+
     def to_bytes(self) -> bytes:
         """Serializes this object to bytes, used to calculate the hash of a `Transaction`.
 
@@ -144,6 +175,7 @@ class Transaction:
         signers: A list of signers' name and permission written in the format ``name@permission``.
         publisher: The name of the publisher's account.
         chain_id: The chain id.
+        time: The time of the transaction in nanoseconds, by default the current time.
 
     Attributes:
         hash: The binary hash of the full transaction including publisher's signature.
@@ -166,17 +198,18 @@ class Transaction:
 
     class Status(Enum):
         """Status of the `Transaction`."""
-        PENDING = pb.TransactionResponse.PENDING  #: Transaction pending.
-        PACKED = pb.TransactionResponse.PACKED  #: Transaction packed in a block.
-        IRREVERSIBLE = pb.TransactionResponse.IRREVERSIBLE  #: Transaction has been processed.
+        PENDING = 0  #: Transaction pending.
+        PACKED = 1  #: Transaction packed in a block.
+        IRREVERSIBLE = 2  #: Transaction has been processed.
         UNKNOWN = -1  #: Unknown status.
 
     def __init__(self, expiration: int = 90, delay: int = 0,
                  gas_ratio: float = 1.0, gas_limit: float = 10000.0,
                  amount_limits: List[AmountLimit] = None, actions: List[Action] = None,
-                 signers: List[str] = None, publisher: str = '', chain_id: int = 1024):
+                 signers: List[str] = None, publisher: str = '', chain_id: int = 1024,
+                 time: int = None):
         self.hash: bytes = None
-        self.time: int = time_ns()
+        self.time: int = time_ns() if time is None else time
         self.expiration: int = 0
         self.set_expiration(expiration)
         self.gas_ratio: float = gas_ratio
@@ -194,7 +227,11 @@ class Transaction:
         self.status: Transaction.Status = Transaction.Status.UNKNOWN
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'Transaction(hash={self._b58_hash()!r}, publisher={self.publisher!r}, ' \
+            f'actions={len(self.actions)}, status={self.status.name})'
 
     def add_action(self, contract: str, abi: str, *args) -> Transaction:
         """Adds an `Action` (i.e. an ABI call) to the list of `Action`.
@@ -294,6 +331,9 @@ class Transaction:
         """
         return sha3(self.to_bytes('publish')).digest()
 
+    def _b58_hash(self) -> str:
+        return b58encode(self.hash).decode() if isinstance(self.hash, bytes) else self.hash
+
     def _hash(self) -> bytes:
         """Calculates the full hash of this `Transaction` (includes `publisher` and `publisher_signatures`).
 
@@ -375,6 +415,30 @@ class Transaction:
             tx_receipt=self.tx_receipt.to_raw() if self.tx_receipt and self.tx_receipt.tx_hash != "" else None,
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object and the `status`,
+                the `hash` is a base58 string.
+        """
+        return {
+            'hash': self._b58_hash(),
+            'time': self.time,
+            'expiration': self.expiration,
+            'gas_ratio': self.gas_ratio,
+            'gas_limit': self.gas_limit,
+            'delay': self.delay,
+            'actions': [a.to_dict() for a in self.actions],
+            'amount_limit': [al.to_dict() for al in self.amount_limits],
+            'signers': list(self.signers),
+            'publisher': self.publisher,
+            'referred_tx': self.referred_tx,
+            'chain_id': self.chain_id,
+            'tx_receipt': self.tx_receipt.to_dict() if self.tx_receipt and self.tx_receipt.tx_hash != "" else None,
+            'status': self.status.name
+        }
+
     def to_bytes(self, level='base') -> bytes:
         """Serializes this object to bytes, used to calculate the hash of a `Transaction`.
 
@@ -421,15 +485,15 @@ class TxReceipt:
 
     class StatusCode(Enum):
         """Indicates the status of the `Transaction`."""
-        SUCCESS = pb.TxReceipt.SUCCESS  #: If no error.
-        GAS_RUN_OUT = pb.TxReceipt.GAS_RUN_OUT  #: If gas amount was not enough to execute the `Transaction`.
-        BALANCE_NOT_ENOUGH = pb.TxReceipt.BALANCE_NOT_ENOUGH  #: If token balance was not enough to execute the `Transaction`.
-        WRONG_PARAMETER = pb.TxReceipt.WRONG_PARAMETER  #: If there is an error in the args of one of the `Action`.
-        RUNTIME_ERROR = pb.TxReceipt.RUNTIME_ERROR  #: If there was an error when processing the `Transaction`.
-        TIMEOUT = pb.TxReceipt.TIMEOUT  #: If the process timeout before the `Transaction` could be processed.
-        WRONG_TX_FORMAT = pb.TxReceipt.WRONG_TX_FORMAT  #: If the `Transaction` format is incorrect.
-        DUPLICATE_SET_CODE = pb.TxReceipt.DUPLICATE_SET_CODE  #: If the smart contract's id already exist.
-        UNKNOWN_ERROR = pb.TxReceipt.UNKNOWN_ERROR  #: None of the above.
+        SUCCESS = 0  #: If no error.
+        GAS_RUN_OUT = 1  #: If gas amount was not enough to execute the `Transaction`.
+        BALANCE_NOT_ENOUGH = 2  #: If token balance was not enough to execute the `Transaction`.
+        WRONG_PARAMETER = 3  #: If there is an error in the args of one of the `Action`.
+        RUNTIME_ERROR = 4  #: If there was an error when processing the `Transaction`.
+        TIMEOUT = 5  #: If the process timeout before the `Transaction` could be processed.
+        WRONG_TX_FORMAT = 6  #: If the `Transaction` format is incorrect.
+        DUPLICATE_SET_CODE = 7  #: If the smart contract's id already exist.
+        UNKNOWN_ERROR = 8  #: None of the above.
 
     class Receipt:
         """Describes a function call's receipt.
@@ -444,7 +508,10 @@ class TxReceipt:
             self.content: str = ''
 
         def __str__(self) -> str:
-            return pformat(protobuf_to_dict(self.to_raw()))
+            return pprint.pformat(self.to_dict())
+
+        def __repr__(self) -> str:
+            return f'Receipt(func_name={self.func_name!r})'
 
         def from_raw(self, tr: pb.TxReceipt.Receipt) -> TxReceipt.Receipt:
             """Deserializes a protobuf object to update this object's members.
@@ -470,6 +537,17 @@ class TxReceipt:
                 content=self.content
             )
 
+        def to_dict(self) -> dict:
+            """Converts this object's members to a dictionary, without going through protobuf.
+
+            Returns:
+                A dictionary with the same keys as the protobuf object.
+            """
+            return {
+                'func_name': self.func_name,
+                'content': self.content
+            }
+
     def __init__(self):
         self.tx_hash: str = ''
         self.gas_usage: float = 0.0
@@ -480,7 +558,11 @@ class TxReceipt:
         self.receipts: List[TxReceipt.Receipt] = []
 
     def __str__(self) -> str:
-        return pformat(protobuf_to_dict(self.to_raw()))
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'TxReceipt(tx_hash={self.tx_hash!r}, status_code={self.status_code.name}, ' \
+            f'gas_usage={self.gas_usage})'
 
     def is_success(self) -> bool:
         """Returns if the `status_code` is ``SUCCESS``.
@@ -525,6 +607,22 @@ class TxReceipt:
             receipts=[r.to_raw() for r in self.receipts]
         )
 
+    def to_dict(self) -> dict:
+        """Converts this object's members to a dictionary, without going through protobuf.
+
+        Returns:
+            A dictionary with the same keys as the protobuf object.
+        """
+        return {
+            'tx_hash': self.tx_hash,
+            'gas_usage': self.gas_usage,
+            'ram_usage': dict(self.ram_usage),
+            'status_code': self.status_code.name,
+            'message': self.message,
+            'returns': list(self.returns),
+            'receipts': [r.to_dict() for r in self.receipts]
+        }
+
 
 class TransactionError(Exception):
     """Raised by IOST.wait_tx to indicates an error when processing a `Transaction`.
@@ -12,12 +12,13 @@ setup(
   download_url = 'https://github.com/dossiman/pyost/archive/v2.2-beta.tar.gz',    # I explain this later on
   keywords = ['IOST', 'blockchain', 'API', 'SDK'],   # Keywords that define your package best
   install_requires=[            # I get to this in a second
-    'base58',
     'ecdsa',
     'ed25519',
     'grpcio',
-    'googleapis-common-protos',
-    'protobuf3-to-dict'],
+    'googleapis-common-protos'],
+  extras_require={
+    'keypool': ['cryptography'],
+  },
   classifiers=[
     'Development Status :: 4 - Beta',      # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
     'Intended Audience :: Developers',      # Define that your audience are developers
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from unittest import main, TestCase
+from pyost.account import format_amount
+
+
+class TestFormatAmount(TestCase):
+    def test_format(self):
+        self.assertEqual('10', format_amount(10, 8))
+        self.assertEqual('10', format_amount(10.0, 8))
+        self.assertEqual('0.1', format_amount(0.1, 8))
+        self.assertEqual('0.3', format_amount(0.1 + 0.2, 8))
+        self.assertEqual('0.00001', format_amount(1e-5, 8))
+        self.assertEqual('10000000000000000000000', format_amount(1e22, 8))
+        self.assertEqual('2.5', format_amount(Decimal('2.50'), 8))
+
+    def test_truncate(self):
+        self.assertEqual('55', format_amount(55.000000001, 8))
+        self.assertEqual('1.23', format_amount(1.239, 2))
+        self.assertEqual('1.23456789', format_amount('1.234567891', 8))
+        self.assertEqual('123456789012345678901234567890.12345678',
+                         format_amount('123456789012345678901234567890.123456789', 8))
+
+    def test_invalid(self):
+        for amount in ('ten', float('nan'), float('inf'), True):
+            with self.assertRaises(ValueError):
+                format_amount(amount, 8)
+
+
+if __name__ == '__main__':
+    main()
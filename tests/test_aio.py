@@ -0,0 +1,70 @@
+from unittest import main, TestCase
+import asyncio
+from grpc import aio
+from pyost.rpc.pb import rpc_pb2 as pb, rpc_pb2_grpc
+from pyost.event import Event
+from pyost.aio import AsyncIOST
+
+
+class EventServicer(rpc_pb2_grpc.ApiServiceServicer):
+    def __init__(self, count):
+        self.count = count
+        self.cancelled = asyncio.Event()
+
+    async def Subscribe(self, request, context):
+        context.add_done_callback(lambda _: self.cancelled.set())
+        for i in range(self.count):
+            yield pb.SubscribeResponse(event=pb.Event(topic=pb.Event.CONTRACT_EVENT, data=str(i), time=i))
+
+
+async def serve(servicer):
+    server = aio.server()
+    rpc_pb2_grpc.add_ApiServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('localhost:0')
+    await server.start()
+    return server, f'localhost:{port}'
+
+
+class TestAsyncIOST(TestCase):
+    def test_subscribe(self):
+        async def run():
+            server, url = await serve(EventServicer(5))
+            async with AsyncIOST(url) as iost:
+                events = [e async for e in iost.subscribe([Event.Topic.CONTRACT_EVENT])]
+            await server.stop(None)
+            return events
+
+        events = asyncio.run(run())
+        self.assertEqual(['0', '1', '2', '3', '4'], [e.data for e in events])
+        self.assertEqual(Event.Topic.CONTRACT_EVENT, events[0].topic)
+
+    def test_subscribe_batches(self):
+        async def run():
+            server, url = await serve(EventServicer(10))
+            async with AsyncIOST(url) as iost:
+                batches = [b async for b in iost.subscribe([Event.Topic.CONTRACT_EVENT], batch_size=4)]
+            await server.stop(None)
+            return batches
+
+        batches = asyncio.run(run())
+        self.assertTrue(all(1 <= len(b) <= 4 for b in batches))
+        self.assertEqual([str(i) for i in range(10)], [e.data for b in batches for e in b])
+
+    def test_close_cancels_call(self):
+        async def run():
+            servicer = EventServicer(1000)
+            server, url = await serve(servicer)
+            async with AsyncIOST(url) as iost:
+                stream = iost.subscribe([Event.Topic.CONTRACT_EVENT], buffer_size=2)
+                async for _ in stream:
+                    break
+                await stream.aclose()
+                await asyncio.wait_for(servicer.cancelled.wait(), 5)
+            await server.stop(None)
+            return servicer.cancelled.is_set()
+
+        self.assertTrue(asyncio.run(run()))
+
+
+if __name__ == '__main__':
+    main()
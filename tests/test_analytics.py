@@ -0,0 +1,100 @@
+import json
+from unittest import main, TestCase
+from pyost.analytics import ReceiptAnalytics, OTHER
+from pyost.iost import IOST
+from pyost.account import Account
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519
+from pyost.follower import BlockFollower
+from pyost.transaction import Transaction, TxReceipt, Action
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy
+
+
+def make_tx(contract: str, abi: str, gas: float, code: TxReceipt.StatusCode, actions: int = 1) -> Transaction:
+    tx = Transaction(actions=[Action(contract, abi) for _ in range(actions)])
+    tx.tx_receipt = TxReceipt()
+    tx.tx_receipt.gas_usage = gas
+    tx.tx_receipt.ram_usage = {'admin': 100 * actions}
+    tx.tx_receipt.status_code = code
+    return tx
+
+
+class TestReceiptAnalytics(TestCase):
+    def test_aggregates(self):
+        analytics = ReceiptAnalytics()
+        for _ in range(9):
+            analytics.add_tx(make_tx('token.iost', 'transfer', 1000.0, TxReceipt.StatusCode.SUCCESS))
+        analytics.add_tx(make_tx('token.iost', 'transfer', 1000.0, TxReceipt.StatusCode.BALANCE_NOT_ENOUGH))
+        analytics.add_tx(make_tx('game', 'bet', 60000.0, TxReceipt.StatusCode.SUCCESS, actions=2))
+        transfer = analytics.abi('token.iost/transfer')
+        self.assertEqual(10, transfer.count)
+        self.assertEqual(10000.0, transfer.gas.sum)
+        self.assertAlmostEqual(0.1, transfer.failure_rate)
+        self.assertEqual(1000, transfer.ram_delta)
+        bet = analytics.abi('game/bet')
+        self.assertEqual(2, bet.count)
+        self.assertEqual(60000.0, bet.gas.sum)
+        self.assertEqual(200, bet.ram_delta)
+        self.assertEqual(['game/bet', 'token.iost/transfer'], [name for name, _ in analytics.top(2)])
+        snapshot = json.loads(json.dumps(analytics.snapshot()))
+        self.assertEqual(11, snapshot['transactions'])
+        self.assertEqual({'SUCCESS': 9, 'BALANCE_NOT_ENOUGH': 1}, snapshot['contracts']['token.iost']['codes'])
+
+    def test_receipts(self):
+        analytics = ReceiptAnalytics()
+        tx = make_tx('exchange', 'buy', 5000.0, TxReceipt.StatusCode.SUCCESS)
+        tx.actions.append(Action('token.iost', 'transfer'))
+        for func_name in ('token.iost/transfer', 'token.iost/transfer', 'exchange/buy'):
+            receipt = TxReceipt.Receipt()
+            receipt.func_name = func_name
+            tx.tx_receipt.receipts.append(receipt)
+        analytics.add_tx(tx)
+        transfer = analytics.abi('token.iost/transfer')
+        self.assertEqual((2, 1, 5000.0), (transfer.count, transfer.transactions, transfer.gas.sum))
+        buy = analytics.abi('exchange/buy')
+        self.assertEqual((1, 1, 5000.0), (buy.count, buy.transactions, buy.gas.sum))
+        self.assertEqual(2, analytics.contract('token.iost').count)
+
+    def test_nested_calls(self):
+        analytics = ReceiptAnalytics()
+        tx = make_tx('exchange', 'buy', 5000.0, TxReceipt.StatusCode.SUCCESS)
+        receipt = TxReceipt.Receipt()
+        receipt.func_name = 'token.iost/transfer'
+        tx.tx_receipt.receipts.append(receipt)
+        analytics.add_tx(tx)
+        transfer = analytics.abi('token.iost/transfer')
+        self.assertEqual((1, 0, 0.0), (transfer.count, transfer.transactions, transfer.gas.sum))
+        self.assertEqual(1, analytics.contract('exchange').transactions)
+
+    def test_max_keys(self):
+        analytics = ReceiptAnalytics(max_keys=2)
+        for i in range(5):
+            analytics.add_tx(make_tx(f'contract{i}', 'call', 100.0, TxReceipt.StatusCode.SUCCESS))
+        snapshot = analytics.snapshot()
+        self.assertEqual({'contract0', 'contract1', OTHER}, set(snapshot['contracts']))
+        self.assertEqual(3, snapshot['contracts'][OTHER]['count'])
+
+    def test_follow(self):
+        node = FakeNode(block_time=0).start()
+        node.add_account('admin', 100.0)
+        publisher = Account('admin')
+        publisher.add_key_pair(KeyPair(Ed25519), 'active')
+        iost = IOST(node.url, publisher=publisher, policy=CallPolicy(max_attempts=1))
+        try:
+            iost.send_tx(iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+            node.produce_block()
+            follower = BlockFollower(iost, start_block=1)
+            analytics = ReceiptAnalytics().follow(follower)
+            follower.poll()
+            self.assertEqual(1, analytics.blocks)
+            self.assertEqual(1, analytics.abi('token.iost/transfer').codes['SUCCESS'])
+            with self.assertRaises(ValueError):
+                ReceiptAnalytics().follow(BlockFollower(iost, complete=False))
+        finally:
+            iost.close()
+            node.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+from unittest import main, TestCase
+from pyost.b58 import b58encode, b58decode, b58encode_many, b58decode_many
+
+
+class TestB58(TestCase):
+    def test_vectors(self):
+        vectors = [
+            (b'', b''),
+            (b'\0', b'1'),
+            (b'\0\0\x01', b'112'),
+            (b'hello world', b'StV1DL6CwTryKyV'),
+            (bytes(range(32)), b'1thX6LZfHDZZKUs92febYZhYRcXddmzfzF2NvTkPNE'),
+        ]
+        for data, encoded in vectors:
+            self.assertEqual(encoded, b58encode(data))
+            self.assertEqual(data, b58decode(encoded))
+
+    def test_many(self):
+        keys = [bytes([i]) * 33 for i in range(10)]
+        encoded = b58encode_many(keys)
+        self.assertEqual(keys, b58decode_many(encoded))
+        self.assertEqual(keys, b58decode_many([e.decode() for e in encoded]))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            b58decode('0OIl')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+from unittest import main, TestCase
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.transaction import Transaction, TxReceipt, TransactionError
+from pyost.bulk import BulkTransfer
+from pyost.account import format_amount
+
+
+class FakeIOST:
+    def __init__(self, fail=()):
+        self.sent = []
+        self.fail = fail
+        self.gas_estimator = None
+
+    def format_amount(self, token, amount, decimal=None):
+        return format_amount(amount, 8 if decimal is None else decimal)
+
+    def create_tx(self, actions=None):
+        tx = Transaction(actions=actions)
+        tx.add_amount_limit('*', 'unlimited')
+        return tx
+
+    def send_tx(self, tx):
+        self.sent.append(tx)
+        return f'tx{len(self.sent)}'
+
+    def wait_tx(self, tx_hash):
+        tx = self.sent[int(tx_hash[2:]) - 1]
+        if tx_hash in self.fail:
+            raise TransactionError('balance not enough', TxReceipt().from_raw(pb.TxReceipt(
+                tx_hash=tx_hash, status_code=pb.TxReceipt.BALANCE_NOT_ENOUGH, message='balance not enough')))
+        return TxReceipt().from_raw(pb.TxReceipt(
+            tx_hash=tx_hash, status_code=pb.TxReceipt.SUCCESS,
+            receipts=[pb.TxReceipt.Receipt(func_name='token.iost/transfer', content=a.data) for a in tx.actions]))
+
+
+class TestBulkTransfer(TestCase):
+    def test_build(self):
+        bulk = BulkTransfer(FakeIOST(), 'iost', 'admin', gas_per_transfer=1000.0, gas_margin=1.0, max_actions=3)
+        for i in range(7):
+            bulk.add(f'user{i}', 0.1)
+        bulk.add('user7', 2, token='emogi')
+        txs = bulk.build()
+        self.assertEqual([3, 3, 2], [len(tx.actions) for tx in txs])
+        self.assertEqual([('*', 'unlimited'), ('iost', '0.3')],
+                         [(al.token, al.value) for al in txs[0].amount_limits])
+        self.assertEqual({'iost': '0.1', 'emogi': '2'}, BulkTransfer.amount_limits(bulk._batches[2]))
+        self.assertEqual(3000.0, txs[0].gas_limit)
+
+    def test_gas_and_size_limits(self):
+        bulk = BulkTransfer(FakeIOST(), 'iost', 'admin', gas_per_transfer=1000.0, gas_margin=1.0,
+                            max_gas_limit=5000.0)
+        for i in range(12):
+            bulk.add(f'user{i}', 1)
+        self.assertEqual([5, 5, 2], [len(tx.actions) for tx in bulk.build()])
+
+        bulk.max_gas_limit = 4000000.0
+        bulk.max_tx_size = BulkTransfer.TX_SIZE_RESERVE + 200
+        self.assertTrue(all(len(tx.actions) < 5 for tx in bulk.build()))
+
+    def test_send(self):
+        iost = FakeIOST(fail=('tx2',))
+        bulk = BulkTransfer(iost, 'iost', 'admin', max_actions=2)
+        for i in range(4):
+            bulk.add(f'user{i}', 1)
+        transfers = bulk.send()
+        self.assertEqual(['tx1', 'tx1', 'tx2', 'tx2'], [t.tx_hash for t in transfers])
+        self.assertEqual([True, True, False, False], [t.success for t in transfers])
+        self.assertEqual('balance not enough', transfers[2].error)
+
+
+if __name__ == '__main__':
+    main()
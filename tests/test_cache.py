@@ -0,0 +1,171 @@
+import json
+import os
+import tempfile
+from unittest import main, TestCase
+from pyost.cache import TTLCache, AccountCache, ABICache
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.transaction import Action
+from pyost.iost import IOST
+from pyost.account import Account
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519
+from pyost.follower import BlockFollower
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(TestCase):
+    def test_expiration(self):
+        timer = FakeTimer()
+        cache = TTLCache(ttl=10.0, timer=timer)
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+        timer.now = 10.0
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+
+class TestAccountCache(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0).start()
+        self.node.add_account('admin', 100.0).add_account('bob').add_account('carol', 5.0)
+        publisher = Account('admin')
+        publisher.add_key_pair(KeyPair(Ed25519), 'active')
+        self.iost = IOST(self.node.url, publisher=publisher, wait_time=0.01, wait_max_retry=3,
+                         policy=CallPolicy(max_attempts=1))
+        self.follower = BlockFollower(self.iost, start_block=1)
+        self.cache = AccountCache(self.iost).follow(self.follower)
+
+    def tearDown(self):
+        self.iost.close()
+        self.node.stop()
+
+    def test_hits(self):
+        self.assertEqual(5.0, self.cache.get_balance('carol'))
+        self.assertEqual(5.0, self.cache.get_balance('carol'))
+        self.assertEqual('carol', self.cache.get_account_info('carol').name)
+        self.cache.get_account_info('carol')
+        self.assertEqual(1, self.node.calls['GetTokenBalance'])
+        self.assertEqual(1, self.node.calls['GetAccount'])
+
+    def test_block_invalidation(self):
+        self.assertEqual(0.0, self.cache.get_balance('bob'))
+        self.assertEqual(100.0, self.cache.get_account_info('admin').balance)
+        self.assertEqual(5.0, self.cache.get_balance('carol'))
+        self.iost.send_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 10.0))
+        self.node.produce_block()
+        self.follower.poll()
+        self.assertEqual(2, self.cache.invalidations)
+        self.assertEqual(10.0, self.cache.get_balance('bob'))
+        self.assertEqual(90.0, self.cache.get_balance('admin'))
+        self.assertEqual(5.0, self.cache.get_balance('carol'))
+        self.assertEqual(4, self.node.calls['GetTokenBalance'])
+
+    def test_invalidation_during_fetch(self):
+        get_token_balance = self.iost.get_token_balance
+
+        def fetch_then_invalidate(*args):
+            balance = get_token_balance(*args)
+            self.cache.invalidate(['carol'])
+            return balance
+
+        self.iost.get_token_balance = fetch_then_invalidate
+        self.assertEqual(5.0, self.cache.get_balance('carol'))
+        self.iost.get_token_balance = get_token_balance
+        self.cache.get_balance('carol')
+        self.assertEqual(2, self.node.calls['GetTokenBalance'])
+
+    def test_incomplete_follower(self):
+        with self.assertRaises(ValueError):
+            AccountCache(self.iost).follow(BlockFollower(self.iost, complete=False))
+
+
+class TestABICache(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0).start()
+        self.node.add_account('admin', 100.0)
+        self.node.contracts['token.iost'] = pb.Contract(id='token.iost', version='1.0.0', abis=[
+            pb.Contract.ABI(name='transfer', args=['string', 'string', 'string', 'string', 'string'])])
+        self.node.contracts['vote.iost'] = pb.Contract(id='vote.iost', version='1.0.0', abis=[
+            pb.Contract.ABI(name='vote', args=['string', 'number', 'bool', 'json'])])
+        publisher = Account('admin')
+        publisher.add_key_pair(KeyPair(Ed25519), 'active')
+        self.iost = IOST(self.node.url, publisher=publisher, policy=CallPolicy(max_attempts=1))
+        self.path = os.path.join(tempfile.mkdtemp(), 'abis.json')
+        self.iost.abi_cache = ABICache(self.iost, self.path)
+
+    def tearDown(self):
+        self.iost.close()
+        self.node.stop()
+
+    def test_check_args(self):
+        tx = self.iost.create_call_tx('vote.iost', 'vote', 'bob', '1.5', 'true', {'a': 1})
+        self.assertEqual(['bob', 1.5, True, {'a': 1}], json.loads(tx.actions[0].data))
+        tx = self.iost.create_transfer_tx('iost', 'admin', 'bob', 10)
+        self.assertEqual('10', json.loads(tx.actions[0].data)[3])
+        with self.assertRaises(ValueError):
+            self.iost.create_call_tx('token.iost', 'transfer', 'iost', 'admin', 'bob', 0.1 + 0.2, '')
+        with self.assertRaises(ValueError):
+            self.iost.create_call_tx('token.iost', 'transfer', 'iost', 'admin')
+        with self.assertRaises(ValueError):
+            self.iost.create_call_tx('vote.iost', 'vote', 'bob', 'ten', True, {})
+        with self.assertRaises(ValueError):
+            self.iost.create_call_tx('vote.iost', 'unvote')
+        self.assertEqual(2, self.node.calls['GetContract'])
+
+    def test_persistence(self):
+        self.iost.abi_cache.get_contract('token.iost')
+        cache = ABICache(self.iost, self.path)
+        self.assertIn('token.iost', cache)
+        self.assertEqual(['string'] * 5, cache.get_abi('token.iost', 'transfer').args)
+        cache.get_abi('token.iost', 'transfer')
+        # The version is checked once against the chain.
+        self.assertEqual(2, self.node.calls['GetContract'])
+
+    def test_persisted_version_mismatch(self):
+        self.iost.abi_cache.get_contract('vote.iost')
+        self.node.contracts['vote.iost'] = pb.Contract(id='vote.iost', version='2.0.0', abis=[
+            pb.Contract.ABI(name='vote', args=['string'])])
+        cache = ABICache(self.iost, self.path)
+        self.assertEqual('2.0.0', cache.get_contract('vote.iost').version)
+        self.assertEqual(['string'], cache.get_abi('vote.iost', 'vote').args)
+        self.assertEqual('2.0.0', ABICache(self.iost, self.path).get_contract('vote.iost').version)
+
+    def test_incomplete_follower(self):
+        with self.assertRaises(ValueError):
+            self.iost.abi_cache.follow(BlockFollower(self.iost, complete=False))
+
+    def test_update_invalidation(self):
+        cache = self.iost.abi_cache
+        cache.get_contract('vote.iost')
+        tx = self.iost.create_tx([Action('system.iost', 'updateCode', json.dumps({'ID': 'vote.iost'}), '')])
+        self.iost.send_tx(tx)
+        self.node.produce_block()
+        follower = BlockFollower(self.iost, start_block=1)
+        cache.follow(follower)
+        follower.poll()
+        self.assertNotIn('vote.iost', cache)
+        self.assertNotIn('vote.iost', ABICache(self.iost, self.path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+from unittest import main, TestCase
+from pyost.iost import IOST
+from pyost.testing import FakeNode
+from pyost.channel import ChannelConfig, PROFILES
+
+
+class TestChannelConfig(TestCase):
+    def test_options(self):
+        self.assertEqual([], ChannelConfig().grpc_options())
+        config = ChannelConfig.profile('bulk-ingest', channels=2, options=[('grpc.primary_user_agent', 'test')])
+        options = dict(config.grpc_options())
+        self.assertEqual('gzip', config.compression)
+        self.assertEqual(PROFILES['bulk-ingest']['max_receive_message_length'],
+                         options['grpc.max_receive_message_length'])
+        self.assertEqual(60000, options['grpc.keepalive_time_ms'])
+        self.assertEqual(1, options['grpc.use_local_subchannel_pool'])
+        self.assertEqual('test', options['grpc.primary_user_agent'])
+
+        with self.assertRaises(ValueError):
+            ChannelConfig.profile('fast')
+        with self.assertRaises(ValueError):
+            ChannelConfig(compression='zstd')
+
+    def test_iost(self):
+        node = FakeNode(block_time=0).start()
+        try:
+            for name in PROFILES:
+                iost = IOST(node.url, channel_config=ChannelConfig.profile(name))
+                self.assertEqual(ChannelConfig.profile(name).channels, len(iost._channels))
+                for _ in range(5):
+                    iost.get_chain_info()
+                iost.close()
+        finally:
+            node.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+from unittest import main, TestCase
+from types import SimpleNamespace
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.blockchain import Block
+from pyost.transaction import TxReceipt, TransactionError
+from pyost.follower import BlockFollower
+from pyost.correlation import TxCorrelator
+
+
+def make_block(number, parent, name, txs=(), time=0):
+    return Block().from_raw(pb.Block(
+        number=number, hash=name, parent_hash=parent, time=time,
+        transactions=[pb.Transaction(hash=tx_hash, tx_receipt=pb.TxReceipt(tx_hash=tx_hash, status_code=code))
+                      for tx_hash, code in txs]), pb.BlockResponse.PENDING)
+
+
+class FakeIOST:
+    def __init__(self):
+        self.blocks = {}
+        self.head = 0
+        self.lib = 0
+
+    def get_chain_info(self):
+        return SimpleNamespace(head_block=self.head, lib_block=self.lib)
+
+    def get_block_by_num(self, number, complete=False):
+        return self.blocks[number]
+
+
+class TestBlockFollower(TestCase):
+    def test_follow_and_fork(self):
+        iost = FakeIOST()
+        iost.blocks = {1: make_block(1, 'h0', 'h1'), 2: make_block(2, 'h1', 'h2')}
+        iost.head = 2
+        seen = []
+        follower = BlockFollower(iost, start_block=1).add_listener(lambda b: seen.append(b.hash))
+        self.assertEqual(2, follower.poll())
+
+        iost.blocks[2] = make_block(2, 'h1', 'h2b')
+        iost.blocks[3] = make_block(3, 'h2b', 'h3')
+        iost.head = 3
+        follower.poll()
+        self.assertEqual(['h1', 'h2', 'h2b', 'h3'], seen)
+
+    def test_fork_listener(self):
+        iost = FakeIOST()
+        iost.blocks = {1: make_block(1, 'h0', 'h1'), 2: make_block(2, 'h1', 'h2'), 3: make_block(3, 'h2', 'h3')}
+        iost.head = 3
+        forks = []
+        follower = BlockFollower(iost, start_block=1).add_fork_listener(forks.append)
+        follower.poll()
+        iost.blocks[2] = make_block(2, 'h1', 'h2b')
+        iost.blocks[3] = make_block(3, 'h2b', 'h3b')
+        iost.blocks[4] = make_block(4, 'h3b', 'h4')
+        iost.head = 4
+        follower.poll()
+        self.assertEqual([3, 2], forks)
+
+    def test_lib(self):
+        iost = FakeIOST()
+        iost.blocks = {0: make_block(0, '', 'h0')}
+        iost.lib = 0
+        libs = []
+        follower = BlockFollower(iost).add_lib_listener(libs.append)
+        follower.poll()
+        follower.poll()
+        self.assertEqual([0], libs)
+
+
+class TestTxCorrelator(TestCase):
+    def test_stages(self):
+        correlator = TxCorrelator()
+        pre = TxReceipt()
+        ok = correlator.register('tx1', pre)
+        ko = correlator.register('tx2')
+        self.assertIs(pre, ok.pre_receipt.result(0))
+
+        correlator.on_block(make_block(5, 'h4', 'h5', [('tx1', pb.TxReceipt.SUCCESS),
+                                                       ('tx2', pb.TxReceipt.BALANCE_NOT_ENOUGH)]))
+        self.assertEqual('tx1', ok.wait(0).tx_hash)
+        self.assertEqual(5, ok.block_number)
+        self.assertIsInstance(ko.packed.exception(0), TransactionError)
+        self.assertFalse(ok.irreversible.done())
+
+        correlator.on_lib(5)
+        self.assertEqual('tx1', ok.wait(0, irreversible=True).tx_hash)
+        self.assertEqual(0, len(correlator))
+
+    def test_fork(self):
+        iost = FakeIOST()
+        iost.blocks = {1: make_block(1, 'h0', 'h1'), 2: make_block(2, 'h1', 'h2', [('tx1', pb.TxReceipt.SUCCESS)])}
+        iost.head = 2
+        follower = BlockFollower(iost, start_block=1)
+        correlator = TxCorrelator().attach(follower)
+        tracker = correlator.register('tx1')
+        follower.poll()
+        self.assertEqual(2, tracker.block_number)
+
+        iost.blocks[2] = make_block(2, 'h1', 'h2b')
+        iost.blocks[3] = make_block(3, 'h2b', 'h3')
+        iost.head = 3
+        iost.lib = 3
+        follower.poll()
+        self.assertIsNone(tracker.block_number)
+        self.assertFalse(tracker.irreversible.done())
+
+        iost.blocks[4] = make_block(4, 'h3', 'h4', [('tx1', pb.TxReceipt.SUCCESS)])
+        iost.head = 4
+        iost.lib = 4
+        follower.poll()
+        self.assertEqual('tx1', tracker.wait(0, irreversible=True).tx_hash)
+
+    def test_packed_before_register(self):
+        correlator = TxCorrelator()
+        correlator.on_block(make_block(1, 'h0', 'h1', [('tx1', pb.TxReceipt.SUCCESS)]))
+        self.assertEqual(1, correlator.register('tx1').block_number)
+
+    def test_expired(self):
+        correlator = TxCorrelator()
+        tracker = correlator.register('tx1', expiration=100)
+        correlator.on_block(make_block(1, 'h0', 'h1', time=200))
+        self.assertIsInstance(tracker.packed.exception(0), TimeoutError)
+
+    def test_ttl_without_expiration(self):
+        correlator = TxCorrelator(ttl=0.0)
+        tracker = correlator.register('tx1')
+        correlator.on_block(make_block(1, 'h0', 'h1'))
+        self.assertIsInstance(tracker.packed.exception(0), TimeoutError)
+        self.assertEqual(0, len(correlator))
+
+
+if __name__ == '__main__':
+    main()
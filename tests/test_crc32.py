@@ -0,0 +1,34 @@
+from unittest import main, TestCase
+import os
+from pyost import crc32
+from pyost.crc32 import KOOPMAN_TABLE, checksum, checksum_slicing, checksum_many, parity, parity_many
+
+
+class TestCRC32(TestCase):
+    def test_parity(self):
+        base = bytes.fromhex('12345abcde')
+        self.assertEqual('b98eda0f', parity(base, little_endian=False).hex())
+        self.assertEqual('0fda8eb9', parity(base).hex())
+
+    def test_slicing(self):
+        for size in range(0, 50):
+            data = os.urandom(size)
+            self.assertEqual(checksum(data, KOOPMAN_TABLE), checksum_slicing(data))
+
+    def test_many(self):
+        buffers = [os.urandom(size % 5 * 7) for size in range(50)]
+        expected = [checksum(b, KOOPMAN_TABLE) for b in buffers]
+        self.assertEqual(expected, checksum_many(buffers))
+        self.assertEqual([parity(b) for b in buffers], parity_many(buffers))
+
+    def test_many_without_numpy(self):
+        np, crc32.np = crc32.np, None
+        try:
+            buffers = [os.urandom(size) for size in range(20)]
+            self.assertEqual([checksum(b, KOOPMAN_TABLE) for b in buffers], checksum_many(buffers))
+        finally:
+            crc32.np = np
+
+
+if __name__ == '__main__':
+    main()
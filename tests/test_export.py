@@ -0,0 +1,68 @@
+from unittest import main, TestCase, skipUnless
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.iost import IOST
+from pyost.account import Account
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy
+from pyost.export import BlockColumns, export_blocks, NO_RECEIPT, _has_pyarrow
+
+
+class TestExport(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0).start()
+        self.node.add_account('admin', 100.0).add_account('bob')
+        publisher = Account('admin')
+        publisher.add_key_pair(KeyPair(Ed25519), 'active')
+        self.iost = IOST(self.node.url, publisher=publisher, wait_time=0.01, wait_max_retry=3,
+                         policy=CallPolicy(max_attempts=1))
+        self.tx_hashes = [self.iost.send_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+                          for _ in range(3)]
+        self.node.produce_block()
+        self.iost.send_tx(self.iost.create_transfer_tx('iost', 'bob', 'admin', 100.0))
+        self.node.produce_block()
+
+    def tearDown(self):
+        self.iost.close()
+        self.node.stop()
+
+    def test_numpy(self):
+        blocks, txs = export_blocks(self.iost, 1, 3, format='numpy')
+        self.assertEqual([1, 2], blocks['number'].tolist())
+        self.assertEqual([3, 1], blocks['tx_count'].tolist())
+        self.assertEqual(['admin'] * 4, txs['publisher'].tolist())
+        self.assertEqual(self.tx_hashes, txs['hash'][:3].tolist())
+        self.assertEqual([1, 1, 1, 2], txs['block_number'].tolist())
+        self.assertEqual([1] * 4, txs['action_count'].tolist())
+        self.assertEqual(3, (txs['status_code'] == 0).sum())
+        self.assertEqual(blocks['gas_usage'].sum(), txs['gas_usage'].sum())
+
+    def test_no_receipt(self):
+        block = pb.Block(number=1, transactions=[pb.Transaction(hash='a'),
+                                                 pb.Transaction(hash='b', tx_receipt=pb.TxReceipt(gas_usage=10.0))])
+        _, txs = BlockColumns().add(block).to_numpy()
+        self.assertEqual([NO_RECEIPT, 0], txs['status_code'].tolist())
+        self.assertEqual([NO_RECEIPT, 10.0], txs['gas_usage'].tolist())
+
+    def test_empty(self):
+        blocks, txs = BlockColumns().to_numpy()
+        self.assertEqual(0, len(blocks))
+        self.assertEqual(0, len(txs))
+        self.assertIn('witness', blocks.dtype.names)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            export_blocks(self.iost, 3, 1)
+        with self.assertRaises(ValueError):
+            BlockColumns().to_tables('csv')
+
+    @skipUnless(_has_pyarrow(), 'pyarrow is not installed')
+    def test_arrow(self):
+        blocks, txs = export_blocks(self.iost, 1, 3, format='arrow')
+        self.assertEqual([1, 2], blocks.column('number').to_pylist())
+        self.assertEqual(4, txs.num_rows)
+
+
+if __name__ == '__main__':
+    main()
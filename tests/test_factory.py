@@ -0,0 +1,87 @@
+import os
+import tempfile
+from unittest import main, TestCase
+from types import SimpleNamespace
+from concurrent.futures import Future
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519
+from pyost.account import Account
+from pyost.transaction import Action
+from pyost.factory import TxFactory, fixed_clock, read_file, send_file, _varint, _read_varint
+
+
+def make_publisher():
+    account = Account('admin')
+    account.add_key_pair(KeyPair(Ed25519, bytes(range(32))), 'active')
+    return account
+
+
+class FakeStub:
+    def __init__(self):
+        self.requests = []
+        self.SendTransaction = SimpleNamespace(future=self.send)
+
+    def send(self, request):
+        self.requests.append(request)
+        future = Future()
+        future.set_result(SimpleNamespace(hash=f'tx{len(self.requests)}'))
+        return future
+
+
+class TestTxFactory(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def batches(self, count):
+        return ([Action('token.iost', 'transfer', 'iost', 'admin', f'user{i}', '1', '')] for i in range(count))
+
+    def test_deterministic(self):
+        txs1 = list(TxFactory(make_publisher(), fixed_clock(10 ** 18, 1000)).build(self.batches(3)))
+        txs2 = list(TxFactory(make_publisher(), fixed_clock(10 ** 18, 1000)).build(self.batches(3)))
+        self.assertEqual([10 ** 18, 10 ** 18 + 1000, 10 ** 18 + 2000], [tx.time for tx in txs1])
+        self.assertEqual(10 ** 18 + 90 * 10 ** 9, txs1[0].expiration)
+        self.assertEqual([tx.hash for tx in txs1], [tx.hash for tx in txs2])
+
+    def test_write_and_send(self):
+        hashes = TxFactory(make_publisher(), fixed_clock(10 ** 18)).write(self.path, self.batches(100))
+        requests = list(read_file(self.path, chunk_size=64))
+        self.assertEqual(100, len(requests))
+        self.assertEqual(len(set(hashes)), 100)
+        self.assertEqual('admin', requests[0].publisher)
+        self.assertEqual('["iost", "admin", "user99", "1", ""]', requests[99].actions[0].data)
+
+        stub = FakeStub()
+        self.assertEqual([f'tx{i + 1}' for i in range(100)],
+                         send_file(SimpleNamespace(next_stub=lambda: stub), self.path, max_in_flight=8))
+        self.assertEqual(requests, stub.requests)
+
+    def test_write_append(self):
+        factory = TxFactory(make_publisher(), fixed_clock(10 ** 18))
+        factory.write(self.path, self.batches(2))
+        hashes = factory.write(self.path, self.batches(3))
+        self.assertEqual(3, len(list(read_file(self.path))))
+        hashes += factory.write(self.path, self.batches(1), append=True)
+        self.assertEqual(4, len(list(read_file(self.path))))
+        self.assertEqual(4, len(set(hashes)))
+
+    def test_varint(self):
+        for value in (0, 1, 127, 128, 300, 1 << 31, (1 << 64) - 1):
+            data = _varint(value) + b'x'
+            self.assertEqual((value, len(data) - 1), _read_varint(data, 0))
+        with self.assertRaises(IndexError):
+            _read_varint(_varint(300)[:1], 0)
+
+    def test_truncated(self):
+        TxFactory(make_publisher()).write(self.path, self.batches(2))
+        with open(self.path, 'rb+') as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            list(read_file(self.path))
+
+
+if __name__ == '__main__':
+    main()
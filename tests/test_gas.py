@@ -0,0 +1,88 @@
+from unittest import main, TestCase
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.transaction import Transaction, TxReceipt, TransactionError, Action
+from pyost.blockchain import Block
+from pyost.gas import GasEstimator, GasRatioOracle
+
+
+class FakeIOST:
+    def __init__(self, gas_usage=1000.0, ram_usage=None, status_code=pb.TxReceipt.SUCCESS):
+        self.receipt = pb.TxReceipt(gas_usage=gas_usage, ram_usage=ram_usage or {}, status_code=status_code)
+        self.executed = []
+
+    def create_tx(self, actions=None):
+        return Transaction(actions=actions)
+
+    def exec_tx(self, tx):
+        self.executed.append(tx)
+        return TxReceipt().from_raw(self.receipt)
+
+
+class TestGasEstimator(TestCase):
+    def test_shape(self):
+        self.assertEqual(GasEstimator.shape([Action('c', 'f', 'a', 1)]),
+                         GasEstimator.shape([Action('c', 'f', 'b', 2)]))
+        self.assertNotEqual(GasEstimator.shape([Action('c', 'f', 'a', 1)]),
+                            GasEstimator.shape([Action('c', 'f', 'a', '1')]))
+
+    def test_apply_uses_cache(self):
+        iost = FakeIOST(gas_usage=10000.0)
+        estimator = GasEstimator(iost, margin=1.5)
+        tx1 = estimator.apply(Transaction(actions=[Action('c', 'f', 'a', 1)]))
+        tx2 = estimator.apply(Transaction(actions=[Action('c', 'f', 'b', 2)]))
+        self.assertEqual(15000.0, tx1.gas_limit)
+        self.assertEqual(15000.0, tx2.gas_limit)
+        self.assertEqual(1, estimator.dry_runs)
+        self.assertEqual(estimator.max_gas_limit, iost.executed[0].gas_limit)
+
+    def test_min_gas_limit(self):
+        estimator = GasEstimator(FakeIOST(gas_usage=10.0), min_gas_limit=6000.0)
+        self.assertEqual(6000.0, estimator.apply(Transaction(actions=[Action('c', 'f')])).gas_limit)
+
+    def test_ram_payer(self):
+        estimator = GasEstimator(FakeIOST(ram_usage={'bob': 100}), ram_payer='alice', ram_margin=1.1)
+        tx = estimator.apply(Transaction(actions=[Action('c', 'f')]))
+        self.assertEqual(('ram.iost', 'buy', '["alice", "bob", 110]'),
+                         (tx.actions[0].contract, tx.actions[0].action_name, tx.actions[0].data))
+        self.assertEqual(2, estimator.dry_runs)
+
+    def test_ram_payer_idempotent(self):
+        estimator = GasEstimator(FakeIOST(ram_usage={'bob': 100}), ram_payer='alice')
+        tx = estimator.apply(estimator.apply(Transaction(actions=[Action('c', 'f')])))
+        self.assertEqual([('ram.iost', 'buy'), ('c', 'f')], [(a.contract, a.action_name) for a in tx.actions])
+
+    def test_failed_dry_run(self):
+        estimator = GasEstimator(FakeIOST(status_code=pb.TxReceipt.WRONG_PARAMETER))
+        with self.assertRaises(TransactionError):
+            estimator.apply(Transaction(actions=[Action('c', 'f')]))
+
+
+def make_block(*ratios):
+    return Block().from_raw(pb.Block(transactions=[pb.Transaction(gas_ratio=r) for r in ratios]),
+                            pb.BlockResponse.PENDING)
+
+
+class TestGasRatioOracle(TestCase):
+    def test_empty(self):
+        oracle = GasRatioOracle(None, min_ratio=1.0)
+        self.assertIsNone(oracle.percentile(50))
+        self.assertEqual(1.0, oracle.ratio_for(1.0))
+
+    def test_ratio_for(self):
+        oracle = GasRatioOracle(None, confidence=0.9, block_time=0.5)
+        for i in range(1, 11):
+            oracle.on_block(make_block(float(i), float(i) + 5))
+        oracle.on_block(make_block())
+        self.assertEqual(5.0, oracle.percentile(50))
+        self.assertEqual(15.0, oracle.percentile(100, per_block=False))
+        self.assertEqual(9.0, oracle.ratio_for(0.5))
+        self.assertLess(oracle.ratio_for(5.0), oracle.ratio_for(0.5))
+
+    def test_max_ratio(self):
+        oracle = GasRatioOracle(None, max_ratio=3.0)
+        oracle.on_block(make_block(50.0))
+        self.assertEqual(3.0, oracle.ratio_for())
+
+
+if __name__ == '__main__':
+    main()
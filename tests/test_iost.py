@@ -1,5 +1,5 @@
 from unittest import main, TestCase
-import base58
+from pyost import b58
 from pyost.iost import IOST
 from pyost.transaction import Transaction
 
@@ -44,8 +44,8 @@ class TestIOST(TestCase):
             'status': {},
             'succActionNum': 1
         }
-        self.assertEqual(compare_dict['txHash'], base58.b58decode(tx_hash))
-        self.assertEqual(res_hash, base58.b58decode(receipt_hash))
+        self.assertEqual(compare_dict['txHash'], b58.b58decode(tx_hash))
+        self.assertEqual(res_hash, b58.b58decode(receipt_hash))
         self.assertDictEqual(tx, compare_dict)
 
     def test_get_block_by_hash(self):
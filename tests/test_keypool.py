@@ -0,0 +1,57 @@
+from unittest import main, TestCase, skipUnless
+import os
+import tempfile
+from pyost.keypool import KeyPool
+from pyost.algorithm import Ed25519, Secp256k1
+
+try:
+    import cryptography
+except ImportError:
+    cryptography = None
+
+
+class TestKeyPool(TestCase):
+    def test_fill_and_get(self):
+        pool = KeyPool(Secp256k1, batch_size=3, processes=2).fill(7)
+        self.assertEqual(7, len(pool))
+        kps = pool.get_many(9)
+        self.assertEqual(0, len(pool))
+        self.assertEqual(9, len({kp.seckey for kp in kps}))
+        for kp in kps:
+            self.assertEqual(Secp256k1.get_pubkey(kp.seckey), kp.pubkey)
+
+    @skipUnless(cryptography, 'requires cryptography')
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'keys.bin')
+            pool = KeyPool(Ed25519, path, b'secret', processes=1).fill(5)
+            pool.save()
+
+            loaded = KeyPool(Ed25519, path, b'secret')
+            self.assertEqual([kp.seckey for kp in pool.get_many(5)], [loaded.get().seckey for _ in range(5)])
+
+            with self.assertRaises(ValueError):
+                KeyPool(Ed25519, path, b'wrong')
+            with self.assertRaises(ValueError):
+                KeyPool(Secp256k1, path, b'secret')
+
+    @skipUnless(cryptography, 'requires cryptography')
+    def test_consumed_keys_not_reloaded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'keys.bin')
+            pool = KeyPool(Ed25519, path, b'secret', processes=1).fill(5)
+            pool.save()
+            taken = {pool.get().seckey for _ in range(2)}
+
+            # Crash before save: the taken keys are not loaded again.
+            loaded = KeyPool(Ed25519, path, b'secret')
+            self.assertEqual(3, len(loaded))
+            self.assertFalse(taken & {kp.seckey for kp in loaded.get_many(3)})
+            self.assertEqual(0, len(KeyPool(Ed25519, path, b'secret')))
+
+            loaded.fill(4).save()
+            self.assertEqual(4, len(KeyPool(Ed25519, path, b'secret')))
+
+
+if __name__ == '__main__':
+    main()
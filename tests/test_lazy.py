@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from unittest import main, TestCase
+from pyost.lazy import LazyModule, lazy_import
+
+HEAVY_MODULES = ('grpc', 'pyost.rpc.pb.rpc_pb2', 'google.protobuf', 'ecdsa', 'ed25519')
+
+
+def loaded_modules(statement: str) -> set:
+    code = f'{statement}\nimport sys\nprint(" ".join(sys.modules))'
+    output = subprocess.run([sys.executable, '-c', code], check=True, stdout=subprocess.PIPE).stdout
+    return set(output.decode().split())
+
+
+class TestLazyImport(TestCase):
+    def test_lazy_module(self):
+        self.assertIs(sys.modules['json'], lazy_import('json'))
+        module = LazyModule('pyost.crc32')
+        self.assertNotIn('parity', vars(module))
+        from pyost import crc32
+        self.assertIs(crc32.parity, module.parity)
+        self.assertIn('parity', vars(module))
+        with self.assertRaises(AttributeError):
+            module.missing
+
+    def test_offline_imports(self):
+        modules = loaded_modules('import pyost.transaction, pyost.account, pyost.factory')
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
+        modules = loaded_modules('import pyost.iost')
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_first_use(self):
+        modules = loaded_modules('from pyost import Ed25519, Transaction\n'
+                                 'Transaction().to_request_raw(), Ed25519.create_key_pair()')
+        for name in ('pyost.rpc.pb.rpc_pb2', 'ed25519'):
+            self.assertIn(name, modules)
+        self.assertNotIn('grpc', modules)
+
+
+if __name__ == '__main__':
+    main()
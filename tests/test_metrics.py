@@ -0,0 +1,81 @@
+import threading
+from unittest import main, TestCase
+import grpc
+from pyost.iost import IOST
+from pyost.event import Event
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy
+from pyost.metrics import Histogram, RpcMetrics, SpanSink, CallbackSink, MetricsInterceptor
+
+
+class TestHistogram(TestCase):
+    def test_quantile(self):
+        histogram = Histogram((1.0, 2.0, 4.0))
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+        self.assertEqual([1, 2, 1, 0], histogram.counts)
+        self.assertEqual(1.5, histogram.quantile(0.5))
+        self.assertEqual(4.0, histogram.quantile(1.0))
+
+
+class TestMetricsInterceptor(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0).start()
+        self.metrics = RpcMetrics()
+        self.spans = SpanSink()
+        self.records = []
+        interceptor = MetricsInterceptor(self.metrics, self.spans, CallbackSink(self.records.append))
+        self.iost = IOST(self.node.url, interceptors=[interceptor], policy=CallPolicy(max_attempts=1))
+
+    def tearDown(self):
+        self.iost.close()
+        self.node.stop()
+
+    def test_unary(self):
+        self.iost.get_chain_info()
+        self.node.fail_next('GetNodeInfo')
+        with self.assertRaises(grpc.RpcError):
+            self.iost.get_node_info()
+
+        stats = self.metrics['GetChainInfo']
+        self.assertEqual({'OK': 1}, dict(stats.codes))
+        self.assertEqual(0, stats.in_flight)
+        self.assertGreater(stats.response_bytes, 0)
+        self.assertEqual({'UNAVAILABLE': 1}, dict(self.metrics['GetNodeInfo'].codes))
+        self.assertEqual(['GetChainInfo', 'GetNodeInfo'], [r.method for r in self.records])
+        self.assertEqual('ERROR', self.spans.spans[1].status)
+        self.assertIn('pyost_rpc_calls_total{method="GetChainInfo",code="OK"} 1', self.metrics.to_prometheus())
+
+    def test_stream(self):
+        events = []
+        errors = []
+        subscription = self.iost.subscribe([Event.Topic.CONTRACT_EVENT])
+        self.assertEqual(1, self.metrics['Subscribe'].in_flight)
+
+        def consume():
+            try:
+                for event in subscription:
+                    events.append(event)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        # The node only sends the events emitted once the stream is registered.
+        for _ in range(500):
+            if events:
+                break
+            self.node.emit_event('c', 'data')
+            thread.join(0.01)
+        subscription.close()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([], errors)
+        self.assertTrue(events)
+        self.assertEqual({'CANCELLED': 1}, dict(self.metrics['Subscribe'].codes))
+        self.assertEqual(0, self.metrics['Subscribe'].in_flight)
+        self.assertEqual(len(events), self.records[-1].responses)
+
+if __name__ == '__main__':
+    main()
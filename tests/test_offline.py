@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+from unittest import main, TestCase
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.b58 import b58encode
+from pyost.account import Account
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519, Secp256k1
+from pyost.transaction import Transaction, Action
+from pyost.factory import fixed_clock
+from pyost.offline import OfflineSigner, encode_tx_request
+
+
+class TestOffline(TestCase):
+    def setUp(self):
+        self.admin = Account('admin')
+        self.admin.add_key_pair(KeyPair(Ed25519), 'active')
+        self.bob = Account('bob')
+        self.bob.add_key_pair(KeyPair(Secp256k1), 'owner')
+        self.signer = OfflineSigner(self.admin, fixed_clock(1560000000000000000), gas_ratio=1.5)
+
+    def test_encode_tx_request(self):
+        self.assertEqual(b'', encode_tx_request(Transaction(time=0, expiration=0, gas_ratio=0, gas_limit=0,
+                                                            chain_id=0)))
+        tx = self.signer.create_transfer_tx('iost', 'admin', 'bob', 10.5, 'mémo')
+        tx.actions.append(Action('c', 'a'))
+        tx.delay = -1
+        self.assertEqual(tx.to_request_raw().SerializeToString(), encode_tx_request(tx))
+        tx.delay = 0
+        self.signer.sign(tx, [(self.bob, 'owner')])
+        self.assertEqual(tx.to_request_raw().SerializeToString(), encode_tx_request(tx))
+
+    def test_transfer_amount(self):
+        tx = self.signer.create_transfer_tx('iost', 'admin', 'bob', 0.1 + 0.2)
+        self.assertEqual('0.3', json.loads(tx.actions[0].data)[3])
+        self.assertEqual([('*', 'unlimited'), ('iost', '0.3')], [(al.token, al.value) for al in tx.amount_limits])
+        tx = self.signer.create_transfer_tx('emogi', 'admin', 'bob', 1.239, decimal=2)
+        self.assertEqual('1.23', json.loads(tx.actions[0].data)[3])
+        self.assertEqual('5', self.signer.format_amount('emogi', 5))
+        with self.assertRaises(ValueError):
+            self.signer.create_transfer_tx('emogi', 'admin', 'bob', 1.5)
+
+    def test_sign(self):
+        tx = self.signer.create_call_tx('ram.iost', 'buy', 'admin', 'admin', 100)
+        self.assertEqual(1560000000000000000, tx.time)
+        self.assertEqual([('*', 'unlimited')], [(al.token, al.value) for al in tx.amount_limits])
+        tx_hash, data = self.signer.sign(tx, [(self.bob, 'owner')])
+
+        request = pb.TransactionRequest.FromString(data)
+        self.assertEqual(['bob@owner'], list(request.signers))
+        self.assertEqual('admin', request.publisher)
+        self.assertEqual(b58encode(tx.hash).decode(), tx_hash)
+        self.assertTrue(tx.signatures[0].verify(tx._base_hash()))
+        self.assertTrue(tx.publisher_signatures[0].verify(tx._publish_hash()))
+
+    def test_no_grpc(self):
+        code = ('from pyost.account import Account\n'
+                'from pyost.signature import KeyPair\n'
+                'from pyost.algorithm import Ed25519\n'
+                'from pyost.offline import OfflineSigner\n'
+                'admin = Account("admin")\n'
+                'admin.add_key_pair(KeyPair(Ed25519))\n'
+                'signer = OfflineSigner(admin)\n'
+                'signer.sign(signer.create_transfer_tx("iost", "admin", "bob", 1.0))\n'
+                'import sys\n'
+                'print(" ".join(sys.modules))')
+        output = subprocess.run([sys.executable, '-c', code], check=True, stdout=subprocess.PIPE).stdout
+        modules = set(output.decode().split())
+        for name in ('grpc', 'google.protobuf', 'pyost.rpc.pb.rpc_pb2'):
+            self.assertNotIn(name, modules)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+from unittest import main, TestCase
+import threading
+import time
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.event import Event
+from pyost.pipeline import EventBatcher, ContractReceipt, ContractEvent, decode_events
+
+
+def make_event(topic, data, time=0):
+    return Event().from_raw(pb.Event(topic=topic, data=data, time=time))
+
+
+class TestDecodeEvents(TestCase):
+    def test_from_raw_topic(self):
+        event = make_event(pb.Event.CONTRACT_EVENT, '{}')
+        self.assertEqual(Event.Topic.CONTRACT_EVENT, event.topic)
+        self.assertEqual(pb.Event.CONTRACT_EVENT, event.to_raw().topic)
+
+    def test_unknown_topic(self):
+        self.assertEqual(Event.Topic.UNKNOWN, Event().from_raw(pb.Event(topic=7, data='{}')).topic)
+
+    def test_decode(self):
+        events = [make_event(pb.Event.CONTRACT_RECEIPT, '["iost","a","b","1",""]', 1),
+                  make_event(pb.Event.CONTRACT_EVENT, '{"n": 2}', 2)]
+        records = decode_events(events)
+        self.assertIsInstance(records[0], ContractReceipt)
+        self.assertIsInstance(records[1], ContractEvent)
+        self.assertEqual(['iost', 'a', 'b', '1', ''], records[0].value)
+        self.assertEqual({'n': 2}, records[1].value)
+        self.assertEqual(2, records[1].time)
+
+    def test_decode_invalid_json(self):
+        events = [make_event(pb.Event.CONTRACT_EVENT, '1,2'),
+                  make_event(pb.Event.CONTRACT_EVENT, 'hello'),
+                  make_event(pb.Event.CONTRACT_EVENT, '3')]
+        self.assertEqual(['1,2', 'hello', 3], [r.value for r in decode_events(events)])
+
+    def test_decode_split_json(self):
+        events = [make_event(pb.Event.CONTRACT_EVENT, '{"a":1'),
+                  make_event(pb.Event.CONTRACT_EVENT, '"x":2},{"to":"y"}'),
+                  make_event(pb.Event.CONTRACT_EVENT, '{"b":3}')]
+        self.assertEqual(['{"a":1', '"x":2},{"to":"y"}', {'b': 3}], [r.value for r in decode_events(events)])
+
+    def test_decode_unknown_topic(self):
+        unknown = make_event(7, '{}')
+        records = decode_events([make_event(pb.Event.CONTRACT_EVENT, '1'), unknown])
+        self.assertEqual(1, records[0].value)
+        self.assertIs(unknown, records[1])
+
+
+class TestEventBatcher(TestCase):
+    def test_batch_by_count(self):
+        events = [make_event(pb.Event.CONTRACT_RECEIPT, str(i)) for i in range(10)]
+        batches = list(EventBatcher(iter(events), max_size=4, max_delay=1.0))
+        self.assertEqual([4, 4, 2], [len(b) for b in batches])
+        self.assertEqual(list(range(10)), [r.value for b in batches for r in b])
+
+    def test_mixed_topics(self):
+        events = [make_event(pb.Event.CONTRACT_RECEIPT, '1'), make_event(7, '2'),
+                  make_event(pb.Event.CONTRACT_EVENT, '3')]
+        batches = list(EventBatcher(iter(events), max_size=2, max_delay=1.0))
+        self.assertEqual([ContractReceipt, Event, ContractEvent], [type(r) for b in batches for r in b])
+
+    def test_batch_by_time(self):
+        def slow_events():
+            yield make_event(pb.Event.CONTRACT_RECEIPT, '1')
+            time.sleep(0.2)
+            yield make_event(pb.Event.CONTRACT_RECEIPT, '2')
+
+        batches = list(EventBatcher(slow_events(), max_size=10, max_delay=0.05, decode=False))
+        self.assertEqual([1, 1], [len(b) for b in batches])
+        self.assertIsInstance(batches[0][0], Event)
+
+    def test_error_is_raised(self):
+        def failing_events():
+            yield make_event(pb.Event.CONTRACT_RECEIPT, '1')
+            raise ConnectionError('lost')
+
+        batches = []
+        with self.assertRaises(ConnectionError):
+            for batch in EventBatcher(failing_events(), max_size=10, max_delay=0.05):
+                batches.append(batch)
+        self.assertEqual(1, len(batches))
+
+    def test_close_blocked_reader(self):
+        class BlockingSource:
+            def __init__(self):
+                self.cancelled = threading.Event()
+
+            def __iter__(self):
+                for i in range(3):
+                    yield make_event(pb.Event.CONTRACT_RECEIPT, str(i))
+                self.cancelled.wait()
+
+            def cancel(self):
+                self.cancelled.set()
+
+        source = BlockingSource()
+        batcher = EventBatcher(source, max_size=1, max_delay=0.01, buffer_size=1)
+        for batch in batcher:
+            batcher.close()
+        batcher._thread.join(1.0)
+        self.assertFalse(batcher._thread.is_alive())
+        self.assertTrue(source.cancelled.is_set())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import time
+from unittest import main, TestCase
+import grpc
+from pyost.iost import IOST
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy, RetryBudget
+
+
+class TestRetryBudget(TestCase):
+    def test_throttling(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+        self.assertTrue(budget.can_retry())
+        budget.on_failure()
+        budget.on_failure()
+        self.assertFalse(budget.can_retry())
+        budget.on_success()
+        self.assertTrue(budget.can_retry())
+
+
+class TestCallPolicy(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0).start()
+        self.hedge_node = FakeNode(block_time=0).start()
+        self.policy = CallPolicy(deadline=0.5, initial_backoff=0.01, hedge_min_samples=5)
+        self.iost = IOST(self.node.url, policy=self.policy, hedge_urls=[self.hedge_node.url])
+
+    def tearDown(self):
+        self.iost._channel.close()
+        self.node.stop()
+        self.hedge_node.stop()
+
+    def test_retry(self):
+        self.node.fail_next('GetChainInfo', 2)
+        self.iost.get_chain_info()
+        self.assertEqual(3, self.node.calls['GetChainInfo'])
+        self.assertEqual(2, self.policy.retries)
+
+        self.node.fail_next('GetChainInfo', 3)
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.iost.get_chain_info()
+        self.assertEqual(grpc.StatusCode.UNAVAILABLE, cm.exception.code())
+
+    def test_no_retry(self):
+        self.node.fail_next('GetChainInfo', 1, grpc.StatusCode.INVALID_ARGUMENT)
+        with self.assertRaises(grpc.RpcError):
+            self.iost.get_chain_info()
+        self.node.fail_next('SendTransaction')
+        with self.assertRaises(grpc.RpcError):
+            self.iost._call('SendTransaction', pb.TransactionRequest())
+        self.assertEqual(0, self.policy.retries)
+
+    def test_deadline(self):
+        self.policy.deadlines['GetNodeInfo'] = 0.05
+        self.policy.max_attempts = 1
+        self.node.latency = 0.2
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.iost.get_node_info()
+        self.assertEqual(grpc.StatusCode.DEADLINE_EXCEEDED, cm.exception.code())
+
+    def test_hedge(self):
+        self.assertIsNone(self.policy.hedge_delay('GetChainInfo'))
+        for _ in range(5):
+            self.iost.get_chain_info()
+        self.assertIsNotNone(self.policy.hedge_delay('GetChainInfo'))
+        self.assertEqual(0, self.hedge_node.calls['GetChainInfo'])
+
+        self.node.latency = 0.3
+        started = time.perf_counter()
+        self.iost.get_chain_info()
+        self.assertLess(time.perf_counter() - started, 0.25)
+        self.assertEqual(1, self.policy.hedges)
+        self.assertEqual(1, self.hedge_node.calls['GetChainInfo'])
+
+
+if __name__ == '__main__':
+    main()
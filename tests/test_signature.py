@@ -1,6 +1,6 @@
 from unittest import main, TestCase
 from hashlib import sha3_256 as sha3
-from base58 import b58decode, b58encode
+from pyost.b58 import b58decode, b58encode
 from base64 import b64decode, b64encode
 from pyost.signature import Signature, KeyPair
 from pyost.algorithm import Algorithm, Secp256k1
@@ -0,0 +1,125 @@
+from unittest import main, TestCase
+from types import SimpleNamespace
+import grpc
+from pyost.rpc.pb import rpc_pb2 as pb
+from pyost.blockchain import Block
+from pyost.event import Event
+from pyost.subscription import ResilientSubscription, receipt_events
+
+
+class FakeCall:
+    def __init__(self, events, error=None):
+        self.events = events
+        self.error = error
+        self.cancelled = False
+
+    def __iter__(self):
+        for event in self.events:
+            yield pb.SubscribeResponse(event=event)
+        if self.error is not None:
+            raise self.error
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeError(grpc.RpcError, grpc.Call):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def make_event(data, time=0):
+    return pb.Event(topic=pb.Event.CONTRACT_RECEIPT, data=data, time=time)
+
+
+def make_block(number, receipts):
+    txs = [pb.Transaction(hash=f'tx{number}-{i}', tx_receipt=pb.TxReceipt(
+        tx_hash=f'tx{number}-{i}', receipts=[pb.TxReceipt.Receipt(func_name=fn, content=content)]))
+        for i, (fn, content) in enumerate(receipts)]
+    return Block().from_raw(pb.Block(number=number, time=number, transactions=txs),
+                            pb.BlockResponse.PENDING)
+
+
+class FakeIOST:
+    def __init__(self, calls, blocks, heads):
+        self._calls = list(calls)
+        self._heads = list(heads)
+        self.blocks = blocks
+        self.stub = SimpleNamespace(Subscribe=lambda req: self._calls.pop(0))
+
+    def next_stub(self):
+        return self.stub
+
+    def get_chain_info(self):
+        return SimpleNamespace(head_block=self._heads.pop(0))
+
+    def get_block_by_num(self, number, complete=False):
+        return self.blocks[number]
+
+
+class TestResilientSubscription(TestCase):
+    def test_receipt_events(self):
+        block = make_block(1, [('token.iost/transfer', 'a'), ('other.iost/run', 'b')])
+        self.assertEqual(['a', 'b'], [e.data for e in receipt_events(block)])
+        self.assertEqual(['a'], [e.data for e in receipt_events(block, 'token.iost')])
+
+    def test_reconnect_and_backfill(self):
+        blocks = {
+            11: make_block(11, [('token.iost/transfer', 'a')]),
+            12: make_block(12, [('token.iost/transfer', 'b'), ('other.iost/run', 'x')]),
+            13: make_block(13, [('token.iost/transfer', 'c')]),
+        }
+        first = FakeCall([make_event('a')], FakeError())
+        second = FakeCall([make_event('c'), make_event('d')])
+        iost = FakeIOST([first, second], blocks, [10, 13])
+
+        sub = ResilientSubscription(iost, [Event.Topic.CONTRACT_RECEIPT], 'token.iost',
+                                    min_backoff=0.0, max_backoff=0.0)
+        received = []
+        for event in sub:
+            received.append(event.data)
+            if event.data == 'd':
+                sub.close()
+
+        self.assertEqual(['a', 'b', 'c', 'd'], received)
+        self.assertEqual(13, sub.last_block)
+        self.assertTrue(first.cancelled)
+        self.assertTrue(second.cancelled)
+
+    def test_identical_events(self):
+        blocks = {
+            11: make_block(11, [('token.iost/transfer', 'a')]),
+            12: make_block(12, [('token.iost/transfer', 'x'), ('token.iost/transfer', 'x')]),
+        }
+        first = FakeCall([make_event('a', 11), make_event('a', 11)], FakeError())
+        second = FakeCall([make_event('y', 20), make_event('y', 20), make_event('end', 20)])
+        iost = FakeIOST([first, second], blocks, [10, 12])
+
+        sub = ResilientSubscription(iost, [Event.Topic.CONTRACT_RECEIPT], 'token.iost',
+                                    min_backoff=0.0, max_backoff=0.0)
+        received = []
+        for event in sub:
+            received.append(event.data)
+            if event.data == 'end':
+                sub.close()
+        self.assertEqual(['a', 'a', 'x', 'x', 'y', 'y', 'end'], received)
+
+    def test_graceful_close_backoff(self):
+        iost = FakeIOST([FakeCall([]), FakeCall([]), FakeCall([make_event('a')])], {}, [1, 1, 1])
+        sub = ResilientSubscription(iost, [Event.Topic.CONTRACT_RECEIPT], min_backoff=0.0, max_backoff=0.0)
+        delays = []
+        sub._backoff = lambda failures: delays.append(failures) or 0.0
+        for event in sub:
+            sub.close()
+        self.assertEqual([1, 2], delays)
+
+    def test_max_retry(self):
+        iost = FakeIOST([FakeCall([], FakeError()), FakeCall([], FakeError())], {}, [1, 1])
+        sub = ResilientSubscription(iost, [Event.Topic.CONTRACT_RECEIPT],
+                                    min_backoff=0.0, max_backoff=0.0, max_retry=1)
+        with self.assertRaises(ConnectionError):
+            list(sub)
+
+
+if __name__ == '__main__':
+    main()
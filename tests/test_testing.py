@@ -0,0 +1,174 @@
+import json
+import threading
+from unittest import main, TestCase
+import grpc
+from pyost.iost import IOST
+from pyost.account import Account
+from pyost.signature import KeyPair
+from pyost.algorithm import Ed25519
+from pyost.event import Event
+from pyost.transaction import Transaction, TxReceipt, TransactionError
+from pyost.testing import FakeNode
+from pyost.policy import CallPolicy
+from pyost.correlation import TxCorrelator
+from pyost.follower import BlockFollower
+from pyost.gas import GasEstimator
+
+
+class TestFakeNode(TestCase):
+    def setUp(self):
+        self.node = FakeNode(block_time=0, lib_lag=1).start()
+        self.node.add_account('admin', 100.0).add_account('bob')
+        publisher = Account('admin')
+        publisher.add_key_pair(KeyPair(Ed25519), 'active')
+        self.iost = IOST(self.node.url, publisher=publisher, wait_time=0.01, wait_max_retry=3,
+                         policy=CallPolicy(max_attempts=1))
+
+    def tearDown(self):
+        self.iost._channel.close()
+        self.node.stop()
+
+    def test_transfer(self):
+        tx_hash = self.iost.send_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 10.0))
+        self.assertEqual(Transaction.Status.PENDING, self.iost.get_tx_by_hash(tx_hash).status)
+        block = self.node.produce_block()
+        receipt = self.iost.wait_tx(tx_hash)
+        self.assertEqual(['token.iost/transfer'], [r.func_name for r in receipt.receipts])
+        self.assertEqual(90.0, self.iost.get_balance('admin'))
+        self.assertEqual(10.0, self.iost.get_balance('bob'))
+        self.assertEqual(1, self.iost.get_block_by_num(block.number, complete=True).tx_count)
+        self.assertEqual(1, self.iost.get_chain_info().head_block)
+
+    def test_to_dict_and_repr(self):
+        tx_hash = self.iost.send_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 10.0))
+        block = self.node.produce_block()
+        receipt = self.iost.wait_tx(tx_hash)
+        block = self.iost.get_block_by_num(block.number, complete=True)
+        tx = self.iost.get_tx_by_hash(tx_hash)
+        for obj in (block, tx, receipt, self.iost.get_account_info('admin')):
+            json.dumps(obj.to_dict())
+            self.assertNotIn('\n', repr(obj))
+        self.assertEqual('SUCCESS', receipt.to_dict()['status_code'])
+        self.assertEqual(tx_hash, tx.to_dict()['hash'])
+        self.assertEqual(tx_hash, block.to_dict()['transactions'][0]['hash'])
+        self.assertIn(f"tx_hash='{tx_hash}'", repr(receipt))
+
+    def test_get_balances(self):
+        balances = self.iost.get_balances(['admin', 'bob', 'admin'], ['iost', 'emogi'], concurrency=2)
+        self.assertEqual({('admin', 'iost'): 100.0, ('admin', 'emogi'): 0.0,
+                          ('bob', 'iost'): 0.0, ('bob', 'emogi'): 0.0}, balances)
+        self.assertEqual(4, self.node.calls['GetTokenBalance'])
+        self.node.fail_next('GetTokenBalance')
+        balances = self.iost.get_balances(['admin', 'bob'], concurrency=1)
+        self.assertEqual(grpc.StatusCode.UNAVAILABLE, balances['admin', 'iost'].code())
+        self.assertEqual(0.0, balances['bob', 'iost'])
+
+    def test_token_info(self):
+        info = self.iost.get_token_info('iost')
+        self.assertEqual(8, info.decimal)
+        self.assertIs(info, self.iost.get_token_info('iost'))
+        tx = self.iost.create_transfer_tx('iost', 'admin', 'bob', 0.123456789)
+        self.assertEqual([('*', 'unlimited'), ('iost', '0.12345678')],
+                         [(al.token, al.value) for al in tx.amount_limits])
+        self.assertEqual(1, self.node.calls['GetTokenInfo'])
+        self.iost.get_token_info('iost', by_longest_chain=True)
+        self.assertEqual(2, self.node.calls['GetTokenInfo'])
+        tx = self.iost.create_transfer_tx('nope', 'admin', 'bob', 1.239, decimal=2)
+        self.assertEqual('1.23', json.loads(tx.actions[0].data)[3])
+        self.assertEqual(2, self.node.calls['GetTokenInfo'])
+        with self.assertRaises(grpc.RpcError):
+            self.iost.create_transfer_tx('nope', 'admin', 'bob', 1.0)
+
+    def test_send_and_track_tx(self):
+        follower = BlockFollower(self.iost, start_block=1)
+        self.iost.correlator = TxCorrelator().attach(follower)
+        tracker = self.iost.send_and_track_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+        self.node.produce_block()
+        follower.poll()
+        self.assertEqual(tracker.tx_hash, tracker.wait(1.0).tx_hash)
+
+    def test_gas_estimator_keeps_explicit_gas_limit(self):
+        self.iost.gas_estimator = GasEstimator(self.iost, min_gas_limit=1.0)
+        tx = self.iost.create_transfer_tx('iost', 'admin', 'bob', 1.0)
+        self.iost.send_tx(tx)
+        self.assertNotEqual(self.iost.gas_limit, tx.gas_limit)
+        tx = self.iost.create_transfer_tx('iost', 'admin', 'bob', 1.0)
+        tx.gas_limit = 50000.0
+        self.iost.send_tx(tx)
+        self.assertEqual(50000.0, tx.gas_limit)
+        self.assertEqual(1, self.iost.gas_estimator.dry_runs)
+
+    def test_new_accounts_key_pool(self):
+        calls = []
+
+        class FakeKeyPool:
+            def get_many(self, count):
+                calls.append(count)
+                return [KeyPair(Ed25519) for _ in range(count)]
+
+        stopped = threading.Event()
+
+        def produce():
+            while not stopped.wait(0.01):
+                self.node.produce_block()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        try:
+            accounts = self.iost.new_accounts(['u1', 'u2', 'u3'], 'admin', initial_gas_pledge=10.0,
+                                              key_pool=FakeKeyPool(), accounts_per_tx=2)
+        finally:
+            stopped.set()
+            thread.join()
+        self.assertEqual(['u1', 'u2', 'u3'], [a.name for a in accounts])
+        self.assertEqual([2, 1], calls)
+
+    def test_new_account_amounts(self):
+        tx = self.iost.create_new_account_tx('u1', 'admin', 'owner', 'active',
+                                             initial_gas_pledge=1e16 + 10.0, initial_coins=1e-05)
+        self.assertEqual([('auth.iost', 'signUp'), ('gas.iost', 'pledge'), ('token.iost', 'transfer')],
+                         [(a.contract, a.action_name) for a in tx.actions])
+        self.assertEqual('10000000000000000', json.loads(tx.actions[1].data)[2])
+        self.assertEqual('0.00001', json.loads(tx.actions[2].data)[3])
+
+    def test_balance_not_enough(self):
+        tx_hash = self.iost.send_tx(self.iost.create_transfer_tx('iost', 'bob', 'admin', 10.0))
+        self.node.produce_block()
+        with self.assertRaises(TransactionError) as cm:
+            self.iost.wait_tx(tx_hash)
+        self.assertEqual(TxReceipt.StatusCode.BALANCE_NOT_ENOUGH, cm.exception.status_code)
+
+    def test_storage(self):
+        self.node.set_storage('c', 'k', '"v"').set_storage('c', 'm', '1', 'f')
+        self.assertEqual('"v"', self.iost.get_contract_storage('c', 'k'))
+        self.assertEqual('1', self.iost.get_contract_storage('c', 'm', 'f'))
+
+    def test_failure_injection(self):
+        self.node.fail_next('GetChainInfo', code=grpc.StatusCode.UNAVAILABLE)
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.iost.get_chain_info()
+        self.assertEqual(grpc.StatusCode.UNAVAILABLE, cm.exception.code())
+        self.iost.get_chain_info()
+        self.assertEqual(2, self.node.calls['GetChainInfo'])
+
+    def test_subscribe(self):
+        events = []
+        subscribed = threading.Event()
+
+        def consume():
+            for event in self.iost.subscribe([Event.Topic.CONTRACT_RECEIPT], 'token.iost'):
+                events.append(event)
+                return
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        while not self.node._subscribers:
+            subscribed.wait(0.01)
+        self.iost.send_tx(self.iost.create_transfer_tx('iost', 'admin', 'bob', 1.0))
+        self.node.produce_block()
+        thread.join(5)
+        self.assertEqual('["iost", "admin", "bob", "1", ""]', events[0].data)
+
+
+if __name__ == '__main__':
+    main()